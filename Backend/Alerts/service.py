@@ -15,6 +15,7 @@ from .engines import (
     PriceAlertEngine, SchedulerEngine, PrioritizationEngine, ResponseBuilder
 )
 from .constants import AlertType, AlertUrgency
+from Backend.utils.timing import span
 
 
 class AlertsService:
@@ -50,51 +51,58 @@ class AlertsService:
         Public entry point to generate and fetch formatted alerts for a farmer.
         """
         # 1. Fetch Contexts
-        farmer = self.farmer_repo.get_farmer(farmer_id)
-        crops = self.crop_repo.get_active_crops(farmer_id)
-        weather = self.weather_engine.get_weather(farmer.lat, farmer.lon)
-        schemes = self.scheme_repo.list_schemes()
+        with span("alerts.context"):
+            farmer = self.farmer_repo.get_farmer(farmer_id)
+            crops = self.crop_repo.get_active_crops(farmer_id)
+        with span("alerts.weather"):
+            weather = self.weather_engine.get_weather(farmer.lat, farmer.lon)
+        with span("alerts.schemes"):
+            schemes = self.scheme_repo.list_schemes()
         
         # Last checked fallback: 24h ago
         check_ts = last_checked_at or (datetime.now() - timedelta(days=1))
         
         # 2. Generate Candidate Alerts
-        all_candidates: List[AlertRecord] = []
+        with span("alerts.generate"):
+            all_candidates: List[AlertRecord] = []
         
-        # A. Weather Alerts (Direct from Engine)
-        for w_warn in weather.alerts:
-            all_candidates.append(AlertRecord(
-                alertId=str(uuid.uuid4()),
-                farmerId=farmer_id,
-                alertType=AlertType.WEATHER,
-                title="Weather Warning",
-                message=w_warn,
-                urgency=AlertUrgency.CRITICAL,
-                scheduledAt=datetime.now()
-            ))
+            # A. Weather Alerts (Direct from Engine)
+            for w_warn in weather.alerts:
+                all_candidates.append(AlertRecord(
+                    alertId=str(uuid.uuid4()),
+                    farmerId=farmer_id,
+                    alertType=AlertType.WEATHER,
+                    title="Weather Warning",
+                    message=w_warn,
+                    urgency=AlertUrgency.CRITICAL,
+                    scheduledAt=datetime.now()
+                ))
             
-        # B. Irrigation Triggers
-        irrigation_alerts = self.irrigation_engine.generate(farmer, crops, weather)
-        all_candidates.extend(irrigation_alerts)
+            # B. Irrigation Triggers
+            irrigation_alerts = self.irrigation_engine.generate(farmer, crops, weather)
+            all_candidates.extend(irrigation_alerts)
         
-        # C. New Schemes
-        scheme_alerts = self.scheme_engine.generate(farmer, schemes, check_ts)
-        all_candidates.extend(scheme_alerts)
+            # C. New Schemes
+            scheme_alerts = self.scheme_engine.generate(farmer, schemes, check_ts)
+            all_candidates.extend(scheme_alerts)
         
-        # D. Price Fluctuations
-        price_alerts = self.price_engine.generate(farmer, crops, self.market_repo)
-        all_candidates.extend(price_alerts)
+            # D. Price Fluctuations
+            price_alerts = self.price_engine.generate(farmer, crops, self.market_repo)
+            all_candidates.extend(price_alerts)
         
         # 3. Schedule, Rank and Sort
-        scheduled_alerts = self.scheduler.schedule(all_candidates)
-        final_alerts = self.prioritizer.rank(scheduled_alerts)
+        with span("alerts.rank"):
+            scheduled_alerts = self.scheduler.schedule(all_candidates)
+            final_alerts = self.prioritizer.rank(scheduled_alerts)
         
         # 4. Persistence & Audit
-        self.alert_repo.save_alerts(final_alerts)
-        self.audit_repo.log(farmer_id, "alert_scan", {"hits": len(final_alerts)})
+        with span("alerts.persist"):
+            self.alert_repo.save_alerts(final_alerts)
+            self.audit_repo.log(farmer_id, "alert_scan", {"hits": len(final_alerts)})
         
         # 5. Build Final Response
-        return self.response_builder.build_output(farmer.language, final_alerts)
+        with span("alerts.build"):
+            return self.response_builder.build_output(farmer.language, final_alerts)
 
     def mark_alert_as_read(self, alert_id: str) -> bool:
         """Helper to manage UI read state"""
@@ -2,18 +2,29 @@
 Alert Repository for Collaborative Farming Reminders
 """
 
+from collections import OrderedDict
 from typing import List
 from ..models import ReminderRecord
 
+# Reminders are regenerated on every marketplace view and the service is
+# shared across requests: dedupe them and keep the newest only
+MAX_REMINDERS = 1000
+
 
 class AlertRepo:
-    def __init__(self):
-        self._reminders: List[ReminderRecord] = []
+    def __init__(self, db_client=None):
+        self.db_client = db_client
+        self._reminders: "OrderedDict[tuple, ReminderRecord]" = OrderedDict()
 
     def save_reminders(self, reminders: List[ReminderRecord]) -> None:
-        """Persist generated reminders"""
-        self._reminders.extend(reminders)
-        
+        """Persist generated reminders (a reminder saved again replaces itself)"""
+        for reminder in reminders:
+            key = (reminder.farmerId, reminder.title, reminder.reminderDateTime, reminder.relatedRentalId)
+            self._reminders.pop(key, None)
+            self._reminders[key] = reminder
+        while len(self._reminders) > MAX_REMINDERS:
+            self._reminders.popitem(last=False)
+
     def list_reminders(self, farmer_id: str) -> List[ReminderRecord]:
         """List reminders for a farmer"""
-        return [r for r in self._reminders if r.farmerId == farmer_id]
+        return [r for r in self._reminders.values() if r.farmerId == farmer_id]
@@ -7,6 +7,9 @@ import datetime
 
 
 class AuditRepo:
+    def __init__(self, db_client=None):
+        self.db_client = db_client
+    
     def log(self, farmer_id: str, action: str, meta: Dict[str, Any]) -> None:
         """Log system events for debugging and tracking"""
         # In a real app, this would write to MongoDB 'audit_logs'
@@ -19,7 +19,7 @@ class EquipmentRepo:
 
     def create_listing(self, listing: EquipmentListing) -> EquipmentListing:
         """Create a new equipment listing"""
-        if self.db_client:
+        if self.db_client is not None:
             try:
                 doc = listing.dict()
                 doc["_id"] = listing.listingId  # Use listingId as _id or generic
@@ -27,7 +27,7 @@ class EquipmentRepo:
                 doc["equipmentType"] = listing.equipmentType.value
                 doc["status"] = listing.status.value
                 
-                self.db_client.kisanmitra.equipment_listings.insert_one(doc)
+                self.db_client.equipment_listings.insert_one(doc)
                 return listing
             except Exception as e:
                 print(f"DB Error create_listing: {e}")
@@ -38,9 +38,9 @@ class EquipmentRepo:
 
     def get_listing(self, listing_id: str) -> Optional[EquipmentListing]:
         """Fetch a specific listing"""
-        if self.db_client:
+        if self.db_client is not None:
             try:
-                doc = self.db_client.kisanmitra.equipment_listings.find_one({"_id": listing_id})
+                doc = self.db_client.equipment_listings.find_one({"_id": listing_id})
                 if doc:
                     return self._map_doc_to_listing(doc)
             except Exception as e:
@@ -50,7 +50,7 @@ class EquipmentRepo:
 
     def search_listings(self, filters: Dict) -> List[EquipmentListing]:
         """Search and filter equipment listings"""
-        if self.db_client:
+        if self.db_client is not None:
             try:
                 query = {}
                 if "district" in filters:
@@ -60,7 +60,7 @@ class EquipmentRepo:
                 if "status" in filters:
                     query["status"] = filters["status"]
                 
-                cursor = self.db_client.kisanmitra.equipment_listings.find(query)
+                cursor = self.db_client.equipment_listings.find(query)
                 return [self._map_doc_to_listing(doc) for doc in cursor]
             except Exception as e:
                 print(f"DB Error search_listings: {e}")
@@ -81,9 +81,9 @@ class EquipmentRepo:
 
     def update_listing_status(self, listing_id: str, status: ListingStatus):
         """Update listing status"""
-        if self.db_client:
+        if self.db_client is not None:
             try:
-                self.db_client.kisanmitra.equipment_listings.update_one(
+                self.db_client.equipment_listings.update_one(
                     {"_id": listing_id},
                     {"$set": {"status": status.value, "updatedAt": datetime.now()}}
                 )
@@ -18,10 +18,10 @@ class FarmerRepo:
         """Fetch farmer profile or return mock fallback"""
         
         # Try Database
-        if self.db_client:
+        if self.db_client is not None:
             try:
                 if ObjectId.is_valid(farmer_id):
-                    doc = self.db_client.kisanmitra.farmers.find_one({"_id": ObjectId(farmer_id)})
+                    doc = self.db_client.farmers.find_one({"_id": ObjectId(farmer_id)})
                     if doc:
                         return self._map_doc_to_profile(doc)
             except Exception as e:
@@ -11,7 +11,8 @@ from ..constants import PoolStatus, PoolRequestType, PoolStage
 
 
 class LandPoolRepo:
-    def __init__(self):
+    def __init__(self, db_client=None):
+        self.db_client = db_client
         self._pool_requests: Dict[str, LandPoolRequest] = {}
         self.seed_mock_pool_requests_if_empty()
 
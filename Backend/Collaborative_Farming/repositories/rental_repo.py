@@ -11,7 +11,8 @@ from ..constants import RentalStatus, PaymentMethod
 
 
 class RentalRepo:
-    def __init__(self):
+    def __init__(self, db_client=None):
+        self.db_client = db_client
         self._rentals: Dict[str, RentalRequest] = {}
         self.seed_mock_rentals_if_empty()
 
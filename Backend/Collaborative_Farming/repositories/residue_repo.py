@@ -10,7 +10,8 @@ from ..models import ResidueListing
 
 
 class ResidueRepo:
-    def __init__(self):
+    def __init__(self, db_client=None):
+        self.db_client = db_client
         self._listings: Dict[str, ResidueListing] = {}
         self.seed_mock_residue_if_empty()
 
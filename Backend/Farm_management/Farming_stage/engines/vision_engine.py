@@ -9,13 +9,14 @@ import numpy as np
 from typing import Tuple, Optional
 from ..models import DiseaseDetectionResult
 
-# Optional imports for Keras model support
-try:
-    from tensorflow import keras
-    from PIL import Image
-    KERAS_AVAILABLE = True
-except ImportError:
-    KERAS_AVAILABLE = False
+from Backend.utils.lazy_import import lazy_import, is_available
+
+# Optional Keras model support. TensorFlow is only imported when the model
+# is loaded, so importing this module stays cheap.
+tf = lazy_import("tensorflow")
+Image = lazy_import("PIL.Image")
+KERAS_AVAILABLE = is_available("tensorflow") and is_available("PIL")
+if not KERAS_AVAILABLE:
     print("⚠️  TensorFlow/Keras not available. Install with: pip install tensorflow")
 
 
@@ -101,7 +102,7 @@ class VisionEngine:
             )
         
         try:
-            self.model = keras.models.load_model(self.model_path)
+            self.model = tf.keras.models.load_model(self.model_path)
             self.model_loaded = True
             print(f"✅ Disease detection model loaded from {self.model_path}")
             print(f"   Model input shape: {self.model.input_shape}")
@@ -112,6 +113,16 @@ class VisionEngine:
                 f"Error: {e}. Check TensorFlow/Keras compatibility and model file integrity."
             )
     
+    def warmup(self):
+        """
+        Run one prediction on a blank image so the first real request
+        does not pay for graph tracing
+        """
+        if not self.model_loaded or self.model is None:
+            return
+        height, width = self.model.input_shape[1:3]
+        self.model.predict(np.zeros((1, height, width, 3), dtype='float32'), verbose=0)
+    
     def detect_disease(self, image_path: str) -> DiseaseDetectionResult:
         """
         Detect disease from image file path
@@ -15,8 +15,9 @@ from ..constants import (
 class CropRepository:
     """Repository for crop encyclopedia operations"""
     
-    def __init__(self):
+    def __init__(self, db_client=None):
         """Initialize with mock crop data"""
+        self.db_client = db_client
         self._crops = self._create_mock_crops()
     
     def list_crops(self) -> List[CropRecord]:
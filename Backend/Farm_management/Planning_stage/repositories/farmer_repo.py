@@ -29,11 +29,11 @@ class FarmerRepository:
             FarmerProfile if found, None otherwise
         """
         # Try Database first
-        if self.db_client:
+        if self.db_client is not None:
             try:
                 # Handle ObjectId validation
                 if ObjectId.is_valid(farmer_id):
-                    doc = self.db_client.kisanmitra.farmers.find_one({"_id": ObjectId(farmer_id)})
+                    doc = self.db_client.farmers.find_one({"_id": ObjectId(farmer_id)})
                     if doc:
                         return self._map_doc_to_profile(doc)
             except Exception as e:
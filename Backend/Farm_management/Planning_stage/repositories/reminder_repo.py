@@ -3,16 +3,23 @@ Reminder Repository - handles reminder persistence
 In production: saves to MongoDB
 For hackathon: mock save operation
 """
+from collections import OrderedDict
 from typing import List
 from ..models import ReminderRecord
 
+# The repository lives as long as the shared PreSeedingService: keep the
+# newest reminders only
+MAX_REMINDERS = 1000
+
 
 class ReminderRepository:
     """Repository for reminder operations"""
     
-    def __init__(self):
+    def __init__(self, db_client=None):
         """Initialize reminder repository"""
-        self._reminders = []  # In-memory storage for demo
+        self.db_client = db_client
+        # In-memory storage for demo, keyed so a re-run doesn't duplicate reminders
+        self._reminders: "OrderedDict[tuple, ReminderRecord]" = OrderedDict()
     
     def save_reminders(self, reminders: List[ReminderRecord]) -> None:
         """
@@ -23,7 +30,12 @@ class ReminderRepository:
         """
         # In production: would save to MongoDB
         # For hackathon: store in memory and log
-        self._reminders.extend(reminders)
+        for reminder in reminders:
+            key = (reminder.farmer_id, reminder.scheme_key, reminder.reminder_datetime)
+            self._reminders.pop(key, None)
+            self._reminders[key] = reminder
+        while len(self._reminders) > MAX_REMINDERS:
+            self._reminders.popitem(last=False)
         
         print(f"\n✓ Saved {len(reminders)} reminder(s) to database (mock)")
         for reminder in reminders:
@@ -31,7 +43,7 @@ class ReminderRepository:
     
     def get_reminders_for_farmer(self, farmer_id: str) -> List[ReminderRecord]:
         """Get all reminders for a farmer"""
-        return [r for r in self._reminders if r.farmer_id == farmer_id]
+        return [r for r in self._reminders.values() if r.farmer_id == farmer_id]
     
     def clear_all(self) -> None:
         """Clear all reminders (for testing)"""
@@ -11,8 +11,9 @@ from ..models import SchemeRecord
 class SchemeRepository:
     """Repository for government scheme operations"""
     
-    def __init__(self):
+    def __init__(self, db_client=None):
         """Initialize with mock scheme data"""
+        self.db_client = db_client
         self._schemes = self._create_mock_schemes()
     
     def list_schemes(self) -> List[SchemeRecord]:
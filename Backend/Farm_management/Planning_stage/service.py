@@ -4,6 +4,7 @@ Single entry point for all pre-seeding planning operations
 """
 from datetime import datetime
 from typing import Optional
+from Backend.utils.timing import span
 
 from .models import PlanningRequest, PreSeedingOutput
 from .constants import Season, SEASON_MONTHS
@@ -72,7 +73,8 @@ class PreSeedingService:
         print("=" * 70)
         
         # Step 1: Get farmer profile
-        farmer = self.farmer_repo.get_farmer(request.farmer_id)
+        with span("planning.farmer"):
+            farmer = self.farmer_repo.get_farmer(request.farmer_id)
         if not farmer:
             raise ValueError(f"Farmer not found: {request.farmer_id}")
         
@@ -90,35 +92,38 @@ class PreSeedingService:
         
         # Step 3: Get weather context
         print(f"\n⛅ Fetching weather data...")
-        weather_context = self.weather_engine.get_context(
-            farmer.location.lat,
-            farmer.location.lon
-        )
+        with span("planning.weather"):
+            weather_context = self.weather_engine.get_context(
+                farmer.location.lat,
+                farmer.location.lon
+            )
         print(f"✓ Weather: {weather_context.temperature_c}°C, Humidity: {weather_context.humidity_pct}%")
         print(f"  - Rain forecast: {weather_context.rain_mm_next_7_days}mm in 7 days")
         
         # Step 4: Get crop recommendations
         print(f"\n🌱 Analyzing crop suitability...")
-        all_crops = self.crop_repo.list_crops()
-        crop_recommendations = self.crop_engine.recommend(
-            request=request,
-            farmer=farmer,
-            env=weather_context,
-            crops=all_crops,
-            season=season
-        )
+        with span("planning.crops"):
+            all_crops = self.crop_repo.list_crops()
+            crop_recommendations = self.crop_engine.recommend(
+                request=request,
+                farmer=farmer,
+                env=weather_context,
+                crops=all_crops,
+                season=season
+            )
         print(f"✓ Top {len(crop_recommendations)} crops recommended:")
         for i, crop in enumerate(crop_recommendations, 1):
             print(f"  {i}. {crop.crop_name} (Score: {crop.score:.1f})")
         
         # Step 5: Check scheme eligibility
         print(f"\n📋 Checking government scheme eligibility...")
-        all_schemes = self.scheme_repo.list_schemes()
-        scheme_results = self.scheme_engine.recommend_schemes(
-            farmer=farmer,
-            recommended_crops=crop_recommendations,
-            all_schemes=all_schemes
-        )
+        with span("planning.schemes"):
+            all_schemes = self.scheme_repo.list_schemes()
+            scheme_results = self.scheme_engine.recommend_schemes(
+                farmer=farmer,
+                recommended_crops=crop_recommendations,
+                all_schemes=all_schemes
+            )
         
         eligible_count = len([s for s in scheme_results if s.eligible])
         print(f"✓ Eligible for {eligible_count} schemes:")
@@ -131,25 +136,27 @@ class PreSeedingService:
         
         # Step 6: Generate reminders
         print(f"\n⏰ Generating scheme deadline reminders...")
-        reminders = self.reminder_engine.generate(
-            scheme_results=scheme_results,
-            farmer=farmer
-        )
-        print(f"✓ Created {len(reminders)} reminder(s)")
+        with span("planning.reminders"):
+            reminders = self.reminder_engine.generate(
+                scheme_results=scheme_results,
+                farmer=farmer
+            )
+            print(f"✓ Created {len(reminders)} reminder(s)")
         
-        # Step 7: Save reminders
-        if reminders:
-            self.reminder_repo.save_reminders(reminders)
+            # Step 7: Save reminders
+            if reminders:
+                self.reminder_repo.save_reminders(reminders)
         
         # Step 8: Build final output
         print(f"\n📄 Building final output...")
-        output = self.response_builder.build_output(
-            farmer=farmer,
-            weather=weather_context,
-            crops=crop_recommendations,
-            schemes=scheme_results,
-            reminders=reminders
-        )
+        with span("planning.build"):
+            output = self.response_builder.build_output(
+                farmer=farmer,
+                weather=weather_context,
+                crops=crop_recommendations,
+                schemes=scheme_results,
+                reminders=reminders
+            )
         
         print(f"✓ Output ready - Urgency: {output.urgency_level.value.upper()}")
         print("=" * 70)
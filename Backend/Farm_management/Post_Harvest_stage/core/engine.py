@@ -6,6 +6,7 @@ Orchestrates all decision logic
 from dataclasses import dataclass
 from typing import List
 from Backend.Farm_management.Post_Harvest_stage.core.context import FarmerContext
+from Backend.utils.timing import span
 from Backend.Farm_management.Post_Harvest_stage.storage import (
     SpoilageRiskCalculator,
     StorageMatcher,
@@ -86,21 +87,23 @@ class PostHarvestDecisionEngine:
         
         # 2. Forecast prices for best market (initially without storage cost)
         # First, select best market at current prices to know where to sell
-        market_recommendation = self.market_selector.select_best_market(
-            farmer_location=context.farmer_location,
-            crop_name=context.crop_name,
-            quantity_kg=context.quantity_kg,
-            storage_cost=0  # Initial assessment without storage
-        )
+        with span("post_harvest.market"):
+            market_recommendation = self.market_selector.select_best_market(
+                farmer_location=context.farmer_location,
+                crop_name=context.crop_name,
+                quantity_kg=context.quantity_kg,
+                storage_cost=0  # Initial assessment without storage
+            )
         
-        best_market = market_recommendation.best_market
+            best_market = market_recommendation.best_market
         
         # Get price forecast for the best market
-        price_forecast = self.price_forecaster.forecast_prices(
-            crop_name=context.crop_name,
-            mandi_name=best_market.mandi_name,
-            days_ahead=14
-        )
+        with span("post_harvest.forecast"):
+            price_forecast = self.price_forecaster.forecast_prices(
+                crop_name=context.crop_name,
+                mandi_name=best_market.mandi_name,
+                days_ahead=14
+            )
         
         # 3. Determine optimal storage type based on crop
         # High spoilage crops need cold storage
@@ -110,20 +113,22 @@ class PostHarvestDecisionEngine:
             storage_type = StorageType.OPEN
         
         # 4. Calculate spoilage risk for waiting until peak price
-        spoilage_assessment = self.spoilage_calculator.calculate_risk(
-            crop_name=context.crop_name,
-            days_to_sell=price_forecast.peak_day,
-            storage_type=storage_type
-        )
+        with span("post_harvest.spoilage"):
+            spoilage_assessment = self.spoilage_calculator.calculate_risk(
+                crop_name=context.crop_name,
+                days_to_sell=price_forecast.peak_day,
+                storage_type=storage_type
+            )
         
         # 5. Find available storage
-        storage_option = self.storage_matcher.get_best_storage(
-            farmer_location=context.farmer_location,
-            crop_name=context.crop_name,
-            quantity_kg=context.quantity_kg,
-            storage_type=storage_type,
-            days_needed=price_forecast.peak_day
-        )
+        with span("post_harvest.storage"):
+            storage_option = self.storage_matcher.get_best_storage(
+                farmer_location=context.farmer_location,
+                crop_name=context.crop_name,
+                quantity_kg=context.quantity_kg,
+                storage_type=storage_type,
+                days_needed=price_forecast.peak_day
+            )
         
         # 6. Make storage decision
         price_forecast_data = PriceForecastData(
@@ -133,28 +138,30 @@ class PostHarvestDecisionEngine:
             trend=price_forecast.trend
         )
         
-        storage_decision = self.storage_decision_maker.decide(
-            quantity_kg=context.quantity_kg,
-            current_price=price_forecast.current_price,
-            price_forecast=price_forecast_data,
-            spoilage_assessment=spoilage_assessment,
-            storage_option=storage_option,
-            transport_cost=best_market.transport_cost
-        )
+        with span("post_harvest.decision"):
+            storage_decision = self.storage_decision_maker.decide(
+                quantity_kg=context.quantity_kg,
+                current_price=price_forecast.current_price,
+                price_forecast=price_forecast_data,
+                spoilage_assessment=spoilage_assessment,
+                storage_option=storage_option,
+                transport_cost=best_market.transport_cost
+            )
         
         # 7. Re-select market with storage cost if storing
         storage_cost = 0.0
-        if storage_decision.decision == StorageDecision.STORE_AND_SELL:
-            storage_cost = storage_option.total_cost_for_period if storage_option else 0
+        with span("post_harvest.market_rescore"):
+            if storage_decision.decision == StorageDecision.STORE_AND_SELL:
+                storage_cost = storage_option.total_cost_for_period if storage_option else 0
             
-            # Re-evaluate market selection with storage cost
-            market_recommendation = self.market_selector.select_best_market(
-                farmer_location=context.farmer_location,
-                crop_name=context.crop_name,
-                quantity_kg=context.quantity_kg,
-                storage_cost=storage_cost
-            )
-            best_market = market_recommendation.best_market
+                # Re-evaluate market selection with storage cost
+                market_recommendation = self.market_selector.select_best_market(
+                    farmer_location=context.farmer_location,
+                    crop_name=context.crop_name,
+                    quantity_kg=context.quantity_kg,
+                    storage_cost=storage_cost
+                )
+                best_market = market_recommendation.best_market
         
         # 8. Build decision result
         alternatives = [
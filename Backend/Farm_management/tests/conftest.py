@@ -0,0 +1,25 @@
+"""
+Pytest setup for the backend unit tests.
+Run from the repository root: python -m pytest Backend/Farm_management/tests
+"""
+
+import os
+import sys
+
+import pytest
+
+# Tests import the backend as the ``Backend`` package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+# Interactive menu-driven CLI (reads stdin), not a pytest module
+collect_ignore = ["test_manager.py"]
+
+
+@pytest.fixture
+def voice_config(monkeypatch):
+    """
+    Lets the voice agent's get_config() load without a real LLM key (it
+    refuses to start without one); the tests never call the LLM
+    """
+    if not (os.getenv("GEMINI_API_KEY") or os.getenv("GROQ_API_KEY")):
+        monkeypatch.setenv("GROQ_API_KEY", "test-key")
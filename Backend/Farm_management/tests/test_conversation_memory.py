@@ -0,0 +1,85 @@
+"""
+Per-farmer conversation memory: compaction thresholds and the cost of the
+per-batch check (Voice_agent/retrieval/conversation_memory.py)
+"""
+
+import time
+
+from Backend.Voice_agent.retrieval.conversation_memory import ConversationMemoryIndex
+
+
+def _matches(meta, where):
+    if "$and" in where:
+        return all(_matches(meta, clause) for clause in where["$and"])
+    (field, expected), = where.items()
+    if isinstance(expected, dict):
+        return meta.get(field, 0.0) < expected["$lt"]
+    return meta.get(field) == expected
+
+
+class FakeCollection:
+    def __init__(self):
+        self.docs = {}
+        self.gets = []
+
+    def upsert(self, documents, metadatas, ids):
+        for doc_id, document, meta in zip(ids, documents, metadatas):
+            self.docs[doc_id] = (document, meta)
+
+    def get(self, where, include):
+        self.gets.append(tuple(include))
+        ids = [doc_id for doc_id, (_, meta) in self.docs.items() if _matches(meta, where)]
+        result = {"ids": ids}
+        if "metadatas" in include:
+            result["metadatas"] = [self.docs[doc_id][1] for doc_id in ids]
+        return result
+
+    def delete(self, ids):
+        for doc_id in ids:
+            del self.docs[doc_id]
+
+
+class FakeClient:
+    def __init__(self):
+        self.collections = {}
+
+    def get_or_create_collection(self, name, embedding_function):
+        return self.collections.setdefault(name, FakeCollection())
+
+
+def make_turns(farmer_id, count, start=0, ts=None):
+    now = time.time()
+    return [
+        {"farmer_id": farmer_id, "session_id": "s", "turn_id": start + i,
+         "timestamp": ts if ts is not None else now + start + i,
+         "user_input_english": f"question {start + i}", "intent": "market_price"}
+        for i in range(count)
+    ]
+
+
+def raw_turns(collection):
+    return [meta for _, meta in collection.docs.values() if meta["type"] == "conversation"]
+
+
+def test_compaction_waits_for_a_full_batch_over_the_limit():
+    index = ConversationMemoryIndex(FakeClient(), None, shards=1, max_turns=20, compact_batch=10)
+    index.add_turns(make_turns("F001", 30))
+    collection = index._collection("F001")
+    assert len(raw_turns(collection)) == 30 and index.compactions == 0
+    # The per-batch check never loads turn metadata
+    assert all("metadatas" not in include for include in collection.gets)
+
+    index.add_turns(make_turns("F001", 1, start=30))
+    assert len(raw_turns(collection)) == 20
+    assert index.compacted_turns == 11
+    # Oldest turns went into the summaries
+    assert sorted(int(meta["id"]) for meta in raw_turns(collection)) == list(range(11, 31))
+
+
+def test_expired_turns_are_compacted():
+    index = ConversationMemoryIndex(FakeClient(), None, shards=1, max_turns=200, compact_batch=50, max_age_days=90)
+    old = time.time() - 100 * 86400
+    index.add_turns(make_turns("F001", 12, ts=old) + make_turns("F001", 5, start=12))
+    collection = index._collection("F001")
+    assert len(raw_turns(collection)) == 5
+    assert index.compacted_turns == 12
@@ -0,0 +1,56 @@
+"""
+Dashboard stats: a partial response (failed or slow section) is not cached
+(api/routers/dashboard.py, api/cache.py)
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from Backend.api.cache import ResponseCache, ResponseCacheMiddleware
+from Backend.api.config import settings
+from Backend.api.dependencies import get_db_client
+from Backend.api.routers import dashboard
+
+AUTH = {"Authorization": "Bearer demo"}
+URL = settings.API_V1_STR + "/dashboard/stats"
+
+
+def make_client():
+    cache = ResponseCache(max_entries=16)
+    app = FastAPI()
+    app.add_middleware(ResponseCacheMiddleware, cache=cache)
+    app.include_router(dashboard.router, prefix=settings.API_V1_STR)
+    app.dependency_overrides[get_db_client] = lambda: None
+    return TestClient(app, headers=AUTH), cache
+
+
+def test_partial_stats_are_not_cached(monkeypatch):
+    calls = {"n": 0}
+
+    def failing_weather(db, user):
+        calls["n"] += 1
+        raise RuntimeError("weather api down")
+
+    monkeypatch.setattr(dashboard, "_current_weather", failing_weather)
+    client, cache = make_client()
+
+    for _ in range(2):
+        response = client.get(URL)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["weather"] is None and body["errors"] == {"weather": "weather api down"}
+        assert response.headers["Cache-Control"] == "no-store"
+        assert "X-Cache" not in response.headers
+    assert calls["n"] == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_complete_stats_are_cached(monkeypatch):
+    monkeypatch.setattr(dashboard, "_current_weather", lambda db, user: {"temp": 30})
+    client, cache = make_client()
+
+    first = client.get(URL)
+    assert first.headers["X-Cache"] == "MISS"
+    assert "errors" not in first.json()
+    assert client.get(URL).headers["X-Cache"] == "HIT"
+    assert cache.stats()["entries"] == 1
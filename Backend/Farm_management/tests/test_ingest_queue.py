@@ -0,0 +1,121 @@
+"""
+Vector ingest queue: drop-oldest, flush, close and failure counting
+(Voice_agent/retrieval/ingest_queue.py)
+"""
+
+import threading
+import time
+
+from Backend.Voice_agent.retrieval.ingest_queue import VectorIngestQueue
+
+
+class FakeStore:
+    """Records batches; blocks each write until ``release`` is set"""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+        self.release = threading.Event()
+        self.release.set()
+
+    def ingest_conversation_turns(self, batch):
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError("chroma down")
+        self.batches.append([turn["id"] for turn in batch])
+
+
+def make_queue(store, **options):
+    factory_threads = []
+
+    def factory():
+        factory_threads.append(threading.current_thread().name)
+        return store
+
+    return VectorIngestQueue(factory, **options), factory_threads
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+def test_full_queue_drops_oldest_pending_turn():
+    store = FakeStore()
+    store.release.clear()
+    queue, _ = make_queue(store, max_pending=2, batch_size=1, max_wait_s=0)
+
+    queue.put({"id": 1})
+    wait_for(lambda: queue.stats()["in_flight"] == 1)  # worker is stuck writing turn 1
+    for turn_id in (2, 3, 4):
+        assert queue.put({"id": turn_id})
+
+    stats = queue.stats()
+    assert stats["pending"] == 2
+    assert stats["dropped"] == 1
+    assert stats["high_water"] == 2
+
+    store.release.set()
+    assert queue.flush(timeout=5)
+    assert store.batches == [[1], [3], [4]]
+    assert queue.stats()["written"] == 3
+    queue.close()
+
+
+def test_flush_waits_for_partial_batch_and_store_loads_on_worker():
+    store = FakeStore()
+    queue, factory_threads = make_queue(store, batch_size=10, max_wait_s=30)
+    for turn_id in range(3):
+        queue.put({"id": turn_id})
+
+    # A partial batch would wait max_wait_s for more turns; flush cuts it short
+    started = time.monotonic()
+    assert queue.flush(timeout=5)
+    assert time.monotonic() - started < 5
+    assert store.batches == [[0, 1, 2]]
+    assert factory_threads == ["vector-ingest"]
+
+    stats = queue.stats()
+    assert stats["pending"] == 0 and stats["in_flight"] == 0
+    assert stats["batches"] == 1 and stats["avg_batch_size"] == 3.0
+    queue.close()
+
+
+def test_flush_times_out_while_write_is_stuck():
+    store = FakeStore()
+    store.release.clear()
+    queue, _ = make_queue(store, batch_size=1, max_wait_s=0)
+    queue.put({"id": 1})
+    assert not queue.flush(timeout=0.05)
+    store.release.set()
+    assert queue.flush(timeout=5)
+    queue.close()
+
+
+def test_close_drains_then_refuses_puts():
+    store = FakeStore()
+    queue, _ = make_queue(store, batch_size=2, max_wait_s=30)
+    for turn_id in range(5):
+        queue.put({"id": turn_id})
+
+    assert queue.close(timeout=5)
+    assert sum(len(batch) for batch in store.batches) == 5
+    assert not queue.put({"id": 99})
+    stats = queue.stats()
+    assert stats["closed"] and stats["enqueued"] == 5 and stats["written"] == 5
+
+
+def test_failed_batches_are_counted_not_retried():
+    store = FakeStore(fail=True)
+    queue, _ = make_queue(store, batch_size=2, max_wait_s=0)
+    for turn_id in range(4):
+        queue.put({"id": turn_id})
+
+    assert queue.flush(timeout=5)
+    stats = queue.stats()
+    assert stats["failed"] == 4
+    assert stats["written"] == 0
+    assert stats["batches"] >= 2
+    queue.close()
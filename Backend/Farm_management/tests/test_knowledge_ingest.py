@@ -0,0 +1,50 @@
+"""
+Mongo master collections -> knowledge index
+(Voice_agent/retrieval/knowledge_ingest.py)
+"""
+
+from Backend.Voice_agent.retrieval.knowledge_ingest import KNOWLEDGE_SPECS, ingest_collection
+
+CROPS = next(spec for spec in KNOWLEDGE_SPECS if spec.collection == "crops_master")
+
+
+class FakeCursorSource:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, query, batch_size=None):
+        return iter([dict(doc) for doc in self.docs])
+
+
+class FakeCollection:
+    def __init__(self):
+        self.deleted = []
+
+    def get(self, where, include):
+        return {"ids": [], "metadatas": []}
+
+    def delete(self, ids):
+        self.deleted.extend(ids)
+
+
+class FakeStore:
+    def __init__(self):
+        self.collection = FakeCollection()
+        self.added = []
+
+    def add_texts(self, texts, metadatas, ids):
+        self.added.extend(ids)
+
+
+def test_malformed_document_is_skipped_not_fatal():
+    db = {"crops_master": FakeCursorSource([
+        {"cropKey": "wheat", "localNames": {"en": "Wheat"}, "season": "rabi"},
+        {"cropKey": "onion", "localNames": "not-a-dict"},  # to_text/to_data raise
+        {"cropKey": "rice", "localNames": {"en": "Rice"}, "season": "kharif"},
+    ])}
+    store = FakeStore()
+    counts = ingest_collection(store, db, CROPS, batch_size=2, progress=None)
+
+    assert store.added == ["crop_wheat", "crop_rice"]
+    assert counts["scanned"] == 3 and counts["embedded"] == 2
+    assert counts["skipped"] == 1 and counts["failed"] == 0
@@ -0,0 +1,120 @@
+"""
+Keyset pagination: cursor round-trips and complete walks with null sort keys
+(api/pagination.py)
+"""
+
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from Backend.api.pagination import PageParams, decode_cursor, encode_cursor, paginate, parse_fields
+
+
+def _matches(doc, query):
+    for key, cond in query.items():
+        if key == "$and":
+            if not all(_matches(doc, q) for q in cond):
+                return False
+        elif key == "$or":
+            if not any(_matches(doc, q) for q in cond):
+                return False
+        else:
+            value = doc.get(key)
+            if isinstance(cond, dict):
+                for op, operand in cond.items():
+                    # Like MongoDB, range operators never match null
+                    if op == "$gt" and not (value is not None and value > operand):
+                        return False
+                    if op == "$lt" and not (value is not None and value < operand):
+                        return False
+                    if op == "$ne" and value == operand:
+                        return False
+            elif value != cond:
+                return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, spec):
+        for field, direction in reversed(spec):
+            # MongoDB orders null/missing before any value
+            self.docs.sort(key=lambda d: (d.get(field) is not None, d.get(field) or 0), reverse=direction < 0)
+        return self
+
+    def limit(self, n):
+        return iter(self.docs[:n])
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, query, projection=None):
+        found = [dict(d) for d in self.docs if _matches(d, query)]
+        if projection:
+            found = [{k: v for k, v in d.items() if k in projection or k == "_id"} for d in found]
+        return FakeCursor(found)
+
+
+def walk(collection, sort_field, direction, limit=2):
+    ids, cursor = [], None
+    for _ in range(50):
+        docs, cursor = paginate(collection, {}, PageParams(limit=limit, cursor=cursor, fields=None),
+                                sort_field=sort_field, direction=direction)
+        ids += [d["_id"] for d in docs]
+        if cursor is None:
+            return ids
+    raise AssertionError("pagination did not terminate")
+
+
+@pytest.fixture
+def collection():
+    docs = [{"_id": i, "price": price} for i, price in enumerate([30, None, 10, 30, None, 20, 10])]
+    docs.append({"_id": 7})  # sort key missing entirely
+    return FakeCollection(docs)
+
+
+def test_cursor_round_trip():
+    oid = ObjectId()
+    when = datetime(2026, 1, 2, 3, 4, 5)
+    assert decode_cursor(encode_cursor(when, oid)) == (when, oid)
+    assert decode_cursor(encode_cursor(None, 5)) == (None, 5)
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30", ""])
+def test_invalid_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.parametrize("direction", [1, -1])
+def test_walk_covers_every_document_once(collection, direction):
+    ids = walk(collection, "price", direction)
+    assert sorted(ids) == list(range(8))
+    expected = [d["_id"] for d in FakeCursor([dict(d) for d in collection.docs])
+                .sort([("price", direction), ("_id", direction)]).docs]
+    assert ids == expected
+
+
+def test_walk_by_id(collection):
+    assert walk(collection, "_id", 1, limit=3) == list(range(8))
+
+
+def test_projection_keeps_sort_key(collection):
+    docs, cursor = paginate(collection, {}, PageParams(limit=3, cursor=None, fields=["name"]), sort_field="price")
+    assert all(set(d) <= {"_id", "price", "name"} for d in docs)
+    assert cursor is not None
+
+
+def test_parse_fields_rejects_operators():
+    assert parse_fields("a, b.c") == ["a", "b.c"]
+    with pytest.raises(HTTPException):
+        parse_fields("$where")
+    with pytest.raises(HTTPException):
+        parse_fields("a..b")
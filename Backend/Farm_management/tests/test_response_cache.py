@@ -0,0 +1,129 @@
+"""
+Response cache: ETag / 304, credential scoping and invalidation (api/cache.py)
+"""
+
+import asyncio
+
+import httpx
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from Backend.api.cache import ResponseCache, ResponseCacheMiddleware, CacheRule, etag_matches
+from Backend.api.config import settings
+from Backend.api.dependencies import get_current_user
+
+
+AUTH = {"Authorization": "Bearer demo"}
+
+
+def make_app():
+    cache = ResponseCache(max_entries=16)
+    calls = {"n": 0}
+    app = FastAPI()
+    app.add_middleware(ResponseCacheMiddleware, cache=cache,
+                       rules={"/dashboard/stats": CacheRule(ttl_s=60, tags=("dashboard",))})
+
+    @app.get(settings.API_V1_STR + "/dashboard/stats")
+    async def stats(user=Depends(get_current_user)):
+        calls["n"] += 1
+        await asyncio.sleep(0.02)
+        return {"farmer": user["id"], "n": calls["n"]}
+
+    return app, cache, calls
+
+
+def test_etag_weak_comparison():
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"x", "abc"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches(None, '"abc"')
+    assert not etag_matches('"other"', '"abc"')
+
+
+def test_hit_and_not_modified():
+    app, cache, calls = make_app()
+    client = TestClient(app, headers=AUTH)
+    url = settings.API_V1_STR + "/dashboard/stats"
+
+    first = client.get(url)
+    assert first.headers["X-Cache"] == "MISS"
+    second = client.get(url)
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == first.json()
+    assert calls["n"] == 1
+
+    revalidated = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert cache.not_modified == 1
+
+
+def test_no_cache_request_refreshes():
+    app, _, calls = make_app()
+    client = TestClient(app, headers=AUTH)
+    url = settings.API_V1_STR + "/dashboard/stats"
+    client.get(url)
+    refreshed = client.get(url, headers={"Cache-Control": "no-cache"})
+    assert refreshed.headers["X-Cache"] == "MISS"
+    assert calls["n"] == 2
+
+
+def test_credentials_get_separate_entries():
+    app, _, calls = make_app()
+    client = TestClient(app, headers=AUTH)
+    url = settings.API_V1_STR + "/dashboard/stats"
+    client.get(url, headers={"Authorization": "Bearer a"})
+    other = client.get(url, headers={"Authorization": "Bearer b"})
+    assert other.headers["X-Cache"] == "MISS"
+    assert client.get(url, headers={"Authorization": "Bearer a"}).headers["X-Cache"] == "HIT"
+    assert calls["n"] == 2
+
+
+def test_invalidate_by_tag_and_farmer():
+    app, cache, calls = make_app()
+    client = TestClient(app, headers=AUTH)
+    url = settings.API_V1_STR + "/dashboard/stats"
+    client.get(url)
+
+    assert cache.invalidate("dashboard", farmer_id="F999") == 0
+    assert cache.invalidate("market") == 0
+    # The farmer comes from the auth dependency that ran inside the route
+    assert cache.invalidate("dashboard", farmer_id="F001") == 1
+    assert client.get(url).headers["X-Cache"] == "MISS"
+    assert calls["n"] == 2
+
+
+def test_dependency_override_sets_farmer():
+    app, cache, _ = make_app()
+    app.dependency_overrides[get_current_user] = lambda: {"id": "F042"}
+    client = TestClient(app, headers=AUTH)
+    url = settings.API_V1_STR + "/dashboard/stats"
+    assert client.get(url).json()["farmer"] == "F042"
+    # The override doesn't record a user: its entry counts as any farmer's
+    assert cache.invalidate("dashboard", farmer_id="F042") == 1
+
+
+def test_requests_without_credentials_are_not_cached():
+    app, cache, calls = make_app()
+    client = TestClient(app)
+    url = settings.API_V1_STR + "/dashboard/stats"
+    for _ in range(2):
+        response = client.get(url)
+        assert "X-Cache" not in response.headers
+    assert calls["n"] == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_concurrent_misses_share_one_computation():
+    app, cache, calls = make_app()
+    url = settings.API_V1_STR + "/dashboard/stats"
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test", headers=AUTH) as client:
+            return await asyncio.gather(*(client.get(url) for _ in range(4)))
+
+    responses = asyncio.run(run())
+    assert calls["n"] == 1
+    assert sorted(r.headers["X-Cache"] for r in responses) == ["HIT", "HIT", "HIT", "MISS"]
+    assert len({r.content for r in responses}) == 1
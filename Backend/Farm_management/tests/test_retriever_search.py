@@ -0,0 +1,82 @@
+"""
+Retriever vector searches: one embedding batch per turn, repeated
+queries from the embedding cache (retrieval/retriever.py, vector_store.py)
+"""
+
+import json
+import threading
+from collections import OrderedDict
+
+import pytest
+
+from Backend.Voice_agent.core.intent import Intent
+from Backend.Voice_agent.retrieval.retriever import Retriever
+from Backend.Voice_agent.retrieval.vector_store import VectorStore
+
+pytestmark = pytest.mark.usefixtures("voice_config")
+
+
+class CountingEmbedding:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class FakeCollection:
+    """Answers every query with one document of the requested type"""
+
+    def __init__(self):
+        self.queries = []
+
+    def query(self, query_embeddings, n_results, where=None):
+        self.queries.append((len(query_embeddings), where))
+        doc_type = (where or {}).get("type", "any")
+        meta = {"type": doc_type, "id": doc_type, "name": doc_type, "data_json": json.dumps({"name": doc_type})}
+        return {
+            "documents": [[f"{doc_type} doc"] for _ in query_embeddings],
+            "metadatas": [[meta] for _ in query_embeddings],
+            "distances": [[0.1] for _ in query_embeddings],
+        }
+
+
+def make_store():
+    # Skip __init__ (it opens a Chroma client); set what search_many needs
+    store = VectorStore.__new__(VectorStore)
+    store.embedding_fn = CountingEmbedding()
+    store.embedding_cache_size = 64
+    store._embeddings = OrderedDict()
+    store._embed_lock = threading.Lock()
+    store.embedding_hits = store.embedding_misses = store.embedding_batches = 0
+    store.collection = FakeCollection()
+    return store
+
+
+def test_one_batch_per_turn():
+    store = make_store()
+    retriever = Retriever(vector_store=store)
+    for turn, query in enumerate(["cost of fertilizer this season", "profit from onion"], start=1):
+        docs = retriever.retrieve(Intent.COST_ANALYSIS, query)
+        assert [d["type"] for d in docs] == ["financial_info"]
+        assert store.embedding_stats()["batches"] == turn
+
+    # A repeated query is served from the embedding cache
+    retriever.retrieve(Intent.COST_ANALYSIS, "profit from onion")
+    assert store.embedding_stats()["batches"] == 2
+
+
+def test_no_vector_store_returns_no_docs():
+    retriever = Retriever(vector_store=make_store())
+    retriever.vector_store = None  # chromadb unavailable
+    assert retriever.retrieve(Intent.GOVERNMENT_SCHEME, "pm kisan") == []
+
+
+def test_scheme_turn_queries_with_its_filter():
+    store = make_store()
+    retriever = Retriever(vector_store=store)
+    docs = retriever.retrieve(Intent.GOVERNMENT_SCHEME, "pm kisan eligibility")
+    assert [d["type"] for d in docs] == ["scheme_info"]
+    assert store.collection.queries == [(1, {"type": "scheme_info"})]
+    assert store.embedding_fn.calls == [["pm kisan eligibility"]]
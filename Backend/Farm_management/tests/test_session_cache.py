@@ -0,0 +1,243 @@
+"""
+Live session contexts: LRU / idle-TTL / byte eviction with write-back
+(Voice_agent/core/session_cache.py), the agent's cache-first lookup and
+the bounded in-memory session memory fallback
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from Backend.Voice_agent.core import session_cache
+from Backend.Voice_agent.core.agent import VoiceAgent
+from Backend.Voice_agent.core.context import ConversationContext
+from Backend.Voice_agent.core.session_cache import SessionContextCache, estimate_size
+from Backend.Voice_agent.memory.session_memory import SessionMemory
+
+
+def make_context(session_id, farmer_id="F001"):
+    return ConversationContext(farmer_id=farmer_id, session_id=session_id)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_evicts_least_recently_used_and_writes_it_back():
+    saved = []
+    cache = SessionContextCache(max_sessions=2, idle_ttl_s=0, max_bytes=0, write_back=saved.append)
+    a, b, c = make_context("a"), make_context("b"), make_context("c")
+    cache.put(a)
+    cache.put(b)
+    assert cache.get("a") is a  # b is now least recently used
+    cache.put(c)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is a and cache.get("c") is c
+    assert saved == [b]
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["write_backs"] == 1
+    assert stats["hits"] == 3 and stats["misses"] == 1
+
+
+def test_idle_contexts_expire(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(session_cache.time, "monotonic", clock)
+    saved = []
+    cache = SessionContextCache(max_sessions=10, idle_ttl_s=60, max_bytes=0, write_back=saved.append)
+    old, fresh = make_context("old"), make_context("fresh")
+    cache.put(old)
+    clock.now += 45
+    cache.put(fresh)
+    clock.now += 30  # old idle 75 s, fresh 30 s
+
+    assert cache.get("old") is None
+    assert cache.get("fresh") is fresh
+    clock.now += 61
+    assert cache.sweep() == 1
+    assert len(cache) == 0
+    assert saved == [old, fresh]
+    assert cache.stats()["expirations"] == 2
+
+
+def test_byte_limit_keeps_the_context_just_used():
+    contexts = [make_context(f"s{i}") for i in range(4)]
+    size = estimate_size(contexts[0])
+    cache = SessionContextCache(max_sessions=100, idle_ttl_s=0, max_bytes=size * 2 + size // 2)
+    for context in contexts:
+        cache.put(context)
+    assert len(cache) == 2
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+    # A single context over the limit is still kept
+    big = make_context("big")
+    big.set_context_variable("notes", "x" * (size * 4))
+    cache.put(big)
+    assert len(cache) == 1 and cache.get("big") is big
+
+
+def test_put_re_estimates_a_grown_context():
+    cache = SessionContextCache(max_sessions=10, idle_ttl_s=0, max_bytes=0)
+    context = make_context("s")
+    cache.put(context)
+    before = cache.stats()["bytes"]
+    context.set_context_variable("notes", "y" * 500)
+    cache.put(context)
+    assert cache.stats()["bytes"] == estimate_size(context) > before
+
+
+def test_write_back_only_for_unsaved_changes():
+    saved = []
+    cache = SessionContextCache(max_sessions=1, idle_ttl_s=0, max_bytes=0, write_back=saved.append)
+    clean, dirty = make_context("clean"), make_context("dirty")
+
+    cache.put(clean)
+    cache.mark_saved(clean)
+    cache.put(dirty)  # evicts clean: already saved, no write
+    assert saved == []
+
+    cache.mark_saved(dirty)
+    dirty.set_context_variable("crop", "onion")
+    dirty.last_updated += timedelta(seconds=1)  # strictly after the save
+    cache.put(make_context("next"))
+    assert saved == [dirty]
+
+
+def test_failed_write_back_is_counted():
+    def fail(context):
+        raise RuntimeError("mongo down")
+
+    cache = SessionContextCache(max_sessions=1, idle_ttl_s=0, max_bytes=0, write_back=fail)
+    cache.put(make_context("a"))
+    cache.put(make_context("b"))
+    assert cache.stats()["write_back_failures"] == 1
+
+
+def test_pop_drops_without_write_back():
+    saved = []
+    cache = SessionContextCache(max_sessions=10, idle_ttl_s=0, max_bytes=0, write_back=saved.append)
+    context = make_context("s")
+    cache.put(context)
+    assert cache.pop("s") is context
+    assert cache.pop("s") is None
+    assert cache.stats()["bytes"] == 0 and saved == []
+
+
+class RecordingMemory:
+    def __init__(self, stored=None):
+        self.stored = stored or {}
+        self.loads = []
+        self.saves = []
+
+    def load_context(self, session_id):
+        self.loads.append(session_id)
+        return self.stored.get(session_id)
+
+    def save_context(self, context):
+        self.saves.append(context.session_id)
+        self.stored[context.session_id] = context
+
+
+def make_agent(memory, max_sessions=10):
+    cache = SessionContextCache(max_sessions=max_sessions, idle_ttl_s=0, max_bytes=0, write_back=memory.save_context)
+    agent = SimpleNamespace(session_memory=memory, _active_contexts=cache, db_client=None)
+    agent._locate_farmer = lambda context: VoiceAgent._locate_farmer(agent, context)
+    return agent
+
+
+def test_agent_uses_live_context_before_session_memory():
+    stored = make_context("s1")
+    memory = RecordingMemory({"s1": stored})
+    agent = make_agent(memory)
+
+    first = VoiceAgent._get_or_create_context(agent, "F001", "s1")
+    assert first is stored and memory.loads == ["s1"]
+
+    # Next turn: served from the cache, even though memory would answer
+    first.set_context_variable("crop", "wheat")
+    assert VoiceAgent._get_or_create_context(agent, "F001", "s1") is first
+    assert memory.loads == ["s1"]
+
+
+def test_agent_marks_loaded_context_saved():
+    memory = RecordingMemory({"s1": make_context("s1")})
+    agent = make_agent(memory, max_sessions=1)
+    VoiceAgent._get_or_create_context(agent, "F001", "s1")
+
+    # Evicting the unchanged loaded context writes nothing back
+    VoiceAgent._get_or_create_context(agent, "F002", "s2")
+    assert agent._active_contexts.get("s1") is None
+    assert memory.saves == []
+
+
+def test_agent_creates_context_for_unknown_session():
+    memory = RecordingMemory()
+    agent = make_agent(memory)
+    context = VoiceAgent._get_or_create_context(agent, "F009", "new")
+    assert context.session_id == "new" and memory.loads == ["new"]
+    assert agent._active_contexts.get("new") is context
+
+
+def test_in_memory_session_store_is_bounded():
+    memory = SessionMemory(max_sessions=2)
+    for session_id in ("a", "b"):
+        memory.save_context(make_context(session_id))
+    assert memory.load_context("a") is not None  # b is now least recently used
+    memory.save_context(make_context("c"))
+
+    assert memory.load_context("b") is None
+    assert memory.load_context("a") is not None and memory.load_context("c") is not None
+
+
+def test_in_memory_session_store_expires_idle_sessions():
+    memory = SessionMemory(ttl_days=1)
+    context = make_context("s")
+    memory.save_context(context)
+    assert memory.load_context("s") is context
+
+    context.last_updated = datetime.now() - timedelta(days=2)
+    assert memory.load_context("s") is None
+    assert "s" not in memory._memory_store
+
+
+class FakeSessions:
+    def __init__(self):
+        self.ttl_indexes = []
+        self.deletes = []
+
+    def create_index(self, keys, **kwargs):
+        if "expireAfterSeconds" in kwargs:
+            self.ttl_indexes.append(kwargs["expireAfterSeconds"])
+
+    def list_indexes(self):
+        return []
+
+    def delete_many(self, query):
+        self.deletes.append(query)
+
+
+class FakeMongo:
+    def __init__(self):
+        self.sessions = FakeSessions()
+        self.commands = []
+
+    def __getitem__(self, name):
+        return self.sessions
+
+    def command(self, *args, **kwargs):
+        self.commands.append(args)
+
+
+def test_clearing_old_sessions_leaves_the_ttl_index_alone():
+    mongo = FakeMongo()
+    memory = SessionMemory(db_client=mongo, ttl_days=30)
+    assert mongo.sessions.ttl_indexes == [30 * 86400]
+
+    memory.clear_old_sessions(days=1)
+    assert mongo.commands == []
+    assert len(mongo.sessions.deletes) == 1
+    cutoff = mongo.sessions.deletes[0]["$or"][0]["updated_at"]["$lt"]
+    assert timedelta(hours=23) < datetime.now(timezone.utc) - cutoff < timedelta(hours=25)
@@ -0,0 +1,166 @@
+"""
+Weather service: farmer location resolution, invalid locations and
+background refresh / client lifecycle (Voice_agent/retrieval/weather_service.py)
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from Backend.Voice_agent.retrieval import weather_service
+from Backend.Voice_agent.retrieval.weather_service import (
+    DEFAULT_LOCATION, WeatherService, farmer_coordinates, find_farmer_location, geohash,
+)
+
+pytestmark = pytest.mark.usefixtures("voice_config")
+
+
+class FakeFarmers:
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = []
+
+    def find_one(self, query, projection=None):
+        self.queries.append(query)
+        farmer_id = query["$or"][0]["_id"]
+        return self.docs.get(farmer_id)
+
+
+class FakeDB:
+    def __init__(self, docs):
+        self.farmers = FakeFarmers(docs)
+
+
+def test_farmer_coordinates_from_documents_and_districts():
+    assert farmer_coordinates({"location": {"district": "Nashik", "lat": 19.6952, "lon": 73.5632}}) == (19.6952, 73.5632)
+    assert farmer_coordinates({"location": {"coordinates": {"lat": "20.5", "lon": "74.1"}}}) == (20.5, 74.1)
+    # No coordinates: district centre, English or Devanagari, any case / suffix
+    nashik = weather_service.DISTRICT_COORDINATES["nashik"]
+    assert farmer_coordinates({"location": {"district": "नाशिक", "coordinates": None}}) == nashik
+    assert farmer_coordinates({"id": "F001", "district": "Nasik"}) == nashik
+    assert farmer_coordinates({"district": "Nasik,IN"}) == nashik
+    assert farmer_coordinates({"district": "Atlantis"}) is None
+    assert farmer_coordinates(None) is None
+
+
+def test_find_farmer_location_prefers_stored_coordinates():
+    db = FakeDB({"F002": {"location": {"lat": 19.6952, "lon": 73.5632}}})
+    assert find_farmer_location(db, "F002", fallback={"district": "Pune"}) == (19.6952, 73.5632)
+    # Unknown farmer or no database: fall back to the user's district
+    assert find_farmer_location(db, "F404", fallback={"district": "Kolhapur"}) == weather_service.DISTRICT_COORDINATES["kolhapur"]
+    assert find_farmer_location(None, "F002", fallback={"district": "Atlantis"}) is None
+
+
+def test_invalid_location_is_counted_not_silent():
+    service = WeatherService()
+    default_cell = geohash(*DEFAULT_LOCATION, service.precision)
+
+    assert service._cell(None) == default_cell
+    assert service._cell((19.9975, 73.7898)) != default_cell
+    assert service.stats()["invalid_locations"] == 0
+
+    for bad in ("Nasik,IN", "12", (91.0, 10.0), ("x", "y")):
+        assert service._cell(bad) == default_cell
+    assert service.stats()["invalid_locations"] == 4
+
+
+def test_stale_refresh_runs_as_tracked_task(monkeypatch):
+    service = WeatherService()
+    service.api_key = "test"
+    cell = service._cell((19.9975, 73.7898))
+    service._cache[cell] = ({"temperature": 20}, time.monotonic() - service.cache_ttl_s - 1)
+    refreshed = asyncio.Event()
+
+    async def fetch(cell):
+        await asyncio.sleep(0)
+        service._store(cell, {"temperature": 31})
+        refreshed.set()
+
+    monkeypatch.setattr(service, "_fetch_async", fetch)
+
+    async def run():
+        stale = await service.get_current_weather_async((19.9975, 73.7898))
+        assert stale == {"temperature": 20}
+        assert service.stats()["refreshes_running"] == 1
+        await asyncio.wait_for(refreshed.wait(), 5)
+        await asyncio.sleep(0)
+        assert service.stats()["refreshes_running"] == 0
+        fresh = await service.get_current_weather_async((19.9975, 73.7898))
+        await service.aclose()
+        return fresh
+
+    assert asyncio.run(run()) == {"temperature": 31}
+
+
+def test_failed_refreshes_count_errors(monkeypatch):
+    service = WeatherService()
+
+    async def fail(cell):
+        raise RuntimeError("api down")
+
+    monkeypatch.setattr(service, "_fetch_async", fail)
+
+    async def run():
+        await asyncio.gather(*(service._refresh_async(f"cell{i}") for i in range(5)))
+
+    asyncio.run(run())
+    stats = service.stats()
+    assert stats["refresh_errors"] == 5 and stats["errors"] == 0
+
+
+def test_shared_failed_fetch_counts_one_error(monkeypatch):
+    service = WeatherService()
+    service.api_key = "test"
+
+    async def fail(cell):
+        await asyncio.sleep(0)
+        raise RuntimeError("api down")
+
+    monkeypatch.setattr(service, "_fetch_async", fail)
+    monkeypatch.setattr(service, "_get_fallback_weather", lambda: {"source": "fallback"})
+
+    async def run():
+        return await asyncio.gather(*(service.get_current_weather_async((19.9975, 73.7898)) for _ in range(4)))
+
+    assert asyncio.run(run()) == [{"source": "fallback"}] * 4
+    stats = service.stats()
+    assert stats["errors"] == 1 and stats["refresh_errors"] == 0
+
+
+def test_singleton_is_created_once(monkeypatch):
+    monkeypatch.setattr(weather_service, "_weather_service", None)
+    created = []
+
+    class SlowService:
+        def __init__(self):
+            time.sleep(0.01)
+            created.append(self)
+
+    monkeypatch.setattr(weather_service, "WeatherService", SlowService)
+    services = []
+    threads = [threading.Thread(target=lambda: services.append(weather_service.get_weather_service())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(created) == 1 and all(service is created[0] for service in services)
+
+
+def test_async_client_from_previous_loop_is_closed():
+    service = WeatherService()
+
+    async def client():
+        return service._get_async_client()
+
+    first = asyncio.run(client())
+
+    async def second_loop():
+        new = service._get_async_client()
+        await service.aclose()  # waits for the stale client's close task
+        return new
+
+    second = asyncio.run(second_loop())
+    assert second is not first
+    assert first.is_closed
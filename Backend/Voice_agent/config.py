@@ -20,10 +20,67 @@ class VoiceAgentConfig:
     
     # Whisper
     whisper_model: str = "base"
+    whisper_pool_size: int = 1  # models kept loaded for concurrent transcription
+    whisper_max_queue: int = 16  # requests allowed to wait for a free model
+    whisper_vad: bool = True  # trim silence / skip empty clips before decoding
+    stt_backend: str = "openai-whisper"  # or "faster-whisper" (CTranslate2, int8 on CPU)
+    stt_compute_type: str = "int8"  # faster-whisper quantization
+    stt_cpu_threads: int = 0  # faster-whisper threads per model (0 = default)
+    
+    # Translation (Argos models provisioned with input_processing/argos_models.py)
+    argos_models_dir: str = "models/argos"  # relative to Backend/
+    argos_auto_download: bool = False  # fall back to the online package index at startup
+    translation_cache_size: int = 4096  # in-process LRU entries
+    translation_cache_path: str = "cache/voice_cache.sqlite3"  # relative to Backend/; "" = memory only
+    
+    # Intent classification (local fast path in front of the LLM, core/fast_intent.py)
+    intent_fast_path: bool = True
+    intent_fast_threshold: float = 0.45  # local confidence needed to skip the LLM
+    intent_fast_intents: Tuple[str, ...] = ("market_price", "weather_query", "check_stock", "check_alerts")
+    intent_examples_path: str = "models/intent_examples.jsonl"  # learned examples; relative to Backend/
+    intent_log_path: str = "logs/intent_classifications.jsonl"  # LLM answers for retraining; "" = off
+    intent_cache: bool = True  # cache LLM classifications (core/intent_cache.py)
+    intent_cache_size: int = 4096  # in-process LRU entries
+    intent_cache_ttl_hours: float = 168  # 0 = never expire
+    intent_cache_path: str = "cache/voice_cache.sqlite3"  # relative to Backend/; "" = memory only
+    
+    # Vector store (retrieval/vector_store.py)
+    embedding_cache_size: int = 1024  # query embeddings kept in memory (LRU)
+    
+    # Per-farmer conversation memory (retrieval/conversation_memory.py)
+    conversation_shards: int = 16  # Chroma collections farmers are hashed across
+    conversation_max_turns: int = 200  # turns kept per farmer
+    conversation_compact_batch: int = 50  # turns folded into one summary document
+    conversation_max_age_days: float = 90  # older raw turns are compacted; 0 = never
+    
+    # Mongo master collections -> vector store (index_knowledge.py)
+    knowledge_ingest_batch_size: int = 128  # documents per embedding batch
+    
+    # Conversation turns -> vector store (write-behind, retrieval/ingest_queue.py)
+    vector_ingest_max_pending: int = 1000  # oldest turns are dropped beyond this
+    vector_ingest_batch_size: int = 32
+    vector_ingest_max_wait_ms: int = 500  # partial batches wait this long for more turns
+    
+    # Session persistence (memory/session_memory.py)
+    session_history_limit: int = 50  # turns stored and loaded per session
+    session_ttl_days: float = 30  # MongoDB TTL index on updated_at
+    session_memory_max_sessions: int = 10000  # in-memory fallback (no MongoDB), LRU
+    
+    # Live conversation contexts held by the agent (core/session_cache.py)
+    active_context_max_sessions: int = 1000
+    active_context_idle_ttl_s: float = 1800  # 0 = never expire
+    active_context_max_mb: float = 64  # estimated size (JSON bytes); 0 = unbounded
+    
+    # Weather lookups (retrieval/weather_service.py)
+    weather_geohash_precision: int = 5  # cache cell size (5 = ~5 km)
+    weather_cache_ttl_s: float = 600  # served from cache without a request
+    weather_stale_ttl_s: float = 3600  # served stale while one request refreshes it
+    weather_cache_max_cells: int = 4096
+    weather_http_max_connections: int = 10  # keep-alive pool to OpenWeatherMap
     
     # MongoDB
     mongodb_uri: Optional[str] = None
-    mongodb_db_name: str = "farming_assistant"
+    mongodb_db_name: str = "kisanmitra"
     
     # Other APIs
     openweather_api_key: Optional[str] = None
@@ -93,8 +150,51 @@ class ConfigManager:
                 llm_api_key=llm_api_key,
                 llm_model=None,  # Will use default for provider
                 whisper_model=os.getenv("WHISPER_MODEL", "base"),
+                whisper_pool_size=int(os.getenv("WHISPER_POOL_SIZE", "1")),
+                whisper_max_queue=int(os.getenv("WHISPER_MAX_QUEUE", "16")),
+                whisper_vad=os.getenv("WHISPER_VAD", "true").lower() in ("1", "true", "yes"),
+                stt_backend=os.getenv("STT_BACKEND", "openai-whisper"),
+                stt_compute_type=os.getenv("STT_COMPUTE_TYPE", "int8"),
+                stt_cpu_threads=int(os.getenv("STT_CPU_THREADS", "0")),
+                argos_models_dir=os.getenv("ARGOS_MODELS_DIR", "models/argos"),
+                argos_auto_download=os.getenv("ARGOS_AUTO_DOWNLOAD", "false").lower() in ("1", "true", "yes"),
+                translation_cache_size=int(os.getenv("TRANSLATION_CACHE_SIZE", "4096")),
+                translation_cache_path=os.getenv("TRANSLATION_CACHE_PATH", "cache/voice_cache.sqlite3"),
+                intent_fast_path=os.getenv("INTENT_FAST_PATH", "true").lower() in ("1", "true", "yes"),
+                intent_fast_threshold=float(os.getenv("INTENT_FAST_THRESHOLD", "0.45")),
+                intent_fast_intents=tuple(
+                    i.strip() for i in os.getenv(
+                        "INTENT_FAST_INTENTS", "market_price,weather_query,check_stock,check_alerts"
+                    ).split(",") if i.strip()
+                ),
+                intent_examples_path=os.getenv("INTENT_EXAMPLES_PATH", "models/intent_examples.jsonl"),
+                intent_log_path=os.getenv("INTENT_LOG_PATH", "logs/intent_classifications.jsonl"),
+                intent_cache=os.getenv("INTENT_CACHE", "true").lower() in ("1", "true", "yes"),
+                intent_cache_size=int(os.getenv("INTENT_CACHE_SIZE", "4096")),
+                intent_cache_ttl_hours=float(os.getenv("INTENT_CACHE_TTL_HOURS", "168")),
+                intent_cache_path=os.getenv("INTENT_CACHE_PATH", "cache/voice_cache.sqlite3"),
+                embedding_cache_size=int(os.getenv("EMBEDDING_CACHE_SIZE", "1024")),
+                conversation_shards=int(os.getenv("CONVERSATION_SHARDS", "16")),
+                conversation_max_turns=int(os.getenv("CONVERSATION_MAX_TURNS", "200")),
+                conversation_compact_batch=int(os.getenv("CONVERSATION_COMPACT_BATCH", "50")),
+                conversation_max_age_days=float(os.getenv("CONVERSATION_MAX_AGE_DAYS", "90")),
+                knowledge_ingest_batch_size=int(os.getenv("KNOWLEDGE_INGEST_BATCH_SIZE", "128")),
+                vector_ingest_max_pending=int(os.getenv("VECTOR_INGEST_MAX_PENDING", "1000")),
+                vector_ingest_batch_size=int(os.getenv("VECTOR_INGEST_BATCH_SIZE", "32")),
+                vector_ingest_max_wait_ms=int(os.getenv("VECTOR_INGEST_MAX_WAIT_MS", "500")),
+                session_history_limit=int(os.getenv("SESSION_HISTORY_LIMIT", "50")),
+                session_ttl_days=float(os.getenv("SESSION_TTL_DAYS", "30")),
+                session_memory_max_sessions=int(os.getenv("SESSION_MEMORY_MAX_SESSIONS", "10000")),
+                active_context_max_sessions=int(os.getenv("ACTIVE_CONTEXT_MAX_SESSIONS", "1000")),
+                active_context_idle_ttl_s=float(os.getenv("ACTIVE_CONTEXT_IDLE_TTL_S", "1800")),
+                active_context_max_mb=float(os.getenv("ACTIVE_CONTEXT_MAX_MB", "64")),
+                weather_geohash_precision=int(os.getenv("WEATHER_GEOHASH_PRECISION", "5")),
+                weather_cache_ttl_s=float(os.getenv("WEATHER_CACHE_TTL_S", "600")),
+                weather_stale_ttl_s=float(os.getenv("WEATHER_STALE_TTL_S", "3600")),
+                weather_cache_max_cells=int(os.getenv("WEATHER_CACHE_MAX_CELLS", "4096")),
+                weather_http_max_connections=int(os.getenv("WEATHER_HTTP_MAX_CONNECTIONS", "10")),
                 mongodb_uri=os.getenv("MONGODB_URI"),
-                mongodb_db_name=os.getenv("MONGODB_DB_NAME", "farming_assistant"),
+                mongodb_db_name=os.getenv("DATABASE_NAME") or os.getenv("MONGODB_DB_NAME", "kisanmitra"),
                 openweather_api_key=os.getenv("OPENWEATHER_API_KEY"),
                 market_api_key=os.getenv("MARKET_API_KEY"),
                 mandi_api_key=os.getenv("MANDI_API_KEY"),
@@ -103,7 +203,7 @@ class ConfigManager:
             
             print(f"✅ Configuration loaded:")
             print(f"   LLM Provider: {self._config.llm_provider}")
-            print(f"   Whisper Model: {self._config.whisper_model}")
+            print(f"   Whisper Model: {self._config.whisper_model} x{self._config.whisper_pool_size} ({self._config.stt_backend})")
             print(f"   MongoDB: {'Configured' if self._config.mongodb_uri else 'Not configured (using in-memory)'}")
         
         return self._config
@@ -3,18 +3,24 @@ Voice Agent - Main Orchestrator
 Coordinates all components for voice-first farming assistant
 """
 
+import asyncio
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-from Backend.Voice_agent.input_processing import get_translator, get_speech_to_text
+from Backend.Voice_agent.input_processing import get_translator
 from Backend.Voice_agent.core.intent import get_intent_classifier, Intent
 from Backend.Voice_agent.core.context import ConversationContext
+from Backend.Voice_agent.core.session_cache import create_session_cache
+from Backend.Voice_agent.core.pipeline import StagePipeline, Runner
 from Backend.Voice_agent.memory import get_session_memory
 from Backend.Voice_agent.retrieval import get_retriever
+from Backend.Voice_agent.retrieval.ingest_queue import get_ingest_queue, close_ingest_queue
+from Backend.Voice_agent.retrieval.weather_service import find_farmer_location
 from Backend.Voice_agent.reasoning import get_reasoning_planner, get_synthesizer
 from Backend.Voice_agent.explain import get_explanation_builder
 from Backend.Voice_agent.cards import BaseCard
+from Backend.utils.timing import span
 
 
 @dataclass
@@ -65,8 +71,9 @@ class VoiceAgent:
         config = get_config()
         
         # Initialize components
+        # Speech-to-text is not built here: the agent takes text, and audio
+        # routes get the Whisper pool from the service registry on first use
         self.translator = get_translator()
-        self.stt = get_speech_to_text()  # Uses config for Whisper model
         
         # NEW: Use Llama 2 Intent Classifier with Pydantic schemas
         from voice_agent.core.llama_classifier import get_llama2_classifier
@@ -79,30 +86,38 @@ class VoiceAgent:
             from voice_agent.core.intent import get_intent_classifier
             self.intent_classifier = get_intent_classifier()
         
-        # MongoDB - use provided client or try to connect from config
+        # Routine queries are answered on-box; only uncertain ones reach the LLM
+        if config.intent_fast_path:
+            from Backend.Voice_agent.core.fast_intent import build_fast_path
+            self.intent_classifier = build_fast_path(self.intent_classifier, config)
+        
+        # MongoDB - use provided database or the shared process-wide client
         if db_client is None and config.mongodb_uri:
-            try:
-                from pymongo import MongoClient
-                # Set a short timeout for the initial connection check
-                temp_client = MongoClient(config.mongodb_uri, serverSelectionTimeoutMS=2000)
-                # Verify connection
-                temp_client.admin.command('ping')
-                
-                db_client = temp_client[config.mongodb_db_name]
-                print(f"✅ Connected to MongoDB: {config.mongodb_db_name}")
-            except Exception as e:
-                print(f"⚠️  MongoDB connection failed (Server unreachable): {e}")
+            from Backend.database.connection import db as mongo
+            if mongo.connect_sync(uri=config.mongodb_uri, db_name=config.mongodb_db_name):
+                db_client = mongo.get_sync_database()
+                print(f"✅ Connected to MongoDB: {mongo.db_name}")
+            else:
+                print("⚠️  MongoDB connection failed (Server unreachable)")
                 print("   Using in-memory storage")
-                db_client = None
         
-        self.session_memory = get_session_memory(db_client)
+        self.db_client = db_client
+        self.session_memory = get_session_memory(
+            db_client,
+            history_limit=config.session_history_limit,
+            ttl_days=config.session_ttl_days,
+            max_sessions=config.session_memory_max_sessions
+        )
         self.retriever = get_retriever()
         self.reasoning_planner = get_reasoning_planner()
         self.synthesizer = get_synthesizer()
         self.explanation_builder = get_explanation_builder()
         
-        # Active contexts
-        self._active_contexts: Dict[str, ConversationContext] = {}
+        # Active contexts (bounded; evicted ones are written back to session memory)
+        self._active_contexts = create_session_cache(config, self.session_memory.save_context)
+        
+        # Background saves started by process_input_async, by session
+        self._pending_persistence: Dict[str, asyncio.Future] = {}
     
     def process_input(
         self,
@@ -122,15 +137,17 @@ class VoiceAgent:
             Agent response with cards and explanation
         """
         # Step 1: Get or create conversation context
-        context = self._get_or_create_context(farmer_id, session_id)
+        with span("voice.context"):
+            context = self._get_or_create_context(farmer_id, session_id)
         
         # Step 2: Translate Hindi to English
-        english_text = self.translator.hindi_to_english(hindi_text)
+        with span("voice.translate"):
+            english_text = self.translator.hindi_to_english(hindi_text)
         
         # Step 3: Detect intent
-        intent_result = self.intent_classifier.classify(english_text)
+        with span("voice.classify"):
+            intent_result = self.intent_classifier.classify(english_text)
         intent = intent_result.intent
-        confidence = intent_result.confidence
         
         if intent_result.entities:
             context.update_from_dict(intent_result.entities)
@@ -139,87 +156,202 @@ class VoiceAgent:
         reasoning_plan = self.reasoning_planner.create_plan(intent)
         
         # Step 5: Retrieve relevant information
-        retrieved_docs = self.retriever.retrieve(
-            intent=intent,
-            query_text=english_text,
-            context=context.to_dict()
-        )
+        with span("voice.retrieve"):
+            retrieved_docs = self.retriever.retrieve(
+                intent=intent,
+                query_text=english_text,
+                context=context.to_dict()
+            )
         
         # Step 6: Synthesize information into cards
-        synth_context = context.to_dict()
-        # Flatten context variables for easier access in synthesizer
-        synth_context.update(context.context_variables)
-        
-        synthesis_result = self.synthesizer.synthesize(
-            intent=intent,
-            retrieved_docs=retrieved_docs,
-            context=synth_context
-        )
+        with span("voice.synthesize"):
+            synthesis_result = self._synthesize(intent, retrieved_docs, context)
         
         cards = synthesis_result["cards"]
         reasoning = synthesis_result["reasoning"]
         
         # Step 7: Build explanation
-        explanation_english = self.explanation_builder.build_explanation(
-            intent=intent,
-            cards=cards,
-            reasoning=reasoning,
-            language="english"
+        with span("voice.explain"):
+            explanation_english = self.explanation_builder.build_explanation(
+                intent=intent,
+                cards=cards,
+                reasoning=reasoning,
+                language="english"
+            )
+        
+        with span("voice.explain_hi"):
+            explanation_hindi = self.explanation_builder.build_explanation(
+                intent=intent,
+                cards=cards,
+                reasoning=reasoning,
+                language="hindi"
+            )
+        
+        # Step 8: Update conversation context
+        self._record_turn(
+            context, hindi_text, english_text, intent_result, reasoning_plan,
+            cards, retrieved_docs, explanation_english, explanation_hindi
         )
         
-        explanation_hindi = self.explanation_builder.build_explanation(
-            intent=intent,
-            cards=cards,
-            reasoning=reasoning,
-            language="hindi"
+        # Step 9: Save context to memory and ingest the turn into Vector RAG
+        self._persist(context)
+        
+        # Step 10: Build response
+        return self._build_response(
+            context, english_text, intent_result, reasoning_plan,
+            synthesis_result, retrieved_docs, explanation_english, explanation_hindi
+        )
+    
+    async def process_input_async(
+        self,
+        hindi_text: str,
+        farmer_id: str = "F001",
+        session_id: Optional[str] = None,
+        run: Optional[Runner] = None
+    ) -> AgentResponse:
+        """
+        Concurrent version of ``process_input``
+        
+        Same steps and result, run as a dependency graph: the session
+        loads while the text is translated and classified, the retrieval
+        sources for the intent are fetched in parallel, and the English
+        and Hindi explanations are built side by side.
+        
+        Saving the session and the Vector RAG ingest run as a background
+        task after the response is built; the next turn of the same
+        session waits for them before loading its context.
+        ``metadata["stage_timings_ms"]`` reports how long each stage ran.
+        
+        Args:
+            hindi_text: Hindi text input (from voice or text)
+            farmer_id: Farmer identifier
+            session_id: Optional session ID
+            run: ``async run(lane, fn, *args)`` for blocking stages
+                 (the API passes ``run_blocking``; default: worker thread)
+        
+        Returns:
+            Agent response with cards and explanation
+        """
+        if session_id:
+            await self._wait_for_persistence(session_id)
+        
+        pipeline = StagePipeline(run=run)
+        
+        def apply_entities(r):
+            context = r["context"]
+            if r["classify"].entities:
+                context.update_from_dict(r["classify"].entities)
+            return context
+        
+        async def retrieve(r):
+            sources = self.retriever.sources_for(
+                intent=r["classify"].intent,
+                query_text=r["translate"],
+                context=r["entities"].to_dict(),
+                use_async=True
+            )
+            parts = await asyncio.gather(*(
+                pipeline.call(f"retrieve.{name}", "external", fetch) for name, fetch in sources
+            ))
+            return [doc for part in parts for doc in part]
+        
+        def explain(language):
+            def build(r):
+                return self.explanation_builder.build_explanation(
+                    intent=r["classify"].intent,
+                    cards=r["synthesize"]["cards"],
+                    reasoning=r["synthesize"]["reasoning"],
+                    language=language
+                )
+            return build
+        
+        pipeline.add("context", lambda r: self._get_or_create_context(farmer_id, session_id), lane="db")
+        pipeline.add("translate", lambda r: self.translator.hindi_to_english(hindi_text))
+        pipeline.add("classify", lambda r: self.intent_classifier.classify(r["translate"]),
+                     deps=("translate",), lane="external")
+        pipeline.add("plan", lambda r: self.reasoning_planner.create_plan(r["classify"].intent),
+                     deps=("classify",), lane=None)
+        pipeline.add("entities", apply_entities, deps=("context", "classify"), lane=None)
+        pipeline.add("retrieve", retrieve, deps=("entities",))
+        pipeline.add("synthesize", lambda r: self._synthesize(r["classify"].intent, r["retrieve"], r["entities"]),
+                     deps=("retrieve",))
+        pipeline.add("explain", explain("english"), deps=("synthesize",))
+        pipeline.add("explain_hi", explain("hindi"), deps=("synthesize",))
+        r = await pipeline.execute()
+        
+        context = r["entities"]
+        self._record_turn(
+            context, hindi_text, r["translate"], r["classify"], r["plan"],
+            r["synthesize"]["cards"], r["retrieve"], r["explain"], r["explain_hi"]
         )
+        self._schedule_persistence(context, pipeline.run)
         
-        # Step 8: Update conversation context
+        response = self._build_response(
+            context, r["translate"], r["classify"], r["plan"],
+            r["synthesize"], r["retrieve"], r["explain"], r["explain_hi"]
+        )
+        response.metadata["stage_timings_ms"] = pipeline.timings_ms()
+        response.metadata["pipeline_ms"] = pipeline.total_ms
+        return response
+    
+    def _synthesize(self, intent: Intent, retrieved_docs: List[Dict[str, Any]], context: ConversationContext) -> Dict[str, Any]:
+        """Synthesize retrieved information into cards"""
+        synth_context = context.to_dict()
+        # Flatten context variables for easier access in synthesizer
+        synth_context.update(context.context_variables)
+        
+        return self.synthesizer.synthesize(
+            intent=intent,
+            retrieved_docs=retrieved_docs,
+            context=synth_context
+        )
+    
+    def _record_turn(
+        self,
+        context: ConversationContext,
+        hindi_text: str,
+        english_text: str,
+        intent_result,
+        reasoning_plan,
+        cards: List[BaseCard],
+        retrieved_docs: List[Dict[str, Any]],
+        explanation_english: str,
+        explanation_hindi: str
+    ):
+        """Append this exchange to the conversation context"""
         context.add_turn(
             user_input_hindi=hindi_text,
             user_input_english=english_text,
-            detected_intent=intent,
+            detected_intent=intent_result.intent,
             agent_response_english=explanation_english,
             agent_response_hindi=explanation_hindi,
             cards=[card.to_dict() for card in cards],
             metadata={
-                "intent_confidence": confidence,
+                "intent_confidence": intent_result.confidence,
                 "retrieved_sources": len(retrieved_docs),
                 "reasoning_plan": reasoning_plan.output_format,
             }
         )
-        
-        # Step 9: Save context to memory
-        self.session_memory.save_context(context)
-        
-        # Step 9b: Ingest turn into Vector RAG (Dynamic Memory)
-        try:
-            from voice_agent.retrieval.vector_store import get_vector_store
-            vector_store = get_vector_store()
-            
-            # Get the latest turn we just added
-            latest_turn = context.conversation_history[-1]
-            
-            turn_data = {
-                "turn_id": latest_turn.turn_id,
-                "timestamp": latest_turn.timestamp.isoformat(),
-                "user_input_english": latest_turn.user_input_english,
-                "agent_response_english": latest_turn.agent_response_english,
-                "intent": latest_turn.detected_intent.value
-            }
-            vector_store.ingest_conversation_turn(turn_data)
-        except Exception as e:
-            print(f"⚠️  Failed to ingest turn into VectorDB: {e}")
-        
-        # Step 10: Build response
-        response = AgentResponse(
+    
+    def _build_response(
+        self,
+        context: ConversationContext,
+        english_text: str,
+        intent_result,
+        reasoning_plan,
+        synthesis_result: Dict[str, Any],
+        retrieved_docs: List[Dict[str, Any]],
+        explanation_english: str,
+        explanation_hindi: str
+    ) -> AgentResponse:
+        return AgentResponse(
             session_id=context.session_id,
-            intent=intent,
-            intent_confidence=confidence,
-            cards=cards,
+            intent=intent_result.intent,
+            intent_confidence=intent_result.confidence,
+            cards=synthesis_result["cards"],
             explanation_hindi=explanation_hindi,
             explanation_english=explanation_english,
-            reasoning=reasoning,
+            reasoning=synthesis_result["reasoning"],
             retrieved_sources=len(retrieved_docs),
             timestamp=datetime.now(),
             metadata={
@@ -228,8 +360,67 @@ class VoiceAgent:
                 "user_input_english": english_text,
             }
         )
+    
+    def _persist(self, context: ConversationContext):
+        """Save context to memory, then queue the latest turn for Vector RAG"""
+        with span("voice.save"):
+            self.session_memory.save_context(context)
+            # Refresh the context's size estimate now that it holds the new turn
+            self._active_contexts.put(context)
+            self._active_contexts.mark_saved(context)
         
-        return response
+        # Dynamic Memory: make the turn searchable for follow-up questions.
+        # Only enqueued here; a background worker embeds and upserts in batches
+        with span("voice.vector_ingest"):
+            try:
+                # Get the latest turn we just added
+                latest_turn = context.conversation_history[-1]
+            
+                turn_data = {
+                    "farmer_id": context.farmer_profile.farmer_id,
+                    "session_id": context.session_id,
+                    "turn_id": latest_turn.turn_id,
+                    "timestamp": latest_turn.timestamp.isoformat(),
+                    "user_input_english": latest_turn.user_input_english,
+                    "agent_response_english": latest_turn.agent_response_english,
+                    "intent": latest_turn.detected_intent.value
+                }
+                get_ingest_queue().put(turn_data)
+            except Exception as e:
+                print(f"⚠️  Failed to queue turn for VectorDB: {e}")
+    
+    def _schedule_persistence(self, context: ConversationContext, run: Runner):
+        """Persist the turn after the response goes out"""
+        session_id = context.session_id
+        previous = self._pending_persistence.get(session_id)
+        
+        async def persist():
+            if previous is not None:
+                await asyncio.gather(previous, return_exceptions=True)
+            try:
+                await run("db", self._persist, context)
+            except Exception as e:
+                print(f"⚠️  Failed to save session {session_id}: {e}")
+        
+        task = asyncio.ensure_future(persist())
+        self._pending_persistence[session_id] = task
+        
+        def forget(done):
+            if self._pending_persistence.get(session_id) is done:
+                del self._pending_persistence[session_id]
+        
+        task.add_done_callback(forget)
+    
+    async def _wait_for_persistence(self, session_id: str):
+        task = self._pending_persistence.get(session_id)
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+    
+    async def flush_persistence(self):
+        """Wait for every background save (call before shutdown)"""
+        pending = list(self._pending_persistence.values())
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
     
     def _get_or_create_context(
         self,
@@ -238,23 +429,39 @@ class VoiceAgent:
     ) -> ConversationContext:
         """Get existing or create new conversation context"""
         
-        # Try to load from session ID
         if session_id:
+            # Live context first: it may hold turns not yet saved
+            context = self._active_contexts.get(session_id)
+            if context:
+                return context
+            
+            # Otherwise load it from session memory
             context = self.session_memory.load_context(session_id)
             if context:
-                self._active_contexts[session_id] = context
+                self._active_contexts.put(context)
+                # Loaded means saved, unless the farmer's location is filled in now
+                if context.farmer_profile.location or not self._locate_farmer(context):
+                    self._active_contexts.mark_saved(context)
                 return context
         
-        # Try to get from active contexts
-        if session_id and session_id in self._active_contexts:
-            return self._active_contexts[session_id]
-        
         # Create new context
         context = ConversationContext(farmer_id=farmer_id, session_id=session_id)
-        self._active_contexts[context.session_id] = context
+        self._locate_farmer(context)
+        self._active_contexts.put(context)
         
         return context
     
+    def _locate_farmer(self, context: ConversationContext) -> bool:
+        """Fill the profile's (lat, lon) from the farmers collection (weather retrieval reads it)"""
+        profile = context.farmer_profile
+        location = find_farmer_location(
+            self.db_client, profile.farmer_id, fallback={"district": profile.district}
+        )
+        if not location:
+            return False
+        context.update_farmer_profile(location=location)
+        return True
+    
     def get_session_history(self, session_id: str) -> Optional[ConversationContext]:
         """Get session history"""
         return self.session_memory.load_context(session_id)
@@ -274,3 +481,14 @@ def get_voice_agent(db_client=None) -> VoiceAgent:
     if _agent is None:
         _agent = VoiceAgent(db_client=db_client)
     return _agent
+
+
+async def flush_pending_saves(timeout: float = 10.0):
+    """
+    Wait for the agent's background saves, then drain the vector ingest
+    queue (no-op if the agent was never created)
+    """
+    if _agent is not None:
+        await _agent.flush_persistence()
+        if not await asyncio.to_thread(close_ingest_queue, timeout):
+            print("⚠️  Vector ingest queue not drained before shutdown")
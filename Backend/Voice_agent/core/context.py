@@ -36,6 +36,40 @@ class ConversationTurn:
     agent_response_hindi: str
     cards_generated: List[Dict[str, Any]] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert turn to dictionary for storage"""
+        return {
+            "turn_id": self.turn_id,
+            "timestamp": self.timestamp.isoformat(),
+            "user_input_hindi": self.user_input_hindi,
+            "user_input_english": self.user_input_english,
+            "detected_intent": self.detected_intent.value,
+            "agent_response_english": self.agent_response_english,
+            "agent_response_hindi": self.agent_response_hindi,
+            "cards_generated": self.cards_generated,
+            "metadata": self.metadata,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ConversationTurn":
+        """Rebuild a stored turn"""
+        try:
+            intent = Intent(data.get("detected_intent"))
+        except ValueError:
+            intent = Intent.UNKNOWN
+        timestamp = data.get("timestamp")
+        return cls(
+            turn_id=data["turn_id"],
+            timestamp=timestamp if isinstance(timestamp, datetime) else datetime.fromisoformat(timestamp),
+            user_input_hindi=data.get("user_input_hindi", ""),
+            user_input_english=data.get("user_input_english", ""),
+            detected_intent=intent,
+            agent_response_english=data.get("agent_response_english", ""),
+            agent_response_hindi=data.get("agent_response_hindi", ""),
+            cards_generated=data.get("cards_generated") or [],
+            metadata=data.get("metadata") or {},
+        )
 
 
 class ConversationContext:
@@ -55,11 +89,16 @@ class ConversationContext:
         self.session_id = session_id or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.farmer_profile = FarmerProfile(farmer_id=farmer_id)
         self.conversation_history: List[ConversationTurn] = []
+        self.turn_count = 0  # all turns so far; the history may hold only the latest
         self.current_intent: Optional[Intent] = None
         self.pending_confirmation: Optional[Dict[str, Any]] = None
         self.context_variables: Dict[str, Any] = {}
         self.created_at = datetime.now()
         self.last_updated = datetime.now()
+        
+        # Maintained by SessionMemory: what storage already holds
+        self.persisted_turns = 0
+        self.persisted_state: Dict[str, Any] = {}
     
     def update_farmer_profile(self, **kwargs):
         """Update farmer profile with new information"""
@@ -94,7 +133,7 @@ class ConversationContext:
             Created conversation turn
         """
         turn = ConversationTurn(
-            turn_id=len(self.conversation_history) + 1,
+            turn_id=self.turn_count + 1,
             timestamp=datetime.now(),
             user_input_hindi=user_input_hindi,
             user_input_english=user_input_english,
@@ -106,6 +145,7 @@ class ConversationContext:
         )
         
         self.conversation_history.append(turn)
+        self.turn_count = turn.turn_id
         self.current_intent = detected_intent
         self.last_updated = datetime.now()
         
@@ -120,7 +160,7 @@ class ConversationContext:
         summary_parts = [
             f"Session: {self.session_id}",
             f"Farmer: {self.farmer_profile.farmer_id}",
-            f"Turns: {len(self.conversation_history)}",
+            f"Turns: {self.turn_count}",
         ]
         
         if self.farmer_profile.location:
@@ -157,8 +197,8 @@ class ConversationContext:
         """Clear pending confirmation"""
         self.pending_confirmation = None
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert context to dictionary for storage"""
+    def state_dict(self) -> Dict[str, Any]:
+        """Everything except the conversation history"""
         return {
             "session_id": self.session_id,
             "farmer_id": self.farmer_profile.farmer_id,
@@ -173,23 +213,16 @@ class ConversationContext:
                 "language": self.farmer_profile.language,
                 "crops_grown": self.farmer_profile.crops_grown,
             },
-            "conversation_history": [
-                {
-                    "turn_id": turn.turn_id,
-                    "timestamp": turn.timestamp.isoformat(),
-                    "user_input_hindi": turn.user_input_hindi,
-                    "user_input_english": turn.user_input_english,
-                    "detected_intent": turn.detected_intent.value,
-                    "agent_response_english": turn.agent_response_english,
-                    "agent_response_hindi": turn.agent_response_hindi,
-                    "cards_generated": turn.cards_generated,
-                    "metadata": turn.metadata,
-                }
-                for turn in self.conversation_history
-            ],
+            "turn_count": self.turn_count,
             "current_intent": self.current_intent.value if self.current_intent else None,
             "pending_confirmation": self.pending_confirmation,
             "context_variables": self.context_variables,
             "created_at": self.created_at.isoformat(),
             "last_updated": self.last_updated.isoformat(),
         }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert context to dictionary for storage"""
+        data = self.state_dict()
+        data["conversation_history"] = [turn.to_dict() for turn in self.conversation_history]
+        return data
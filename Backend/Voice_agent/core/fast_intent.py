@@ -0,0 +1,320 @@
+"""
+Local Intent Fast Path
+An on-box TF-IDF nearest-neighbour classifier (scikit-learn) in front of
+the Groq LLM.
+Routine queries (prices, weather, stock, alerts) are answered locally in
+well under a millisecond; anything the local model is unsure about, and
+every intent outside the fast set, still goes to the LLM.
+
+LLM answers are appended to a JSONL log; ``train_intent_classifier.py``
+turns confident ones into extra training examples and reports accuracy
+and latency, so the fast path learns from production traffic.
+"""
+
+import json
+import os
+import threading
+import time
+import unicodedata
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from Backend.utils.kv_cache import resolve_path
+from Backend.Voice_agent.core.intent import Intent, IntentResult
+from Backend.Voice_agent.core.intent_examples import SEED_EXAMPLES
+
+# Intents answered locally by default: no entities beyond the crop name
+# are needed to serve them
+DEFAULT_FAST_INTENTS = ("market_price", "weather_query", "check_stock", "check_alerts")
+
+# Crop names the fast path extracts (the LLM extracts them on the slow path)
+CROP_LEXICON = {
+    "onion": "onion", "प्याज": "onion", "कांदा": "onion",
+    "wheat": "wheat", "गेहूं": "wheat", "गेहूँ": "wheat",
+    "rice": "rice", "paddy": "rice", "धान": "rice", "चावल": "rice",
+    "cotton": "cotton", "कपास": "cotton",
+    "soybean": "soybean", "soyabean": "soybean", "सोयाबीन": "soybean",
+    "maize": "maize", "corn": "maize", "मक्का": "maize",
+    "potato": "potato", "आलू": "potato",
+    "tomato": "tomato", "टमाटर": "tomato",
+    "sugarcane": "sugarcane", "गन्ना": "sugarcane",
+    "gram": "gram", "chana": "gram", "चना": "gram",
+    "mustard": "mustard", "सरसों": "mustard",
+}
+
+
+def normalize(text: str) -> str:
+    """NFC, lowercase, punctuation to spaces, collapsed whitespace"""
+    text = unicodedata.normalize("NFC", text).lower()
+    text = "".join(" " if unicodedata.category(c)[0] in "PS" else c for c in text)
+    return " ".join(text.split())
+
+
+def features(text: str) -> List[str]:
+    """Word unigrams/bigrams plus character 2-4 grams (robust to spelling and inflection)"""
+    words = normalize(text).split()
+    feats = [f"w:{w}" for w in words]
+    feats += [f"b:{a}_{b}" for a, b in zip(words, words[1:])]
+    for word in words:
+        padded = f" {word} "
+        for n in (2, 3, 4):
+            feats += [f"c:{padded[i:i + n]}" for i in range(len(padded) - n + 1)]
+    return feats
+
+
+def extract_entities(text: str) -> Dict[str, Any]:
+    """Crop name, if one from the lexicon is mentioned"""
+    for word in normalize(text).split():
+        crop = CROP_LEXICON.get(word) or CROP_LEXICON.get(word.rstrip("s"))
+        if crop:
+            return {"crop_name": crop}
+    return {}
+
+
+def normalize_entities(entities: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Trim string values and map crop names to their English lexicon form ("प्याज" -> "onion")"""
+    normalized = {}
+    for name, value in (entities or {}).items():
+        if isinstance(value, str):
+            value = " ".join(value.split())
+            if name in ("crop_name", "crop"):
+                value = CROP_LEXICON.get(normalize(value), value)
+        normalized[name] = value
+    return normalized
+
+
+@dataclass
+class LocalPrediction:
+    """Local classifier output"""
+    intent: str
+    confidence: float  # vote share of the winning intent x its best similarity
+    similarity: float  # cosine similarity of the closest example
+    neighbours: int
+
+
+class LocalIntentClassifier:
+    """
+    TF-IDF (sublinear tf, L2-normalised) cosine k-nearest-neighbour model
+
+    ``TfidfVectorizer`` over ``features()``; rows are L2-normalised, so one
+    sparse dot product gives the cosine similarity to every example.
+    """
+
+    def __init__(self, k: int = 5):
+        self.k = k
+        self.texts: List[str] = []  # normalised training texts
+        self.labels: List[str] = []
+        self._vectorizer = None
+        self._matrix = None
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def fit(self, examples: Iterable[Tuple[str, str]]) -> "LocalIntentClassifier":
+        """Train on (text, intent) pairs; duplicates (after normalisation) are dropped"""
+        # Imported here: the API imports this module at startup for its stats
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        unique: Dict[str, str] = {}
+        for text, intent in examples:
+            key = normalize(text)
+            if key:
+                unique[key] = intent
+        self.texts, self.labels = list(unique), list(unique.values())
+        if not self.texts:
+            return self
+
+        self._vectorizer = TfidfVectorizer(analyzer=features, sublinear_tf=True, dtype=np.float32)
+        self._matrix = self._vectorizer.fit_transform(self.texts).tocsr()
+        return self
+
+    def similarities(self, text: str) -> np.ndarray:
+        """Cosine similarity of ``text`` to every training example"""
+        if self._vectorizer is None:
+            return np.zeros(0, dtype=np.float32)
+        query = self._vectorizer.transform([text])
+        return (self._matrix @ query.T).toarray().ravel()
+
+    def predict(self, text: str, exclude: Optional[int] = None) -> LocalPrediction:
+        """
+        Args:
+            text: Query (English after translation, or Hindi)
+            exclude: Training row to ignore (leave-one-out evaluation)
+        """
+        if not self.labels:
+            return LocalPrediction("unknown", 0.0, 0.0, 0)
+        scores = self.similarities(text)
+        if exclude is not None:
+            scores[exclude] = 0.0
+
+        top = [(int(row), float(scores[row])) for row in np.argsort(scores)[::-1][:self.k] if scores[row] > 0]
+        if not top:
+            return LocalPrediction("unknown", 0.0, 0.0, 0)
+
+        votes: Dict[str, float] = {}
+        for row, similarity in top:
+            votes[self.labels[row]] = votes.get(self.labels[row], 0.0) + similarity
+        intent = max(votes, key=votes.get)
+        best = max(similarity for row, similarity in top if self.labels[row] == intent)
+        share = votes[intent] / sum(votes.values())
+        return LocalPrediction(intent, round(share * best, 4), round(top[0][1], 4), len(top))
+
+
+def load_examples(path: Optional[str]) -> List[Tuple[str, str]]:
+    """Extra (text, intent) pairs from a JSONL file written by the trainer"""
+    path = resolve_path(path)
+    if not path or not os.path.exists(path):
+        return []
+    examples = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                examples.append((entry["text"], entry["intent"]))
+    return examples
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    return round(float(np.percentile(values, q)), 3) if values else 0.0
+
+
+class FastPathIntentClassifier:
+    """
+    Drop-in ``classify()`` wrapper: local answer when confident, LLM otherwise
+
+    Returns ``IntentResult`` on the fast path and whatever the wrapped
+    classifier returns on the slow path (both expose intent, confidence,
+    entities and reasoning).
+    """
+
+    def __init__(
+        self,
+        llm,
+        local: LocalIntentClassifier,
+        threshold: float = 0.55,
+        intents: Iterable[str] = DEFAULT_FAST_INTENTS,
+        log_path: Optional[str] = None
+    ):
+        """
+        Args:
+            llm: Classifier the uncertain queries go to (Llama / legacy)
+            local: Trained local model
+            threshold: Minimum local confidence to skip the LLM
+            intents: Intents the local model may answer
+            log_path: JSONL file for LLM answers (relative to Backend/, None = off)
+        """
+        self.llm = llm
+        self.local = local
+        self.threshold = threshold
+        self.intents = frozenset(intents)
+        self.log_path = resolve_path(log_path)
+        self._log_lock = threading.Lock()
+        self._stats_lock = threading.Lock()  # classify() runs on executor threads
+        self.fast_hits = 0
+        self.llm_calls = 0
+        self.agreements = 0  # LLM calls where the local model had guessed the same intent
+        self._local_ms: deque = deque(maxlen=1000)
+        self._llm_ms: deque = deque(maxlen=1000)
+
+    def classify(self, text: str):
+        started = time.perf_counter()
+        prediction = self.local.predict(text)
+        local_ms = (time.perf_counter() - started) * 1000
+
+        if prediction.intent in self.intents and prediction.confidence >= self.threshold:
+            with self._stats_lock:
+                self._local_ms.append(local_ms)
+                self.fast_hits += 1
+            print(f"⚡ Local intent: {prediction.intent} ({prediction.confidence:.2f}, {local_ms:.2f} ms)")
+            return IntentResult(
+                intent=Intent(prediction.intent),
+                confidence=prediction.confidence,
+                reasoning=f"Local classifier: {prediction.neighbours} nearest examples "
+                          f"(similarity {prediction.similarity:.2f})",
+                entities=extract_entities(text),
+            )
+
+        started = time.perf_counter()
+        result = self.llm.classify(text)
+        llm_ms = (time.perf_counter() - started) * 1000
+        llm_intent = getattr(result.intent, "value", result.intent)
+        with self._stats_lock:
+            self._local_ms.append(local_ms)
+            self._llm_ms.append(llm_ms)
+            self.llm_calls += 1
+            self.agreements += llm_intent == prediction.intent
+        self._log(text, llm_intent, result, prediction)
+        return result
+
+    def _log(self, text: str, intent: str, result, prediction: LocalPrediction):
+        if not self.log_path:
+            return
+        entry = {
+            "ts": datetime.now().isoformat(timespec="seconds"),
+            "text": text,
+            "intent": intent,
+            "confidence": float(result.confidence),
+            "reasoning": result.reasoning,
+            "local_intent": prediction.intent,
+            "local_confidence": prediction.confidence,
+        }
+        try:
+            with self._log_lock:
+                os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"⚠️  Intent log write failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Fast-path share and latency per path"""
+        with self._stats_lock:
+            fast_hits, llm_calls, agreements = self.fast_hits, self.llm_calls, self.agreements
+            local_ms, llm_ms = list(self._local_ms), list(self._llm_ms)
+        total = fast_hits + llm_calls
+        return {
+            "examples": len(self.local),
+            "threshold": self.threshold,
+            "fast_intents": sorted(self.intents),
+            "fast_hits": fast_hits,
+            "llm_calls": llm_calls,
+            "fast_rate": round(fast_hits / total, 4) if total else 0.0,
+            "llm_agreement": round(agreements / llm_calls, 4) if llm_calls else None,
+            "local_ms_p50": _percentile(local_ms, 50),
+            "local_ms_p95": _percentile(local_ms, 95),
+            "llm_ms_p50": _percentile(llm_ms, 50),
+            "llm_ms_p95": _percentile(llm_ms, 95),
+            "log_path": self.log_path,
+        }
+
+
+# Active fast path (set by the agent)
+_fast_path: Optional[FastPathIntentClassifier] = None
+
+
+def build_fast_path(llm, config) -> FastPathIntentClassifier:
+    """Train the local model from the seeds plus learned examples and wrap ``llm``"""
+    global _fast_path
+    examples = SEED_EXAMPLES + load_examples(config.intent_examples_path)
+    started = time.perf_counter()
+    local = LocalIntentClassifier().fit(examples)
+    _fast_path = FastPathIntentClassifier(
+        llm,
+        local,
+        threshold=config.intent_fast_threshold,
+        intents=config.intent_fast_intents,
+        log_path=config.intent_log_path or None,
+    )
+    print(f"✅ Local intent fast path: {len(local)} examples, "
+          f"trained in {(time.perf_counter() - started) * 1000:.0f} ms "
+          f"(threshold {config.intent_fast_threshold})")
+    return _fast_path
+
+
+def fast_intent_stats() -> Optional[Dict[str, Any]]:
+    """Fast-path counters, or None if the agent doesn't use one"""
+    return _fast_path.stats() if _fast_path is not None else None
@@ -92,6 +92,25 @@ class LLMIntentClassifier:
         
         self.client = None
         self._initialize_client()
+        
+        # Repeated utterances skip the API (keyed by prompt/provider/model version)
+        from Backend.Voice_agent.core.intent_cache import cache_version, create_intent_cache
+        self._cache = create_intent_cache(
+            f"intent.{self.provider}",
+            cache_version(self.provider, self.model, self._create_classification_prompt("{text}")),
+            encode=lambda result: {
+                "intent": result.intent.value,
+                "confidence": result.confidence,
+                "reasoning": result.reasoning,
+                "entities": result.entities or {},
+            },
+            decode=lambda data: IntentResult(
+                intent=Intent(data["intent"]),
+                confidence=data["confidence"],
+                reasoning=data["reasoning"],
+                entities=data["entities"],
+            ),
+        )
     
     def _initialize_client(self):
         """Initialize LLM client based on provider"""
@@ -155,24 +174,29 @@ class LLMIntentClassifier:
         Returns:
             IntentResult with detected intent and confidence
         """
-        # Create prompt for intent classification
-        prompt = self._create_classification_prompt(text)
-        
         try:
-            # Get LLM response
-            if self.provider == "groq":
-                response = self._classify_with_groq(prompt)
-            else:  # gemini
-                response = self._classify_with_gemini(prompt)
-            
-            # Parse response
-            intent_result = self._parse_llm_response(response)
-            return intent_result
+            if self._cache is not None:
+                return self._cache.get_or_classify(text, self._classify_uncached)
+            return self._classify_uncached(text)
             
         except Exception as e:
             print(f"⚠️  LLM classification error: {e}, using fallback")
             return self._fallback_classify(text)
     
+    def _classify_uncached(self, text: str) -> IntentResult:
+        """Call the LLM and parse its answer (raises on API errors)"""
+        # Create prompt for intent classification
+        prompt = self._create_classification_prompt(text)
+        
+        # Get LLM response
+        if self.provider == "groq":
+            response = self._classify_with_groq(prompt)
+        else:  # gemini
+            response = self._classify_with_gemini(prompt)
+        
+        # Parse response
+        return self._parse_llm_response(response)
+    
     def _create_classification_prompt(self, text: str) -> str:
         """Create prompt for intent classification"""
         intents_list = "\n".join([
@@ -0,0 +1,164 @@
+"""
+Intent Result Cache
+Persistent cache in front of the LLM intent classifiers. Results are keyed
+by a hash of the normalised utterance plus a version derived from the
+prompt, output schema and model, so changing any of them invalidates old
+entries. Entries expire after a TTL, and concurrent requests for the same
+utterance share a single upstream call.
+
+Only real LLM answers are stored; keyword fallbacks and unparseable
+outputs (intent "unknown") are never cached.
+"""
+
+import hashlib
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+from Backend.utils.kv_cache import TwoTierCache
+from Backend.Voice_agent.core.fast_intent import normalize, normalize_entities
+
+# Bump when parsing / post-processing of LLM output changes
+CACHE_FORMAT_VERSION = 1
+
+
+def cache_version(*parts: str) -> str:
+    """Short fingerprint of everything that shapes a classification"""
+    digest = hashlib.sha256(str(CACHE_FORMAT_VERSION).encode())
+    for part in parts:
+        digest.update(b"\0" + part.encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+class IntentResultCache:
+    """
+    Cache + in-flight coalescing around one classifier
+
+    ``encode`` turns a result into a JSON-able dict and ``decode`` rebuilds
+    it, so each classifier keeps its own result type.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        version: str,
+        encode: Callable[[Any], Dict[str, Any]],
+        decode: Callable[[Dict[str, Any]], Any],
+        path: Optional[str] = None,
+        max_entries: int = 4096,
+        ttl_s: Optional[float] = None
+    ):
+        """
+        Args:
+            namespace: Key space in the shared cache file
+            version: Fingerprint of prompt / schema / model (see cache_version)
+            encode: Result -> dict
+            decode: dict -> result
+            path: SQLite file; relative to Backend/, None for memory only
+            max_entries: In-process LRU capacity
+            ttl_s: Entry lifetime in seconds
+        """
+        self.version = version
+        self.encode = encode
+        self.decode = decode
+        self._cache = TwoTierCache(namespace, path, max_entries=max_entries, ttl_s=ttl_s)
+        self._cache.purge_expired()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+        self.upstream_calls = 0
+
+    def key(self, text: str) -> str:
+        digest = hashlib.sha256(normalize(text).encode("utf-8")).hexdigest()[:32]
+        return f"{self.version}:{digest}"
+
+    def _lookup(self, key: str):
+        cached = self._cache.get(key)
+        return self.decode(json.loads(cached)) if cached is not None else None
+
+    def get_or_classify(self, text: str, classify: Callable[[str], Any]):
+        """
+        Cached result for ``text``, or ``classify(text)`` (run once even when
+        several threads ask for the same utterance at the same time).
+        Exceptions from ``classify`` propagate to every waiting caller.
+        """
+        key = self.key(text)
+        result = self._lookup(key)
+        if result is not None:
+            return result
+
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        if not owner:
+            self.coalesced += 1
+            return future.result()
+
+        try:
+            # Another thread may have stored it between the lookup and the lock
+            result = self._lookup(key)
+            if result is None:
+                self.upstream_calls += 1
+                result = classify(text)
+                if hasattr(result, "entities"):
+                    result.entities = normalize_entities(result.entities)
+                if getattr(result.intent, "value", result.intent) != "unknown":
+                    self._cache.set(key, json.dumps(self.encode(result), ensure_ascii=False))
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters per tier, coalesced requests and upstream calls"""
+        stats = self._cache.stats()
+        stats.update({
+            "version": self.version,
+            "coalesced": self.coalesced,
+            "upstream_calls": self.upstream_calls,
+        })
+        return stats
+
+
+# Caches created by the classifiers, by namespace (for /health and /metrics)
+_caches: Dict[str, IntentResultCache] = {}
+
+
+def create_intent_cache(
+    namespace: str,
+    version: str,
+    encode: Callable[[Any], Dict[str, Any]],
+    decode: Callable[[Dict[str, Any]], Any]
+) -> Optional[IntentResultCache]:
+    """Cache configured from VoiceAgentConfig, or None when disabled"""
+    from Backend.Voice_agent.config import get_config
+    config = get_config()
+    if not config.intent_cache:
+        return None
+    cache = IntentResultCache(
+        namespace,
+        version,
+        encode,
+        decode,
+        path=config.intent_cache_path or None,
+        max_entries=config.intent_cache_size,
+        ttl_s=config.intent_cache_ttl_hours * 3600 if config.intent_cache_ttl_hours > 0 else None,
+    )
+    _caches[namespace] = cache
+    return cache
+
+
+def intent_cache_stats() -> Optional[Dict[str, Any]]:
+    """Stats per classifier cache, or None if no classifier has one yet"""
+    return {namespace: cache.stats() for namespace, cache in _caches.items()} or None
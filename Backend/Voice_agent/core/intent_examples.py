@@ -0,0 +1,138 @@
+"""
+Intent Examples
+Labelled utterances the local intent classifier is trained on: the
+phrasings from auto_test_intents.py, the examples in the Intent enum
+comments and the LLM prompts, plus common paraphrases. Queries reach the
+classifier after Hindi -> English translation, so most examples are
+English; the Hindi ones cover untranslated (fallback) input.
+
+Production logs add to these (see train_intent_classifier.py).
+"""
+
+from typing import List, Tuple
+
+SEED_EXAMPLES: List[Tuple[str, str]] = [
+    # Market price
+    ("what is the price of onion", "market_price"),
+    ("what is the onion price today", "market_price"),
+    ("tell me the wheat price", "market_price"),
+    ("what is the market rate of wheat", "market_price"),
+    ("what is the mandi price of soybean", "market_price"),
+    ("what are today's mandi rates", "market_price"),
+    ("how much is cotton selling for in the market", "market_price"),
+    ("current price of rice in the market", "market_price"),
+    ("tell me the market price", "market_price"),
+    ("what is the rate of maize today", "market_price"),
+    ("what is the price of potato in the mandi", "market_price"),
+    ("market price of tomato", "market_price"),
+    ("what price is onion getting in lasalgaon", "market_price"),
+    ("show me crop prices", "market_price"),
+    ("prices of onion", "market_price"),
+    ("प्याज की कीमत क्या है", "market_price"),
+    ("गेहूं का भाव क्या है", "market_price"),
+    ("मंडी भाव बताओ", "market_price"),
+    ("आज सोयाबीन का रेट क्या है", "market_price"),
+
+    # Weather
+    ("how is the weather today", "weather_query"),
+    ("what is the weather", "weather_query"),
+    ("will it rain tomorrow", "weather_query"),
+    ("is rain expected this week", "weather_query"),
+    ("what is the temperature today", "weather_query"),
+    ("tell me the weather forecast", "weather_query"),
+    ("how will the weather be tomorrow", "weather_query"),
+    ("will there be rain in the evening", "weather_query"),
+    ("is it going to be hot today", "weather_query"),
+    ("weather in pune", "weather_query"),
+    ("how much rain will fall", "weather_query"),
+    ("what is the humidity today", "weather_query"),
+    ("tell me today's weather", "weather_query"),
+    ("आज मौसम कैसा रहेगा", "weather_query"),
+    ("क्या कल बारिश होगी", "weather_query"),
+    ("मौसम बताओ", "weather_query"),
+    ("आज तापमान कितना है", "weather_query"),
+
+    # Stock
+    ("how much stock do i have", "check_stock"),
+    ("what is my stock", "check_stock"),
+    ("show my inventory", "check_stock"),
+    ("how much wheat is in my storage", "check_stock"),
+    ("check my stock", "check_stock"),
+    ("how much onion do i have stored", "check_stock"),
+    ("what is left in my godown", "check_stock"),
+    ("tell me my current stock", "check_stock"),
+    ("how many quintals do i have in stock", "check_stock"),
+    ("what crops are in my inventory", "check_stock"),
+    ("show stored produce", "check_stock"),
+    ("how much is my stock", "check_stock"),
+    ("मेरा स्टॉक कितना है", "check_stock"),
+    ("गोदाम में कितना माल है", "check_stock"),
+    ("मेरा स्टॉक दिखाओ", "check_stock"),
+
+    # Alerts
+    ("are there any alerts", "check_alerts"),
+    ("do i have any alerts", "check_alerts"),
+    ("is there an alert for me", "check_alerts"),
+    ("show my alerts", "check_alerts"),
+    ("any notifications for me", "check_alerts"),
+    ("check my alerts", "check_alerts"),
+    ("are there any warnings", "check_alerts"),
+    ("do i have new notifications", "check_alerts"),
+    ("show pending alerts", "check_alerts"),
+    ("any alert today", "check_alerts"),
+    ("is there an alert", "check_alerts"),
+    ("अलर्ट है क्या", "check_alerts"),
+    ("मेरे लिए कोई अलर्ट है", "check_alerts"),
+    ("कोई सूचना है क्या", "check_alerts"),
+
+    # Intents that stay with the LLM (they need entities or reasoning);
+    # present so the local model can tell them apart
+    ("which crop should i plant", "crop_planning"),
+    ("which crop should i sow this season", "crop_planning"),
+    ("what should i grow in kharif", "crop_planning"),
+    ("कौनसी फसल बोऊं", "crop_planning"),
+    ("should i sell now", "sell_recommendation"),
+    ("should i sell my stored wheat now or wait", "sell_recommendation"),
+    ("अभी बेचूं", "sell_recommendation"),
+    ("should i sell my onions at this price", "selling_decision"),
+    ("is it a good time to sell soybean", "selling_decision"),
+    ("how should i store onions", "storage_decision"),
+    ("should i store my crop or sell it", "storage_decision"),
+    ("which stock is going to spoil", "spoilage_alert"),
+    ("tell me the goods that will go bad", "spoilage_alert"),
+    ("खराब होने वाला माल", "spoilage_alert"),
+    ("what should i do tomorrow", "reminder_check"),
+    ("what are my tasks for tomorrow", "reminder_check"),
+    ("कल क्या करूं", "reminder_check"),
+    ("tell me my profit", "finance_report"),
+    ("show my profit and loss", "finance_report"),
+    ("मेरा मुनाफा बताओ", "finance_report"),
+    ("i spent 5000 on seeds", "add_expense"),
+    ("add an expense of 2000 for fertilizer", "add_expense"),
+    ("मैंने 5000 बीज पर खर्च किए", "add_expense"),
+    ("i sold wheat for 50000", "add_income"),
+    ("मैंने गेहूं बेची", "add_income"),
+    ("where am i spending the most", "cost_analysis"),
+    ("कहां खर्च ज्यादा है", "cost_analysis"),
+    ("how can i reduce my costs", "optimization_advice"),
+    ("खर्च कम कैसे करूं", "optimization_advice"),
+    ("show equipment available nearby", "view_marketplace"),
+    ("आसपास उपकरण देखो", "view_marketplace"),
+    ("i need a tractor on rent", "equipment_rental"),
+    ("ट्रैक्टर चाहिए", "equipment_rental"),
+    ("i want to do cooperative farming", "land_pooling"),
+    ("साझे में खेती करनी है", "land_pooling"),
+    ("i want to sell stubble", "residue_management"),
+    ("पराली बेचनी है", "residue_management"),
+    ("tell me about pm kisan scheme", "government_scheme"),
+    ("which government schemes am i eligible for", "government_scheme"),
+    ("the leaves are turning yellow", "disease_diagnosis"),
+    ("पत्ते पीले हो रहे हैं", "disease_diagnosis"),
+    ("how do i treat leaf blight", "disease_treatment"),
+    ("which fertilizer should i use for wheat", "fertilizer_advice"),
+    ("how often should i water cotton", "irrigation_advice"),
+    ("when should i harvest", "harvest_timing"),
+    ("कटाई कब करूं", "harvest_timing"),
+    ("how do i store grain after harvest", "post_harvest_query"),
+    ("भंडारण कैसे करूं", "post_harvest_query"),
+]
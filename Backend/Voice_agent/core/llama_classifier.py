@@ -10,6 +10,7 @@ from voice_agent.schemas.intent_schemas import (
     Intent,
     EntityExtractionSchema
 )
+from Backend.Voice_agent.core.intent_cache import cache_version, create_intent_cache
 import json
 import os
 from typing import Dict, Any
@@ -39,6 +40,22 @@ class Llama2IntentClassifier:
         # Use Llama 3.1 8B Instant - smaller, faster model for basic intent classification
         self.model = model or "llama-3.1-8b-instant"
         
+        # The system prompt is static; build it once
+        self._system_prompt = self._create_system_prompt()
+        
+        # Repeated utterances skip the API (keyed by prompt/schema/model version)
+        self._cache = create_intent_cache(
+            "intent.llama",
+            cache_version(
+                self.model,
+                self._system_prompt,
+                self._create_user_prompt("{text}"),
+                json.dumps(IntentClassificationResult.model_json_schema(), sort_keys=True),
+            ),
+            encode=lambda result: result.model_dump(mode="json"),
+            decode=IntentClassificationResult.model_validate,
+        )
+        
         print(f"✅ Llama 3.1 8B Intent Classifier initialized")
         print(f"   Model: {self.model} (lightweight & fast)")
         print(f"   Provider: Groq API")
@@ -55,26 +72,11 @@ class Llama2IntentClassifier:
         """
         print(f"\n🎯 Classifying intent with Llama 3.1 8B: '{transcribed_text}'")
         
-        # Create strict prompt with Pydantic schema
-        system_prompt = self._create_system_prompt()
-        user_prompt = self._create_user_prompt(transcribed_text)
-        
         try:
-            # Call Groq Llama 3.1 8B API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.1,  # Low temp for consistent classification
-                max_tokens=400,
-                top_p=0.9
-            )
-            
-            # Extract and validate response
-            llm_output = response.choices[0].message.content
-            intent_result = self._parse_and_validate(llm_output)
+            if self._cache is not None:
+                intent_result = self._cache.get_or_classify(transcribed_text, self._classify_uncached)
+            else:
+                intent_result = self._classify_uncached(transcribed_text)
             
             print(f"✅ Intent classified: {intent_result.intent}")
             print(f"   Confidence: {intent_result.confidence:.2f}")
@@ -86,6 +88,32 @@ class Llama2IntentClassifier:
             print(f"❌ Llama 3.1 8B classification error: {e}")
             return self._fallback_classify(transcribed_text)
     
+    def _classify_uncached(self, transcribed_text: str) -> IntentClassificationResult:
+        """Call the Groq API and validate its output (raises on API errors)"""
+        # Create strict prompt with Pydantic schema
+        system_prompt = self._system_prompt
+        user_prompt = self._create_user_prompt(transcribed_text)
+        
+        # Call Groq Llama 3.1 8B API
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=0.1,  # Low temp for consistent classification
+            max_tokens=400,
+            top_p=0.9
+        )
+        
+        # Extract and validate response
+        llm_output = response.choices[0].message.content
+        return self._parse_and_validate(llm_output)
+    
+    def cache_stats(self):
+        """Intent cache counters, or None when caching is disabled"""
+        return self._cache.stats() if self._cache is not None else None
+    
     def _create_system_prompt(self) -> str:
         """Create system prompt with Pydantic schema and all intent descriptions"""
         
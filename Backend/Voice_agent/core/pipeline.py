@@ -0,0 +1,140 @@
+"""
+Stage Pipeline
+Runs the steps of a voice turn as a dependency graph: every stage starts
+as soon as the stages it needs have finished, so independent work
+(loading the session while translating, English and Hindi explanations,
+weather and market fetches) overlaps instead of queueing.
+
+Blocking stages go through a ``run(lane, fn, *args)`` coroutine - the API
+passes ``run_blocking`` so each stage lands on the right executor lane;
+outside the API they run on ``asyncio.to_thread``.
+"""
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from Backend.utils.timing import span
+
+Runner = Callable[..., Awaitable[Any]]
+
+
+async def run_in_thread(lane: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Default runner: a plain worker thread (lane is ignored)"""
+    return await asyncio.to_thread(fn, *args, **kwargs)
+
+
+@dataclass
+class Stage:
+    """One node of the graph"""
+    name: str
+    fn: Callable[[Dict[str, Any]], Any]  # receives results of finished stages
+    deps: Tuple[str, ...] = ()
+    lane: Optional[str] = "voice"  # None = cheap, run inline on the event loop
+
+
+class StagePipeline:
+    """
+    Dependency-graph executor for one request
+
+    Stage functions take the dict of results so far and return their own
+    result. A coroutine function is awaited directly (and may fan out
+    further with ``call()``); anything else runs through the runner on the
+    stage's lane. ``timings`` holds, per stage, when it started relative to
+    the pipeline and how long it ran.
+    """
+
+    def __init__(self, run: Optional[Runner] = None, span_prefix: str = "voice"):
+        self.run = run or run_in_thread
+        self.span_prefix = span_prefix
+        self.stages: Dict[str, Stage] = {}
+        self.results: Dict[str, Any] = {}
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self.total_ms = 0.0
+        self._started = 0.0
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[[Dict[str, Any]], Any],
+        deps: Tuple[str, ...] = (),
+        lane: Optional[str] = "voice"
+    ) -> "StagePipeline":
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage '{name}'")
+        self.stages[name] = Stage(name=name, fn=fn, deps=tuple(deps), lane=lane)
+        return self
+
+    async def call(self, name: str, lane: Optional[str], fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run and time one unit of work (a stage, or a sub-step inside one)"""
+        started = time.perf_counter()
+        with span(f"{self.span_prefix}.{name}"):
+            if inspect.iscoroutinefunction(fn):
+                result = await fn(*args, **kwargs)
+            elif lane is None:
+                result = fn(*args, **kwargs)
+            else:
+                result = await self.run(lane, fn, *args, **kwargs)
+        finished = time.perf_counter()
+        self.timings[name] = {
+            "start_ms": round((started - self._started) * 1000, 1),
+            "duration_ms": round((finished - started) * 1000, 1),
+        }
+        return result
+
+    def _validate(self):
+        for stage in self.stages.values():
+            for dep in stage.deps:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+
+        visiting, done = set(), set()
+
+        def visit(name: str):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle at stage '{name}'")
+            visiting.add(name)
+            for dep in self.stages[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.stages:
+            visit(name)
+
+    async def execute(self) -> Dict[str, Any]:
+        """
+        Run every stage; returns the results keyed by stage name.
+        The first failing stage cancels whatever is still running and its
+        exception is raised.
+        """
+        self._validate()
+        self._started = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(stage: Stage):
+            if stage.deps:
+                await asyncio.gather(*(tasks[dep] for dep in stage.deps))
+            self.results[stage.name] = await self.call(stage.name, stage.lane, stage.fn, self.results)
+
+        for stage in self.stages.values():
+            tasks[stage.name] = asyncio.ensure_future(run_stage(stage))
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        self.total_ms = round((time.perf_counter() - self._started) * 1000, 1)
+        return self.results
+
+    def timings_ms(self) -> Dict[str, float]:
+        """Stage name -> duration, in the order stages started"""
+        ordered = sorted(self.timings.items(), key=lambda item: item[1]["start_ms"])
+        return {name: t["duration_ms"] for name, t in ordered}
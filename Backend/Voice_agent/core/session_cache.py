@@ -0,0 +1,214 @@
+"""
+Session Context Cache
+Bounded store for the agent's live ``ConversationContext`` objects.
+
+Contexts carry their full conversation history and card dicts, so an
+unbounded per-session dict grows with every session a worker has served.
+This cache evicts the least recently used context once it holds
+``max_sessions`` contexts or ``max_bytes`` (estimated), and any context idle
+for ``idle_ttl_s``. A context that changed since it was last saved is
+written back to session memory before it is dropped, so eviction never
+loses a turn.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from Backend.Voice_agent.core.context import ConversationContext
+
+
+def estimate_size(context: ConversationContext) -> int:
+    """Approximate resident size: bytes of the context serialised as JSON"""
+    return len(json.dumps(context.to_dict(), default=str, ensure_ascii=False).encode("utf-8"))
+
+
+class _Entry:
+    __slots__ = ("context", "size", "last_access", "saved_at")
+
+    def __init__(self, context: ConversationContext, size: int, now: float):
+        self.context = context
+        self.size = size
+        self.last_access = now
+        self.saved_at = None  # context.last_updated at the last save
+
+
+class SessionContextCache:
+    """LRU + idle-TTL cache of conversation contexts with write-back on eviction"""
+
+    def __init__(
+        self,
+        max_sessions: int = 1000,
+        idle_ttl_s: float = 1800,
+        max_bytes: int = 64 * 1024 * 1024,
+        write_back: Optional[Callable[[ConversationContext], None]] = None
+    ):
+        """
+        Args:
+            max_sessions: Contexts kept before the least recently used is evicted
+            idle_ttl_s: Contexts untouched this long are evicted (0 = never)
+            max_bytes: Estimated total size kept (0 = unbounded)
+            write_back: Saves an evicted context that has unsaved changes
+        """
+        self.max_sessions = max_sessions
+        self.idle_ttl_s = idle_ttl_s
+        self.max_bytes = max_bytes
+        self.write_back = write_back
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.write_backs = 0
+        self.write_back_failures = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        return bool(self.idle_ttl_s) and now - entry.last_access > self.idle_ttl_s
+
+    def get(self, session_id: str) -> Optional[ConversationContext]:
+        evicted = []
+        with self._lock:
+            now = time.monotonic()
+            entry = self._entries.get(session_id)
+            if entry is not None and self._expired(entry, now):
+                evicted.append(self._remove(session_id))
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                entry.last_access = now
+                self._entries.move_to_end(session_id)
+        self._write_back(evicted)
+        return entry.context if entry is not None else None
+
+    def put(self, context: ConversationContext):
+        """Add or refresh a context (re-estimates its size) and evict over the limits"""
+        size = estimate_size(context)
+        with self._lock:
+            now = time.monotonic()
+            session_id = context.session_id
+            entry = self._entries.get(session_id)
+            if entry is not None and entry.context is context:
+                self._bytes += size - entry.size
+                entry.size = size
+                entry.last_access = now
+                self._entries.move_to_end(session_id)
+                evicted = []
+            else:
+                # A different object for the same session replaces the old one
+                evicted = [self._remove(session_id)] if entry is not None else []
+                self._entries[session_id] = _Entry(context, size, now)
+                self._bytes += size
+            evicted += self._evict(now)
+        self._write_back(evicted)
+
+    def mark_saved(self, context: ConversationContext):
+        """Record that session memory holds this context as of now"""
+        with self._lock:
+            entry = self._entries.get(context.session_id)
+            if entry is not None and entry.context is context:
+                entry.saved_at = context.last_updated
+
+    def pop(self, session_id: str) -> Optional[ConversationContext]:
+        """Drop a context without writing it back (the session was cleared)"""
+        with self._lock:
+            entry = self._entries.pop(session_id, None)
+            if entry is None:
+                return None
+            self._bytes -= entry.size
+            return entry.context
+
+    def sweep(self) -> int:
+        """Evict every idle context; returns how many were evicted"""
+        with self._lock:
+            evicted = self._evict(time.monotonic())
+        self._write_back(evicted)
+        return len(evicted)
+
+    def _remove(self, session_id: str) -> _Entry:
+        entry = self._entries.pop(session_id)
+        self._bytes -= entry.size
+        return entry
+
+    def _evict(self, now: float) -> list:
+        """Expired contexts first, then least recently used over the limits (lock held)"""
+        evicted = []
+        if self.idle_ttl_s:
+            # Entries are in access order: stop at the first live one
+            for session_id, entry in list(self._entries.items()):
+                if not self._expired(entry, now):
+                    break
+                evicted.append(self._remove(session_id))
+                self.expirations += 1
+        while self._entries and (
+            len(self._entries) > self.max_sessions or (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            if len(self._entries) == 1:
+                break  # always keep the context just used, however large
+            evicted.append(self._remove(next(iter(self._entries))))
+            self.evictions += 1
+        return evicted
+
+    def _write_back(self, entries: list):
+        """Save evicted contexts with unsaved changes (outside the lock)"""
+        if not self.write_back:
+            return
+        for entry in entries:
+            if entry.saved_at is not None and entry.saved_at >= entry.context.last_updated:
+                continue
+            try:
+                self.write_back(entry.context)
+                self.write_backs += 1
+            except Exception as e:
+                self.write_back_failures += 1
+                print(f"⚠️  Failed to write back session {entry.context.session_id}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Resident sessions and bytes, hit rate and eviction counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "sessions": len(self._entries),
+                "max_sessions": self.max_sessions,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "idle_ttl_s": self.idle_ttl_s,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "write_backs": self.write_backs,
+                "write_back_failures": self.write_back_failures,
+            }
+
+
+# Active cache (set by the agent)
+_session_cache: Optional[SessionContextCache] = None
+
+
+def create_session_cache(config, write_back: Callable[[ConversationContext], None]) -> SessionContextCache:
+    """Session cache sized from the agent config"""
+    global _session_cache
+    _session_cache = SessionContextCache(
+        max_sessions=config.active_context_max_sessions,
+        idle_ttl_s=config.active_context_idle_ttl_s,
+        max_bytes=int(config.active_context_max_mb * 1024 * 1024),
+        write_back=write_back,
+    )
+    return _session_cache
+
+
+def session_cache_stats() -> Optional[Dict[str, Any]]:
+    """Session cache stats, or None if no agent was created"""
+    return _session_cache.stats() if _session_cache is not None else None
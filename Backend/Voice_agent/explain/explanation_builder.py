@@ -2,10 +2,13 @@
 Explanation Builder - Generates simple, spoken-style explanations
 """
 
+import re
 from typing import List, Dict, Any
 from Backend.Voice_agent.core.intent import Intent
 from Backend.Voice_agent.input_processing.translator import get_translator
 
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
 
 class ExplanationBuilder:
     """Builds simple, farmer-friendly explanations"""
@@ -43,9 +46,11 @@ class ExplanationBuilder:
         else:
             explanation = reasoning
         
-        # Translate to Hindi if needed
+        # Translate to Hindi if needed. Sentence by sentence: the template
+        # sentences recur across turns and come straight from the cache
         if language == "hindi":
-            explanation = self.translator.english_to_hindi(explanation)
+            sentences = [part for part in _SENTENCE_END.split(explanation.strip()) if part]
+            explanation = " ".join(self.translator.translate_batch(sentences, from_code="en", to_code="hi"))
         
         return explanation
     
@@ -0,0 +1,80 @@
+"""
+Index Knowledge
+Indexes the Mongo master collections into the agent's vector store.
+See retrieval/knowledge_ingest.py.
+
+Re-runs are incremental: documents whose content hash is unchanged are
+skipped, and documents removed from Mongo are deleted from the index.
+
+Usage (from the repository root):
+    python -m Backend.Voice_agent.index_knowledge
+    python -m Backend.Voice_agent.index_knowledge --collections schemes_master --batch-size 64
+    python -m Backend.Voice_agent.index_knowledge --full
+"""
+
+import argparse
+import sys
+import time
+
+from Backend.database.connection import DB_NAME, MONGO_DETAILS, db
+from Backend.Voice_agent.config import get_config
+from Backend.Voice_agent.retrieval.knowledge_ingest import KNOWLEDGE_SPECS, ingest_knowledge
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Index Mongo master collections into the vector store")
+    parser.add_argument(
+        "--collections", nargs="+", choices=[spec.collection for spec in KNOWLEDGE_SPECS],
+        help="Collections to index (default: all)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=get_config().knowledge_ingest_batch_size,
+        help="Documents per embedding batch"
+    )
+    parser.add_argument("--full", action="store_true", help="Re-embed every document, ignoring content hashes")
+    parser.add_argument("--mongo-uri", default=MONGO_DETAILS)
+    parser.add_argument("--db-name", default=DB_NAME)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("📚 KNOWLEDGE INDEX")
+    print("=" * 70)
+
+    try:
+        if not db.connect_sync(args.mongo_uri, args.db_name):
+            print(f"❌ MongoDB not reachable at {args.mongo_uri}")
+            return 1
+
+        from Backend.Voice_agent.retrieval.vector_store import get_vector_store
+        store = get_vector_store()
+
+        started = time.perf_counter()
+        results = ingest_knowledge(
+            store,
+            db.get_sync_database(),
+            collections=args.collections,
+            batch_size=args.batch_size,
+            full=args.full,
+        )
+        seconds = time.perf_counter() - started
+
+        print(f"\n{'collection':<18}{'scanned':>9}{'embedded':>10}{'unchanged':>11}{'skipped':>9}"
+              f"{'deleted':>9}{'failed':>8}{'docs/s':>9}")
+        for collection, c in results.items():
+            print(f"{collection:<18}{c['scanned']:>9}{c['embedded']:>10}{c['unchanged']:>11}{c['skipped']:>9}"
+                  f"{c['deleted']:>9}{c['failed']:>8}{c['docs_per_s']:>9}")
+        scanned = sum(c["scanned"] for c in results.values())
+        skipped = sum(c["skipped"] for c in results.values())
+        failed = sum(c["failed"] for c in results.values())
+        print(f"\n{'⚠️ ' if failed or skipped else '✅'} {scanned} documents in {seconds:.1f}s "
+              f"({scanned / seconds if seconds else 0:.0f} docs/s), {skipped} skipped, {failed} failed")
+        return 1 if failed or skipped else 0
+    except Exception as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        db.close_db()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,27 @@
 """Input processing package"""
 
-from Backend.Voice_agent.input_processing.speech_to_text import WhisperSTT, get_speech_to_text
+from Backend.Voice_agent.input_processing.speech_to_text import (
+    STTBackend,
+    WhisperSTT,
+    WhisperPool,
+    STTBusyError,
+    decode_audio,
+    create_stt_backend,
+    get_speech_to_text,
+)
+from Backend.Voice_agent.input_processing.vad import EnergyVAD, VADResult, get_vad
 from Backend.Voice_agent.input_processing.translator import ArgosTranslator, get_translator
 
 __all__ = [
+    "STTBackend",
     "WhisperSTT",
+    "WhisperPool",
+    "STTBusyError",
+    "decode_audio",
+    "create_stt_backend",
+    "EnergyVAD",
+    "VADResult",
+    "get_vad",
     "get_speech_to_text",
     "ArgosTranslator",
     "get_translator",
@@ -0,0 +1,160 @@
+"""
+Argos Model Provisioning
+Fetches the Hindi <-> English Argos Translate packages once, unpacks them
+into a local directory and pins their versions in ``manifest.json``. At
+runtime the translator loads from that directory without touching the
+network (no package-index update, no downloads).
+
+Provision with ``python -m Backend.Voice_agent.provision_translation_models``,
+then copy the directory to offline nodes and point ARGOS_MODELS_DIR at it.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from Backend.utils.lazy_import import lazy_import
+
+argos_package = lazy_import("argostranslate.package")
+argos_settings = lazy_import("argostranslate.settings")
+
+# Translation directions the voice agent needs
+ARGOS_PAIRS = (("hi", "en"), ("en", "hi"))
+
+MANIFEST_NAME = "manifest.json"
+DEFAULT_MODELS_DIR = "models/argos"  # relative to Backend/
+
+
+def read_manifest(models_dir: str) -> Optional[Dict[str, Any]]:
+    """Pinned package list, or None if the directory was never provisioned"""
+    path = os.path.join(models_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def verify_models_dir(models_dir: str) -> Dict[str, Any]:
+    """
+    Check that every pinned package is unpacked with the pinned version
+
+    Raises:
+        RuntimeError: missing manifest, package, direction or version mismatch
+    """
+    manifest = read_manifest(models_dir)
+    if manifest is None:
+        raise RuntimeError(
+            f"No provisioned Argos models in {models_dir} "
+            f"(run: python -m Backend.Voice_agent.provision_translation_models provision)"
+        )
+
+    directions = set()
+    for pinned in manifest["packages"]:
+        metadata_path = os.path.join(models_dir, pinned["directory"], "metadata.json")
+        if not os.path.exists(metadata_path):
+            raise RuntimeError(f"Pinned package missing: {pinned['directory']}")
+        with open(metadata_path, encoding="utf-8") as f:
+            metadata = json.load(f)
+        if metadata.get("package_version") != pinned["package_version"]:
+            raise RuntimeError(
+                f"{pinned['directory']}: version {metadata.get('package_version')} "
+                f"does not match pinned {pinned['package_version']}"
+            )
+        directions.add((pinned["from_code"], pinned["to_code"]))
+
+    missing = [f"{a}->{b}" for a, b in ARGOS_PAIRS if (a, b) not in directions]
+    if missing:
+        raise RuntimeError(f"Provisioned models lack {', '.join(missing)}")
+    return manifest
+
+
+def use_models_dir(models_dir: str) -> Dict[str, Any]:
+    """
+    Point Argos at the provisioned directory (call before the first
+    translation). Verifies the pins and returns the manifest.
+    """
+    manifest = verify_models_dir(models_dir)
+    # Read by argostranslate.settings at import; adjust the live list too in
+    # case Argos was already imported
+    os.environ["ARGOS_PACKAGES_DIR"] = models_dir
+    package_dirs = argos_settings.package_dirs
+    if Path(models_dir) not in package_dirs:
+        package_dirs.insert(0, Path(models_dir))
+    return manifest
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _unpack(archive: str, models_dir: str) -> Dict[str, Any]:
+    """Extract one .argosmodel into ``models_dir``; returns its manifest entry"""
+    with tempfile.TemporaryDirectory(dir=models_dir) as tmp:
+        with zipfile.ZipFile(archive) as zf:
+            zf.extractall(tmp)
+        (directory,) = [d for d in os.listdir(tmp) if os.path.isdir(os.path.join(tmp, d))]
+        with open(os.path.join(tmp, directory, "metadata.json"), encoding="utf-8") as f:
+            metadata = json.load(f)
+
+        target = os.path.join(models_dir, directory)
+        if os.path.exists(target):
+            shutil.rmtree(target)
+        shutil.move(os.path.join(tmp, directory), target)
+
+    return {
+        "type": metadata.get("type", "translate"),
+        "from_code": metadata.get("from_code"),
+        "to_code": metadata.get("to_code"),
+        "package_version": metadata.get("package_version"),
+        "directory": directory,
+        "archive": os.path.basename(archive),
+        "sha256": _sha256(archive),
+    }
+
+
+def _download_archives() -> List[str]:
+    """Fetch the index once and download the packages the pairs need"""
+    argos_package.update_package_index()
+    available = argos_package.get_available_packages()
+
+    archives = []
+    for from_code, to_code in ARGOS_PAIRS:
+        pkg = next((p for p in available if p.from_code == from_code and p.to_code == to_code), None)
+        if pkg is None:
+            raise RuntimeError(f"Argos index has no {from_code}->{to_code} package")
+        print(f"⬇️  {from_code}->{to_code} v{pkg.package_version}")
+        archives.append(str(pkg.download()))
+
+    # Without stanza, Argos splits sentences with its own sbd package
+    if not argos_settings.stanza_available:
+        archives.extend(str(p.download()) for p in available if p.type == "sbd")
+    return archives
+
+
+def provision(models_dir: str, archives: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Unpack the hi<->en packages into ``models_dir`` and write the manifest
+
+    Args:
+        models_dir: Target directory (created if needed)
+        archives: Local .argosmodel files; downloaded when not given
+    """
+    os.makedirs(models_dir, exist_ok=True)
+    archives = archives or _download_archives()
+    packages = [_unpack(archive, models_dir) for archive in archives]
+
+    manifest = {"provisioned_at": datetime.now().isoformat(timespec="seconds"), "packages": packages}
+    with open(os.path.join(models_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    verify_models_dir(models_dir)
+    return manifest
@@ -1,20 +1,121 @@
 """
 Speech-to-Text Module - Whisper Implementation
 Uses OpenAI Whisper for Hindi speech recognition
+
+Backends (STT_BACKEND):
+    openai-whisper  - reference PyTorch implementation, FP32 on CPU
+    faster-whisper  - CTranslate2 runtime, int8-quantized on CPU
 """
 
-import whisper
 import numpy as np
-from typing import Union, Optional
+from abc import ABC, abstractmethod
+from typing import Union, Optional, Dict, Any
+from contextlib import contextmanager
+import functools
 import io
+import queue
+import subprocess
+import threading
+import time
+import wave
+
+from Backend.utils.lazy_import import lazy_import
+
+# Whisper pulls in torch; load it with the first model, not at import
+whisper = lazy_import("whisper")
+
+SAMPLE_RATE = 16000  # Whisper's expected input rate
+
+
+@functools.lru_cache(maxsize=None)
+def _require_ffmpeg():
+    """Check for FFmpeg once per process (needed for non-WAV audio)"""
+    try:
+        subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True, timeout=5)
+    except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        raise RuntimeError(
+            "FFmpeg not found. Whisper requires FFmpeg to process audio.\\n"
+            "Install FFmpeg: https://ffmpeg.org/download.html\\n"
+            "Add ffmpeg.exe to your system PATH, or use: choco install ffmpeg"
+        )
+
+
+def decode_audio(audio_bytes: bytes) -> np.ndarray:
+    """
+    Decode uploaded audio bytes to a mono 16 kHz float32 array in memory
+    
+    16-bit PCM WAV at 16 kHz is read directly; anything else (mp3, m4a,
+    ogg, other sample rates) is piped through FFmpeg via stdin/stdout.
+    
+    Args:
+        audio_bytes: Raw contents of the uploaded file
+    
+    Returns:
+        float32 samples in [-1, 1]
+    
+    Raises:
+        ValueError: the bytes are not decodable audio
+    """
+    if audio_bytes[:4] == b"RIFF" and audio_bytes[8:12] == b"WAVE":
+        try:
+            with wave.open(io.BytesIO(audio_bytes)) as wav:
+                if wav.getsampwidth() == 2 and wav.getframerate() == SAMPLE_RATE:
+                    frames = wav.readframes(wav.getnframes())
+                    samples = np.frombuffer(frames, dtype=np.int16)
+                    if wav.getnchannels() > 1:
+                        samples = samples.reshape(-1, wav.getnchannels()).mean(axis=1)
+                    return (samples / 32768.0).astype(np.float32)
+        except wave.Error:
+            pass  # e.g. float WAV; let FFmpeg handle it
+    
+    _require_ffmpeg()
+    proc = subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-threads", "0", "-i", "pipe:0",
+            "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE), "pipe:1",
+        ],
+        input=audio_bytes,
+        capture_output=True,
+    )
+    if proc.returncode != 0:
+        raise ValueError(f"Failed to decode audio: {proc.stderr.decode(errors='ignore').strip()[-200:]}")
+    return (np.frombuffer(proc.stdout, dtype=np.int16) / 32768.0).astype(np.float32)
+
+
+class STTBackend(ABC):
+    """
+    Interface every speech-to-text backend implements
+    
+    WhisperPool holds backend instances and only calls ``transcribe``.
+    """
+    
+    backend_name: str = ""
+    model_name: str = ""
+    
+    @abstractmethod
+    def transcribe(
+        self,
+        audio_data: Union[str, bytes, np.ndarray],
+        language: Optional[str] = None,
+        initial_prompt: Optional[str] = None
+    ) -> str:
+        """Transcribe a file path, encoded bytes or 16 kHz float32 samples"""
+    
+    def transcribe_from_file(self, audio_file_path: str) -> str:
+        return self.transcribe(audio_file_path, language="hi")
+    
+    def transcribe_from_bytes(self, audio_bytes: bytes, language: Optional[str] = "hi") -> str:
+        return self.transcribe(decode_audio(audio_bytes), language=language)
 
 
-class WhisperSTT:
+class WhisperSTT(STTBackend):
     """
     Speech-to-Text using OpenAI Whisper
     Supports Hindi language recognition
     """
     
+    backend_name = "openai-whisper"
+    
     def __init__(self, model_name: str = None):
         """
         Initialize Whisper STT
@@ -28,15 +129,7 @@ class WhisperSTT:
                        - medium/large: Best accuracy, slower
         """
         # Check FFmpeg availability first
-        import subprocess
-        try:
-            subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True, timeout=5)
-        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            raise RuntimeError(
-                "FFmpeg not found. Whisper requires FFmpeg to process audio.\\n"
-                "Install FFmpeg: https://ffmpeg.org/download.html\\n"
-                "Add ffmpeg.exe to your system PATH, or use: choco install ffmpeg"
-            )
+        _require_ffmpeg()
         
         # Auto-detect model from config if not specified
         if model_name is None:
@@ -61,7 +154,8 @@ class WhisperSTT:
     def transcribe(
         self,
         audio_data: Union[str, bytes, np.ndarray],
-        language: str = None  # None = precise auto-detection
+        language: str = None,  # None = precise auto-detection
+        initial_prompt: Optional[str] = None
     ) -> str:
         """
         Transcribe audio to text
@@ -69,6 +163,8 @@ class WhisperSTT:
         Args:
             audio_data: Audio file path, bytes, or numpy array
             language: Language code (default: "hi" for Hindi)
+            initial_prompt: Preceding text, used as context when decoding
+                            a stream window by window
         
         Returns:
             Transcribed text in Hindi
@@ -76,11 +172,15 @@ class WhisperSTT:
         if self.model is None:
             raise RuntimeError("Whisper model not loaded")
         
+        if isinstance(audio_data, (bytes, bytearray)):
+            audio_data = decode_audio(bytes(audio_data))
+        
         try:
             # Transcribe with Whisper
             result = self.model.transcribe(
                 audio_data,
                 language=language,
+                initial_prompt=initial_prompt,
                 fp16=False  # Use FP32 for CPU compatibility
             )
             
@@ -105,46 +205,240 @@ class WhisperSTT:
         """
         return self.transcribe(audio_file_path, language="hi")
     
-    def transcribe_from_bytes(self, audio_bytes: bytes) -> str:
+    def transcribe_from_bytes(self, audio_bytes: bytes, language: Optional[str] = "hi") -> str:
         """
-        Transcribe from audio bytes
+        Transcribe from audio bytes (decoded in memory, no temp file)
         
         Args:
             audio_bytes: Audio data as bytes
+            language: Language code, or None to auto-detect
         
         Returns:
             Transcribed Hindi text
         """
-        # Save bytes to temporary file for Whisper
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            temp_file.write(audio_bytes)
-            temp_path = temp_file.name
+        return self.transcribe(decode_audio(audio_bytes), language=language)
+
+
+STT_BACKENDS = ("openai-whisper", "faster-whisper")
+
+
+def create_stt_backend(
+    backend: str = "openai-whisper",
+    model_name: str = None,
+    compute_type: str = None,
+    cpu_threads: int = None
+) -> STTBackend:
+    """
+    Build one model instance of the configured backend
+    
+    Args:
+        backend: One of STT_BACKENDS
+        model_name: Model size (tiny/base/small/...) or, for faster-whisper,
+                    a CTranslate2 model directory / Hugging Face repo id
+        compute_type: faster-whisper quantization (int8, int8_float32, float32;
+                      None = STT_COMPUTE_TYPE)
+        cpu_threads: faster-whisper threads per model (0 = runtime default;
+                     None = STT_CPU_THREADS)
+    """
+    if backend == "openai-whisper":
+        return WhisperSTT(model_name=model_name)
+    if backend == "faster-whisper":
+        from Backend.Voice_agent.input_processing.faster_whisper_stt import FasterWhisperSTT
+        return FasterWhisperSTT(model_name=model_name, compute_type=compute_type, cpu_threads=cpu_threads)
+    raise ValueError(f"Unknown STT backend '{backend}' (use one of {', '.join(STT_BACKENDS)})")
+
+
+class STTBusyError(RuntimeError):
+    """Raised when every pooled model is busy and the wait queue is full"""
+
+
+class WhisperPool:
+    """
+    Process-wide pool of preloaded Whisper models
+    
+    Whisper installs per-call hooks on the model while decoding, so one model
+    can't serve two transcriptions at once. The pool keeps ``size`` models
+    loaded, hands each request its own, and rejects requests beyond
+    ``max_queue`` waiters instead of letting them pile up.
+    
+    With ``vad`` on, speech is located before a model is taken: silence is
+    trimmed, long recordings are packed into one-window chunks and clips
+    without speech return "" without decoding.
+    
+    Exposes the same transcribe methods as WhisperSTT.
+    """
+    
+    def __init__(
+        self,
+        model_name: str = None,
+        size: int = None,
+        max_queue: int = None,
+        vad: bool = None,
+        backend: str = None
+    ):
+        """
+        Args:
+            model_name: Whisper model (defaults to WHISPER_MODEL from config)
+            size: Number of models to load (defaults to WHISPER_POOL_SIZE)
+            max_queue: Maximum waiting requests (defaults to WHISPER_MAX_QUEUE)
+            vad: Run voice-activity detection first (defaults to WHISPER_VAD)
+            backend: One of STT_BACKENDS (defaults to STT_BACKEND)
+        """
+        # Each argument falls back to its own config field; the faster-whisper
+        # settings always come from config
+        from Backend.Voice_agent.config import get_config
+        config = get_config()
+        model_name = model_name if model_name is not None else config.whisper_model
+        size = size if size is not None else config.whisper_pool_size
+        max_queue = max_queue if max_queue is not None else config.whisper_max_queue
+        vad = vad if vad is not None else config.whisper_vad
+        backend = backend if backend is not None else config.stt_backend
+        compute_type, cpu_threads = config.stt_compute_type, config.stt_cpu_threads
+        
+        self.model_name = model_name
+        self.backend = backend
+        self.size = max(1, size)
+        self.max_queue = max_queue
+        self.vad = vad
+        
+        started = time.perf_counter()
+        self._models: "queue.Queue[STTBackend]" = queue.Queue()
+        for _ in range(self.size):
+            self._models.put(create_stt_backend(backend, model_name, compute_type, cpu_threads))
+        self.load_ms = round((time.perf_counter() - started) * 1000, 1)
+        print(f"✅ STT pool ready: {self.size} x {backend} '{model_name}' in {self.load_ms:.0f} ms")
+        
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._stats = {
+            "completed": 0, "failed": 0, "rejected": 0, "skipped": 0,
+            "wait_s": 0.0, "run_s": 0.0, "audio_s": 0.0, "speech_s": 0.0,
+        }
+    
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None):
+        """Borrow a model for the duration of the ``with`` block"""
+        started = time.perf_counter()
+        with self._lock:
+            if self._models.empty() and self._waiting >= self.max_queue:
+                self._stats["rejected"] += 1
+                raise STTBusyError(f"All {self.size} speech models busy and {self._waiting} requests waiting")
+            self._waiting += 1
+        try:
+            stt = self._models.get(timeout=timeout)
+        except queue.Empty:
+            with self._lock:
+                self._stats["rejected"] += 1
+            raise STTBusyError(f"No speech model free within {timeout:.0f}s")
+        finally:
+            with self._lock:
+                self._waiting -= 1
+        
+        acquired = time.perf_counter()
+        ok = False
+        try:
+            yield stt
+            ok = True
+        finally:
+            self._models.put(stt)
+            with self._lock:
+                self._stats["completed" if ok else "failed"] += 1
+                self._stats["wait_s"] += acquired - started
+                self._stats["run_s"] += time.perf_counter() - acquired
+    
+    def transcribe(
+        self,
+        audio_data: Union[str, bytes, np.ndarray],
+        language: str = None,
+        initial_prompt: Optional[str] = None
+    ) -> str:
+        """Transcribe on the next free model (see WhisperSTT.transcribe)"""
+        if isinstance(audio_data, (bytes, bytearray)):
+            # Decode before taking a model so FFmpeg doesn't hold one up
+            audio_data = decode_audio(bytes(audio_data))
+        
+        chunks = [audio_data]
+        if self.vad and isinstance(audio_data, np.ndarray):
+            from Backend.Voice_agent.input_processing.vad import get_vad
+            vad = get_vad()
+            found = vad.detect(audio_data)
+            with self._lock:
+                self._stats["audio_s"] += found.total_samples / SAMPLE_RATE
+                self._stats["speech_s"] += found.speech_samples / SAMPLE_RATE
+                if found.is_empty:
+                    self._stats["skipped"] += 1
+            if found.is_empty:
+                return ""
+            chunks = vad.chunks(audio_data, found)
         
+        texts = []
+        with self.checkout() as stt:
+            for chunk in chunks:
+                text = stt.transcribe(chunk, language=language, initial_prompt=initial_prompt)
+                if text:
+                    texts.append(text)
+                    initial_prompt = text[-200:]
+        return " ".join(texts)
+    
+    def transcribe_from_file(self, audio_file_path: str) -> str:
+        with open(audio_file_path, "rb") as f:
+            return self.transcribe(f.read(), language="hi")
+    
+    def transcribe_from_bytes(self, audio_bytes: bytes, language: Optional[str] = "hi") -> str:
+        return self.transcribe(decode_audio(audio_bytes), language=language)
+    
+    def warmup(self):
+        """Run one second of silence through every model"""
+        silence = np.zeros(SAMPLE_RATE, dtype=np.float32)
+        models = [self._models.get() for _ in range(self.size)]
         try:
-            result = self.transcribe(temp_path, language="hi")
-            return result
+            for stt in models:
+                stt.transcribe(silence, language="hi")
         finally:
-            # Clean up temp file
-            import os
-            os.unlink(temp_path)
+            for stt in models:
+                self._models.put(stt)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            waiting = self._waiting
+        done = stats["completed"] + stats["failed"]
+        return {
+            "backend": self.backend,
+            "model": self.model_name,
+            "size": self.size,
+            "free": self._models.qsize(),
+            "waiting": waiting,
+            "max_queue": self.max_queue,
+            "load_ms": self.load_ms,
+            "completed": stats["completed"],
+            "failed": stats["failed"],
+            "rejected": stats["rejected"],
+            "skipped_silent": stats["skipped"],
+            "speech_ratio": round(stats["speech_s"] / stats["audio_s"], 3) if stats["audio_s"] else None,
+            "avg_wait_ms": round(stats["wait_s"] / done * 1000, 1) if done else 0.0,
+            "avg_run_ms": round(stats["run_s"] / done * 1000, 1) if done else 0.0,
+        }
 
 
 # Singleton instance
 _stt = None
+_stt_lock = threading.Lock()
 
-def get_speech_to_text(model_name: str = None) -> WhisperSTT:
+def get_speech_to_text(model_name: str = None) -> WhisperPool:
     """
-    Get or create Speech-to-Text instance
-    Auto-detects model from config if not specified
+    Get or create the shared Speech-to-Text pool
+    Auto-detects model and pool size from config if not specified
     
     Args:
         model_name: Whisper model name (optional, uses config default)
     
     Returns:
-        WhisperSTT instance
+        WhisperPool instance
     """
     global _stt
     if _stt is None:
-        _stt = WhisperSTT(model_name=model_name)
+        with _stt_lock:
+            if _stt is None:
+                _stt = WhisperPool(model_name=model_name)
     return _stt
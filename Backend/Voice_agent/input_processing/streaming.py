@@ -0,0 +1,175 @@
+"""
+Streaming Speech-to-Text
+Incremental transcription of audio that arrives in small frames (the
+/voice/stream WebSocket). Audio is decoded window by window with a short
+overlap while the farmer is still speaking, so when speech ends only the
+last few seconds remain to be decoded.
+"""
+
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+from Backend.utils.lazy_import import lazy_import, is_available
+from Backend.Voice_agent.input_processing.speech_to_text import SAMPLE_RATE
+
+# Only needed for clients that send Opus packets
+opuslib = lazy_import("opuslib")
+
+OPUS_MAX_FRAME = 1920  # 120 ms at 16 kHz, the largest Opus frame
+
+
+class FrameDecoder:
+    """Turns incoming WebSocket frames into float32 samples at 16 kHz"""
+
+    FORMATS = ("pcm16", "opus")
+
+    def __init__(self, audio_format: str = "pcm16"):
+        if audio_format not in self.FORMATS:
+            raise ValueError(f"Unsupported audio format: {audio_format} (use one of {', '.join(self.FORMATS)})")
+        if audio_format == "opus" and not is_available("opuslib"):
+            raise ValueError("Opus streaming needs the optional 'opuslib' package; send pcm16 instead")
+        self.audio_format = audio_format
+        self._opus = opuslib.Decoder(SAMPLE_RATE, 1) if audio_format == "opus" else None
+        self._carry = b""
+
+    def decode(self, frame: bytes) -> np.ndarray:
+        if self._opus is not None:
+            pcm = self._opus.decode(frame, OPUS_MAX_FRAME)
+        else:
+            # Keep an odd trailing byte for the next frame
+            pcm = self._carry + frame
+            pcm, self._carry = pcm[:len(pcm) // 2 * 2], pcm[len(pcm) // 2 * 2:]
+        return (np.frombuffer(pcm, dtype="<i2") / 32768.0).astype(np.float32)
+
+
+def merge_overlap(committed: str, new: str, max_words: int = 8) -> str:
+    """
+    Join two transcripts whose audio overlapped, dropping the words the
+    overlap produced twice (longest suffix of ``committed`` that is also a
+    prefix of ``new``).
+    """
+    old_words, new_words = committed.split(), new.split()
+    for k in range(min(max_words, len(old_words), len(new_words)), 0, -1):
+        if old_words[-k:] == new_words[:k]:
+            new_words = new_words[k:]
+            break
+    return " ".join(old_words + new_words)
+
+
+class StreamingTranscriber:
+    """
+    Windowed incremental decoding over a growing audio buffer
+
+    - ``feed()`` appends samples (event loop thread) and reports end of speech
+    - ``decode_partial()`` (worker thread) commits any full ``window_s`` of
+      audio, keeping ``overlap_s`` of it as context for the next window, and
+      returns committed text plus a draft of the uncommitted tail
+    - ``finish()`` decodes whatever is left and returns the final text
+
+    End of speech is ``silence_ms`` of low energy after speech was heard.
+    """
+
+    def __init__(
+        self,
+        stt,
+        language: Optional[str] = "hi",
+        window_s: float = 10.0,
+        overlap_s: float = 1.0,
+        step_s: float = 1.0,
+        silence_ms: int = 800,
+        energy_threshold: float = 0.01,
+    ):
+        """
+        Args:
+            stt: WhisperPool / WhisperSTT (anything with ``transcribe``)
+            language: Language code, or None to auto-detect
+            window_s: Audio committed per decode window
+            overlap_s: Audio re-decoded at the start of the next window
+            step_s: New audio needed before another partial decode
+            silence_ms: Trailing silence that ends the utterance
+            energy_threshold: RMS level counted as speech
+        """
+        self.stt = stt
+        self.language = language
+        self.window = int(window_s * SAMPLE_RATE)
+        self.overlap = int(overlap_s * SAMPLE_RATE)
+        self.step = int(step_s * SAMPLE_RATE)
+        self.silence_samples = int(silence_ms * SAMPLE_RATE / 1000)
+        self.energy_threshold = energy_threshold
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Start a new utterance"""
+        with self._lock:
+            self._chunks: List[np.ndarray] = []
+            self._pending = np.zeros(0, dtype=np.float32)  # audio after the last commit
+            self._received = 0
+            self._decoded_at = 0
+            self._speech_heard = False
+            self._silence_run = 0
+        self.committed = ""
+        self.partial = ""
+
+    @property
+    def audio_ms(self) -> int:
+        return int(self._received * 1000 / SAMPLE_RATE)
+
+    def feed(self, samples: np.ndarray) -> bool:
+        """Append audio; True once speech has been followed by enough silence"""
+        if samples.size == 0:
+            return False
+        with self._lock:
+            self._chunks.append(samples)
+            self._received += samples.size
+
+        frame = int(0.03 * SAMPLE_RATE)
+        for start in range(0, samples.size, frame):
+            block = samples[start:start + frame]
+            if float(np.sqrt(np.mean(block * block))) >= self.energy_threshold:
+                self._speech_heard = True
+                self._silence_run = 0
+            else:
+                self._silence_run += block.size
+        return self._speech_heard and self._silence_run >= self.silence_samples
+
+    def should_decode(self) -> bool:
+        """Enough new audio since the last partial decode"""
+        return self._speech_heard and self._received - self._decoded_at >= self.step
+
+    def _take_pending(self) -> np.ndarray:
+        with self._lock:
+            if self._chunks:
+                self._pending = np.concatenate([self._pending, *self._chunks])
+                self._chunks = []
+            self._decoded_at = self._received
+            return self._pending
+
+    def _transcribe(self, audio: np.ndarray) -> str:
+        # Recent committed text keeps wording consistent across windows
+        prompt = self.committed[-200:] or None
+        return self.stt.transcribe(audio, language=self.language, initial_prompt=prompt)
+
+    def decode_partial(self) -> str:
+        """Blocking: commit full windows, then draft the tail"""
+        pending = self._take_pending()
+        while pending.size >= self.window + self.step:
+            text = self._transcribe(pending[:self.window])
+            self.committed = merge_overlap(self.committed, text)
+            with self._lock:
+                self._pending = self._pending[self.window - self.overlap:]
+                pending = self._pending
+        self.partial = merge_overlap(self.committed, self._transcribe(pending)) if pending.size else self.committed
+        return self.partial
+
+    def finish(self) -> str:
+        """Blocking: decode the remaining audio and return the final transcript"""
+        pending = self._take_pending()
+        if pending.size >= self.window + self.step:
+            self.decode_partial()
+            pending = self._take_pending()
+        if pending.size:
+            self.committed = merge_overlap(self.committed, self._transcribe(pending))
+        return self.committed
@@ -3,9 +3,49 @@ Translator Module - Hindi ↔ English Translation
 Uses Argos Translate for offline translation
 """
 
-import argostranslate.package
-import argostranslate.translate
-from typing import Optional
+import time
+import unicodedata
+from typing import Any, Dict, List, Optional
+
+from Backend.utils.kv_cache import TwoTierCache, resolve_path
+from Backend.utils.lazy_import import lazy_import
+from Backend.Voice_agent.input_processing.argos_models import (
+    ARGOS_PAIRS,
+    DEFAULT_MODELS_DIR,
+    read_manifest,
+    use_models_dir,
+    verify_models_dir,
+)
+
+argos_package = lazy_import("argostranslate.package")
+argos_translate = lazy_import("argostranslate.translate")
+
+
+def _normalize(text: str) -> str:
+    """Cache key form: NFC (Devanagari has several encodings) and single spaces"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+# Shared by every translator in the process
+_cache: Optional[TwoTierCache] = None
+
+def get_translation_cache() -> TwoTierCache:
+    """Shared translation cache (LRU + SQLite file from config)"""
+    global _cache
+    if _cache is None:
+        from Backend.Voice_agent.config import get_config
+        config = get_config()
+        _cache = TwoTierCache(
+            "translation",
+            path=config.translation_cache_path or None,
+            max_entries=config.translation_cache_size,
+        )
+    return _cache
+
+
+def translation_cache_stats() -> Optional[Dict[str, Any]]:
+    """Stats of the shared cache, or None until a translator has been built"""
+    return _cache.stats() if _cache is not None else None
 
 
 class ArgosTranslator:
@@ -14,44 +54,86 @@ class ArgosTranslator:
     Offline translation with no API dependencies
     """
     
-    def __init__(self):
-        """Initialize Argos Translate with Hindi-English packages"""
+    def __init__(
+        self,
+        cache: Optional[TwoTierCache] = None,
+        models_dir: Optional[str] = None,
+        auto_download: Optional[bool] = None
+    ):
+        """
+        Initialize Argos Translate with Hindi-English packages
+        
+        Args:
+            cache: Translation cache (defaults to the shared one)
+            models_dir: Provisioned models (defaults to ARGOS_MODELS_DIR)
+            auto_download: Fetch packages from the Argos index when the
+                           directory isn't provisioned (ARGOS_AUTO_DOWNLOAD)
+        """
+        if models_dir is None or auto_download is None:
+            from Backend.Voice_agent.config import get_config
+            config = get_config()
+            models_dir = config.argos_models_dir if models_dir is None else models_dir
+            auto_download = config.argos_auto_download if auto_download is None else auto_download
+        
         self.initialized = False
-        self._install_packages()
+        self.cache = cache if cache is not None else get_translation_cache()
+        self.models_dir = resolve_path(models_dir)
+        self.auto_download = auto_download
+        self.load_ms: Optional[float] = None
+        self._translations: Dict[tuple, Any] = {}  # (from, to) -> Argos translation
+        self._load_models()
     
-    def _install_packages(self):
-        """Install required translation packages"""
+    def _load_models(self):
+        """
+        Load both directions once, eagerly, from the provisioned directory
+        (no network). The first translation in each direction also loads the
+        CTranslate2 model and sentence splitter, so it is done here rather
+        than on a farmer's first question.
+        """
+        started = time.perf_counter()
         try:
-            # Update package index
-            argostranslate.package.update_package_index()
-            available_packages = argostranslate.package.get_available_packages()
+            if self.models_dir and read_manifest(self.models_dir) is not None:
+                use_models_dir(self.models_dir)
+                source = self.models_dir
+            elif self.auto_download:
+                self._install_packages()
+                source = "Argos package index"
+            else:
+                # Raises with the provisioning command in the message
+                verify_models_dir(self.models_dir or DEFAULT_MODELS_DIR)
             
-            # Install Hindi to English
-            hi_to_en = next(
-                (pkg for pkg in available_packages 
-                 if pkg.from_code == "hi" and pkg.to_code == "en"),
-                None
-            )
-            if hi_to_en and not hi_to_en.is_installed():
-                argostranslate.package.install_from_path(hi_to_en.download())
-            
-            # Install English to Hindi
-            en_to_hi = next(
-                (pkg for pkg in available_packages 
-                 if pkg.from_code == "en" and pkg.to_code == "hi"),
-                None
-            )
-            if en_to_hi and not en_to_hi.is_installed():
-                argostranslate.package.install_from_path(en_to_hi.download())
+            for (from_code, to_code), sample in zip(ARGOS_PAIRS, ("नमस्ते", "hello")):
+                translation = argos_translate.get_translation_from_codes(from_code, to_code)
+                if translation is None:
+                    raise RuntimeError(f"No Argos model installed for {from_code} -> {to_code}")
+                translation.translate(sample)
+                self._translations[(from_code, to_code)] = translation
             
             self.initialized = True
-            print("✅ Argos Translate packages installed successfully")
+            self.load_ms = round((time.perf_counter() - started) * 1000, 1)
+            print(f"✅ Argos models loaded from {source} in {self.load_ms:.0f} ms")
             
         except Exception as e:
-            print(f"⚠️  Warning: Could not install Argos Translate packages: {e}")
+            print(f"⚠️  Warning: Could not load Argos Translate models: {e}")
             print("   Translation will use fallback method")
             self.initialized = False
     
+    def _install_packages(self):
+        """Install required translation packages from the online index (ARGOS_AUTO_DOWNLOAD)"""
+        # Update package index
+        argos_package.update_package_index()
+        available_packages = argos_package.get_available_packages()
+        installed = {(pkg.from_code, pkg.to_code) for pkg in argos_package.get_installed_packages()}
+        
+        for from_code, to_code in ARGOS_PAIRS:
+            pkg = next(
+                (pkg for pkg in available_packages 
+                 if pkg.from_code == from_code and pkg.to_code == to_code),
+                None
+            )
+            if pkg and (from_code, to_code) not in installed:
+                argos_package.install_from_path(pkg.download())
+    
     def hindi_to_english(self, hindi_text: str) -> str:
         """
         Translate Hindi text to English
@@ -62,19 +144,7 @@ class ArgosTranslator:
         Returns:
             English translation
         """
-        if not self.initialized:
-            return self._fallback_translate(hindi_text, "hi_to_en")
-        
-        try:
-            translated = argostranslate.translate.translate(
-                hindi_text,
-                from_code="hi",
-                to_code="en"
-            )
-            return translated
-        except Exception as e:
-            print(f"⚠️  Translation error: {e}, using fallback")
-            return self._fallback_translate(hindi_text, "hi_to_en")
+        return self.translate_batch([hindi_text], from_code="hi", to_code="en")[0]
     
     def english_to_hindi(self, english_text: str) -> str:
         """
@@ -86,19 +156,66 @@ class ArgosTranslator:
         Returns:
             Hindi translation
         """
+        return self.translate_batch([english_text], from_code="en", to_code="hi")[0]
+    
+    def translate_batch(self, texts: List[str], from_code: str = "en", to_code: str = "hi") -> List[str]:
+        """
+        Translate several texts, answering repeats from the cache
+        
+        Texts are keyed by direction and normalized form (NFC, collapsed
+        whitespace). Only the distinct misses reach Argos, together in one
+        call; fallback output is never cached.
+        
+        Args:
+            texts: Input texts
+            from_code: Source language ("hi" or "en")
+            to_code: Target language
+        
+        Returns:
+            Translations, in the order of ``texts``
+        """
+        direction = f"{from_code}_to_{to_code}"
         if not self.initialized:
-            return self._fallback_translate(english_text, "en_to_hi")
+            return [self._fallback_translate(text, direction) for text in texts]
         
-        try:
-            translated = argostranslate.translate.translate(
-                english_text,
-                from_code="en",
-                to_code="hi"
-            )
-            return translated
-        except Exception as e:
-            print(f"⚠️  Translation error: {e}, using fallback")
-            return self._fallback_translate(english_text, "en_to_hi")
+        normalized = [_normalize(text) for text in texts]
+        keys = [f"{direction}:{norm}" for norm in normalized]
+        translated = self.cache.get_many(key for key, norm in zip(keys, normalized) if norm)
+        
+        misses = list(dict.fromkeys(norm for key, norm in zip(keys, normalized) if norm and key not in translated))
+        if misses:
+            try:
+                results = self._translate_uncached(misses, from_code, to_code)
+            except Exception as e:
+                print(f"⚠️  Translation error: {e}, using fallback")
+                return [
+                    translated.get(key) or self._fallback_translate(text, direction)
+                    for key, text in zip(keys, texts)
+                ]
+            new_entries = [(f"{direction}:{norm}", result) for norm, result in zip(misses, results)]
+            self.cache.set_many(new_entries)
+            translated.update(new_entries)
+        
+        return [translated[key] if norm else text for key, norm, text in zip(keys, normalized, texts)]
+    
+    def _translate_uncached(self, texts: List[str], from_code: str, to_code: str) -> List[str]:
+        """Run Argos on distinct single-line texts"""
+        translation = self._translations.get((from_code, to_code))
+        if translation is None:
+            raise RuntimeError(f"No Argos model loaded for {from_code} -> {to_code}")
+        
+        if len(texts) == 1:
+            return [translation.translate(texts[0])]
+        
+        # Argos translates each line as its own paragraph: one call for the batch
+        results = translation.translate("\n".join(texts)).split("\n")
+        if len(results) != len(texts):
+            results = [translation.translate(text) for text in texts]
+        return [result.strip() for result in results]
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Translation cache hit rate and size"""
+        return self.cache.stats()
     
     def _fallback_translate(self, text: str, direction: str) -> str:
         """
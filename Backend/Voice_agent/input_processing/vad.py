@@ -0,0 +1,173 @@
+"""
+Voice Activity Detection
+Finds the speech in a clip before it reaches Whisper: trims leading and
+trailing silence, drops long pauses, packs the speech into chunks Whisper
+decodes in one pass, and lets empty clips skip decoding entirely.
+
+Frame energy is compared against the clip's own noise floor, so steady
+field noise (wind, pump, tractor) is not mistaken for speech. If the
+optional ``webrtcvad`` package is installed it can classify frames instead.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from Backend.utils.lazy_import import lazy_import, is_available
+from Backend.Voice_agent.input_processing.speech_to_text import SAMPLE_RATE
+
+webrtcvad = lazy_import("webrtcvad")
+
+# Whisper decodes 30 s windows; stay under one per chunk
+MAX_CHUNK_S = 28.0
+
+
+@dataclass
+class VADResult:
+    """Speech found in a clip"""
+    segments: List[Tuple[int, int]]  # (start, end) sample offsets
+    total_samples: int
+
+    @property
+    def speech_samples(self) -> int:
+        return sum(end - start for start, end in self.segments)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.segments
+
+
+class EnergyVAD:
+    """
+    Frame-energy VAD with an adaptive noise floor
+
+    A frame is speech when its RMS exceeds ``noise_floor * threshold_ratio``,
+    clamped to [``min_threshold``, ``max_threshold``] so a clip that is
+    speech throughout doesn't raise the bar above its own quieter syllables.
+    Speech runs shorter than ``min_speech_ms`` are ignored, pauses shorter
+    than ``min_silence_ms`` are bridged and each segment keeps
+    ``padding_ms`` of context on both sides.
+    """
+
+    def __init__(
+        self,
+        frame_ms: int = 30,
+        threshold_ratio: float = 3.0,
+        min_threshold: float = 0.005,
+        max_threshold: float = 0.05,
+        min_speech_ms: int = 250,
+        min_silence_ms: int = 500,
+        padding_ms: int = 200,
+        backend: str = "energy",
+        aggressiveness: int = 2,
+    ):
+        """
+        Args:
+            backend: "energy", "webrtc" or "auto" (webrtc when installed)
+            aggressiveness: webrtcvad mode 0-3 (higher drops more noise)
+        """
+        self.frame = int(SAMPLE_RATE * frame_ms / 1000)
+        self.threshold_ratio = threshold_ratio
+        self.min_threshold = min_threshold
+        self.max_threshold = max_threshold
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.min_silence_frames = max(1, min_silence_ms // frame_ms)
+        self.padding = int(SAMPLE_RATE * padding_ms / 1000)
+
+        if backend == "auto":
+            backend = "webrtc" if is_available("webrtcvad") else "energy"
+        if backend == "webrtc" and frame_ms not in (10, 20, 30):
+            raise ValueError("webrtcvad needs 10, 20 or 30 ms frames")
+        self.backend = backend
+        self._webrtc = webrtcvad.Vad(aggressiveness) if backend == "webrtc" else None
+
+    def _speech_frames(self, audio: np.ndarray) -> np.ndarray:
+        n = len(audio) // self.frame
+        frames = audio[:n * self.frame].reshape(n, self.frame)
+        if self._webrtc is not None:
+            pcm = (np.clip(frames, -1, 1) * 32767).astype("<i2")
+            return np.array([self._webrtc.is_speech(f.tobytes(), SAMPLE_RATE) for f in pcm], dtype=bool)
+
+        rms = np.sqrt(np.mean(frames.astype(np.float64) ** 2, axis=1))
+        # Quietest tenth of the clip approximates the background noise
+        noise_floor = np.percentile(rms, 10) if n else 0.0
+        threshold = min(self.max_threshold, max(self.min_threshold, noise_floor * self.threshold_ratio))
+        return rms > threshold
+
+    def detect(self, audio: np.ndarray) -> VADResult:
+        """Speech segments in ``audio`` (mono float32 at 16 kHz)"""
+        speech = self._speech_frames(audio)
+
+        runs: List[List[int]] = []  # [first_frame, end_frame)
+        for i in np.flatnonzero(speech):
+            if runs and i - runs[-1][1] < self.min_silence_frames:
+                runs[-1][1] = i + 1
+            else:
+                runs.append([i, i + 1])
+
+        segments = []
+        for first, end in runs:
+            if end - first < self.min_speech_frames:
+                continue
+            start = max(0, int(first) * self.frame - self.padding)
+            stop = min(len(audio), int(end) * self.frame + self.padding)
+            if segments and start <= segments[-1][1]:
+                segments[-1] = (segments[-1][0], stop)
+            else:
+                segments.append((start, stop))
+        return VADResult(segments=segments, total_samples=len(audio))
+
+    def trim(self, audio: np.ndarray) -> np.ndarray:
+        """Audio from the first to the last speech (empty if none)"""
+        result = self.detect(audio)
+        if result.is_empty:
+            return audio[:0]
+        return audio[result.segments[0][0]:result.segments[-1][1]]
+
+    def chunks(
+        self,
+        audio: np.ndarray,
+        result: Optional[VADResult] = None,
+        max_chunk_s: float = MAX_CHUNK_S,
+        gap_ms: int = 150,
+    ) -> List[np.ndarray]:
+        """
+        Speech segments joined with short gaps into chunks of at most
+        ``max_chunk_s``, so each is one Whisper window. Segments longer
+        than that are cut at the limit.
+        """
+        result = result or self.detect(audio)
+        limit = int(max_chunk_s * SAMPLE_RATE)
+        gap = np.zeros(int(SAMPLE_RATE * gap_ms / 1000), dtype=np.float32)
+
+        pieces = []
+        for start, end in result.segments:
+            for s in range(start, end, limit):
+                pieces.append(audio[s:min(end, s + limit)])
+
+        chunks, current, size = [], [], 0
+        for piece in pieces:
+            extra = len(piece) + (len(gap) if current else 0)
+            if current and size + extra > limit:
+                chunks.append(np.concatenate(current))
+                current, size = [], 0
+                extra = len(piece)
+            if current:
+                current.append(gap)
+            current.append(piece)
+            size += extra
+        if current:
+            chunks.append(np.concatenate(current))
+        return chunks
+
+
+# Singleton instance
+_vad = None
+
+def get_vad() -> EnergyVAD:
+    """Get or create the shared VAD (webrtcvad when installed)"""
+    global _vad
+    if _vad is None:
+        _vad = EnergyVAD(backend="auto")
+    return _vad
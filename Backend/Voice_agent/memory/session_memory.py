@@ -1,11 +1,31 @@
 """
 Session Memory - MongoDB-ready short-term memory
 Stores conversation turns and can be easily connected to MongoDB
+
+Saves are incremental: each save ``$push``es only the turns added since
+the last one (capped with ``$slice``) and ``$set``s only the fields that
+changed, so a turn costs the same to write at turn 100 as at turn 1.
+Sessions expire through a TTL index on ``updated_at``, whose expiry is
+always the configured ``ttl_days``.
+
+Without MongoDB, sessions are kept in process: at most ``max_sessions``
+(least recently used dropped first), and a session idle for ``ttl_days``
+is dropped when next looked up.
 """
 
+import copy
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
-from datetime import datetime
-from Backend.Voice_agent.core.context import ConversationContext
+from datetime import datetime, timedelta, timezone
+from Backend.Voice_agent.core.context import ConversationContext, ConversationTurn
+
+
+def _flatten(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Profile fields as dotted paths, so one changed field is one small $set"""
+    flat = {key: value for key, value in state.items() if key != "farmer_profile"}
+    for key, value in state.get("farmer_profile", {}).items():
+        flat[f"farmer_profile.{key}"] = value
+    return flat
 
 
 class SessionMemory:
@@ -14,21 +34,60 @@ class SessionMemory:
     MongoDB-ready: Can store/retrieve from MongoDB when connected
     """
     
-    def __init__(self, db_client=None):
+    def __init__(
+        self,
+        db_client=None,
+        history_limit: int = 50,
+        ttl_days: float = 30,
+        max_sessions: int = 10000
+    ):
         """
         Initialize session memory
         
         Args:
             db_client: MongoDB client (optional, uses in-memory if None)
+            history_limit: Turns kept per session (older ones are dropped)
+            ttl_days: Sessions idle this long are deleted (TTL index)
+            max_sessions: Sessions kept in memory without MongoDB (LRU)
         """
         self.db_client = db_client
         self.use_mongodb = db_client is not None
+        self.history_limit = history_limit
+        self.ttl_days = ttl_days
+        self.max_sessions = max_sessions
         
-        # In-memory storage (fallback)
-        self._memory_store: Dict[str, ConversationContext] = {}
+        # In-memory storage (fallback), least recently used first
+        self._memory_store: "OrderedDict[str, ConversationContext]" = OrderedDict()
         
         # MongoDB collection name
         self.collection_name = "session_memory"
+        
+        if self.use_mongodb:
+            self._ensure_indexes()
+    
+    def _ensure_indexes(self):
+        """Lookup by session, recent sessions per farmer, and expiry"""
+        collection = self.db_client[self.collection_name]
+        try:
+            collection.create_index("session_id", unique=True)
+            collection.create_index([("farmer_id", 1), ("updated_at", -1)])
+            self._ensure_ttl()
+        except Exception as e:
+            print(f"⚠️  Session memory indexes not created: {e}")
+    
+    def _ensure_ttl(self):
+        """Create the TTL index on ``updated_at``, or bring its expiry back to ``ttl_days``"""
+        collection = self.db_client[self.collection_name]
+        seconds = int(self.ttl_days * 24 * 60 * 60)
+        for index in collection.list_indexes():
+            if dict(index["key"]) == {"updated_at": 1}:
+                if index.get("expireAfterSeconds") != seconds:
+                    self.db_client.command(
+                        "collMod", self.collection_name,
+                        index={"keyPattern": {"updated_at": 1}, "expireAfterSeconds": seconds}
+                    )
+                return
+        collection.create_index("updated_at", expireAfterSeconds=seconds)
     
     def save_context(self, context: ConversationContext):
         """
@@ -37,20 +96,41 @@ class SessionMemory:
         Args:
             context: Conversation context to save
         """
+        new_turns = [t for t in context.conversation_history if t.turn_id > context.persisted_turns]
+        
         if self.use_mongodb:
-            # MongoDB storage
+            # MongoDB storage: only what changed since the last save
             collection = self.db_client[self.collection_name]
-            context_dict = context.to_dict()
+            state = _flatten(context.state_dict())
+            changed = {
+                key: value for key, value in state.items()
+                if key not in context.persisted_state or context.persisted_state[key] != value
+            }
+            changed["updated_at"] = datetime.now(timezone.utc)
+            
+            update: Dict[str, Any] = {"$set": changed}
+            if new_turns:
+                update["$push"] = {
+                    "conversation_history": {
+                        "$each": [turn.to_dict() for turn in new_turns],
+                        "$slice": -self.history_limit,
+                    }
+                }
             
             # Upsert (update or insert)
-            collection.update_one(
-                {"session_id": context.session_id},
-                {"$set": context_dict},
-                upsert=True
-            )
+            collection.update_one({"session_id": context.session_id}, update, upsert=True)
+            context.persisted_state = copy.deepcopy(state)
         else:
             # In-memory storage
             self._memory_store[context.session_id] = context
+            self._memory_store.move_to_end(context.session_id)
+            while len(self._memory_store) > self.max_sessions:
+                self._memory_store.popitem(last=False)
+        
+        context.persisted_turns = context.turn_count
+        # Storage keeps the latest turns only; so does the live context
+        if len(context.conversation_history) > self.history_limit:
+            del context.conversation_history[:-self.history_limit]
     
     def load_context(self, session_id: str) -> Optional[ConversationContext]:
         """
@@ -63,18 +143,26 @@ class SessionMemory:
             Conversation context or None if not found
         """
         if self.use_mongodb:
-            # MongoDB retrieval
+            # MongoDB retrieval (only the latest turns leave the server)
             collection = self.db_client[self.collection_name]
-            doc = collection.find_one({"session_id": session_id})
+            doc = collection.find_one(
+                {"session_id": session_id},
+                {"_id": 0, "conversation_history": {"$slice": -self.history_limit}}
+            )
             
             if doc:
-                # Reconstruct context from document
-                # (Would need from_dict method in ConversationContext)
                 return self._reconstruct_context(doc)
             return None
         else:
             # In-memory retrieval
-            return self._memory_store.get(session_id)
+            context = self._memory_store.get(session_id)
+            if context is None:
+                return None
+            if datetime.now() - context.last_updated > timedelta(days=self.ttl_days):
+                del self._memory_store[session_id]
+                return None
+            self._memory_store.move_to_end(session_id)
+            return context
     
     def get_recent_sessions(self, farmer_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -88,11 +176,12 @@ class SessionMemory:
             List of session summaries
         """
         if self.use_mongodb:
-            # MongoDB query
+            # MongoDB query (served by the farmer_id / updated_at index)
             collection = self.db_client[self.collection_name]
             sessions = collection.find(
-                {"farmer_id": farmer_id}
-            ).sort("last_updated", -1).limit(limit)
+                {"farmer_id": farmer_id},
+                {"conversation_history": 0}
+            ).sort("updated_at", -1).limit(limit)
             
             return list(sessions)
         else:
@@ -116,6 +205,8 @@ class SessionMemory:
         """
         Clear sessions older than specified days
         
+        A one-off delete; the TTL index (``ttl_days``) is left as configured.
+        
         Args:
             days: Number of days to keep
         """
@@ -123,9 +214,14 @@ class SessionMemory:
         
         if self.use_mongodb:
             collection = self.db_client[self.collection_name]
-            collection.delete_many({
-                "last_updated": {"$lt": datetime.fromtimestamp(cutoff).isoformat()}
-            })
+            collection.delete_many({"$or": [
+                {"updated_at": {"$lt": datetime.fromtimestamp(cutoff, timezone.utc)}},
+                # Sessions saved before updated_at existed
+                {
+                    "updated_at": {"$exists": False},
+                    "last_updated": {"$lt": datetime.fromtimestamp(cutoff).isoformat()}
+                },
+            ]})
         else:
             to_delete = [
                 sid for sid, ctx in self._memory_store.items()
@@ -158,9 +254,21 @@ class SessionMemory:
         context.context_variables = doc.get("context_variables", {})
         context.pending_confirmation = doc.get("pending_confirmation")
         
-        # Note: Conversation history reconstruction would require
-        # recreating ConversationTurn objects from the stored data
-        # Simplified for hackathon - can be enhanced later
+        # Restore the latest turns (the projection already capped them)
+        context.conversation_history = [
+            ConversationTurn.from_dict(turn) for turn in doc.get("conversation_history", [])
+        ]
+        last_turn = context.conversation_history[-1].turn_id if context.conversation_history else 0
+        context.turn_count = doc.get("turn_count", last_turn)
+        if context.conversation_history:
+            context.current_intent = context.conversation_history[-1].detected_intent
+        for key in ("created_at", "last_updated"):
+            if isinstance(doc.get(key), str):
+                setattr(context, key, datetime.fromisoformat(doc[key]))
+        
+        # Everything loaded is already stored
+        context.persisted_turns = context.turn_count
+        context.persisted_state = _flatten(context.state_dict())
         
         return context
 
@@ -168,17 +276,27 @@ class SessionMemory:
 # Singleton instance
 _session_memory = None
 
-def get_session_memory(db_client=None) -> SessionMemory:
+def get_session_memory(
+    db_client=None,
+    history_limit: int = 50,
+    ttl_days: float = 30,
+    max_sessions: int = 10000
+) -> SessionMemory:
     """
     Get or create session memory instance
     
     Args:
         db_client: MongoDB client (optional)
+        history_limit: Turns kept per session
+        ttl_days: Idle sessions expire after this many days
+        max_sessions: Sessions kept in memory without MongoDB
     
     Returns:
         SessionMemory instance
     """
     global _session_memory
     if _session_memory is None:
-        _session_memory = SessionMemory(db_client=db_client)
+        _session_memory = SessionMemory(
+            db_client=db_client, history_limit=history_limit, ttl_days=ttl_days, max_sessions=max_sessions
+        )
     return _session_memory
@@ -0,0 +1,55 @@
+"""
+Provision Translation Models
+Downloads (or unpacks local copies of) the Hindi <-> English Argos models
+into the models directory and pins their versions, so the voice agent
+can start offline. See input_processing/argos_models.py.
+
+Usage (from the repository root, on a machine with network access):
+    python -m Backend.Voice_agent.provision_translation_models provision
+    python -m Backend.Voice_agent.provision_translation_models provision --dir /srv/kisaan/argos
+    python -m Backend.Voice_agent.provision_translation_models provision --from-file hi_en.argosmodel --from-file en_hi.argosmodel
+    python -m Backend.Voice_agent.provision_translation_models check
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from Backend.utils.kv_cache import resolve_path
+from Backend.Voice_agent.input_processing.argos_models import DEFAULT_MODELS_DIR, provision, verify_models_dir
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Provision offline Argos hi<->en models")
+    parser.add_argument("command", choices=("provision", "check"))
+    parser.add_argument(
+        "--dir", default=os.getenv("ARGOS_MODELS_DIR", DEFAULT_MODELS_DIR),
+        help="Models directory (relative paths are under Backend/)"
+    )
+    parser.add_argument(
+        "--from-file", action="append", dest="archives",
+        help="Use a local .argosmodel instead of downloading (repeatable)"
+    )
+    args = parser.parse_args()
+    models_dir = resolve_path(args.dir)
+
+    try:
+        if args.command == "provision":
+            started = time.perf_counter()
+            manifest = provision(models_dir, args.archives)
+            print(f"✅ Provisioned {len(manifest['packages'])} packages into {models_dir} "
+                  f"in {time.perf_counter() - started:.1f} s")
+        else:
+            manifest = verify_models_dir(models_dir)
+            print(f"✅ {models_dir} is provisioned")
+        for pinned in manifest["packages"]:
+            print(f"   {pinned['from_code']}->{pinned['to_code']} v{pinned['package_version']}  {pinned['directory']}")
+        return 0
+    except Exception as e:
+        print(f"❌ {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""
+Conversation Memory Index
+Per-farmer conversation memory for follow-up retrieval, kept apart from
+the shared ``farming_knowledge`` collection.
+
+Turns are spread over a fixed number of shard collections, chosen by a
+hash of the farmer id, and every query is pre-filtered on ``farmer_id``.
+A search only touches one farmer's documents, never returns another
+farmer's turns, and runs against an index a fraction of the platform's
+size.
+
+Each farmer keeps about ``max_turns`` raw turns: once they exceed it by
+``compact_batch``, the oldest (and any past ``max_age_days``) are
+compacted into extractive summary documents (what was asked, which
+intents), so a farmer's searchable history grows by one summary per
+``compact_batch`` turns.
+"""
+
+import json
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+SUMMARY_MAX_CHARS = 1500
+
+
+def _as_epoch(timestamp: Any) -> float:
+    if isinstance(timestamp, (int, float)):
+        return float(timestamp)
+    try:
+        return datetime.fromisoformat(str(timestamp)).timestamp()
+    except ValueError:
+        return time.time()
+
+
+class ConversationMemoryIndex:
+    """Sharded, per-farmer conversation collections with compaction"""
+
+    def __init__(
+        self,
+        client,
+        embedding_fn,
+        shards: int = 16,
+        max_turns: int = 200,
+        compact_batch: int = 50,
+        max_age_days: float = 90
+    ):
+        """
+        Args:
+            client: Chroma client (shared with the knowledge collection)
+            embedding_fn: Embedding function for stored documents
+            shards: Number of shard collections (fixed once data exists)
+            max_turns: Raw turns kept per farmer before compaction
+            compact_batch: Turns folded into one summary document
+            max_age_days: Raw turns older than this are compacted (0 = never)
+        """
+        self.client = client
+        self.embedding_fn = embedding_fn
+        self.shards = shards
+        self.max_turns = max_turns
+        self.compact_batch = compact_batch
+        self.max_age_days = max_age_days
+        self._collections: Dict[int, Any] = {}
+        self._lock = threading.Lock()
+        self.compactions = 0
+        self.compacted_turns = 0
+
+    def shard_of(self, farmer_id: str) -> int:
+        return zlib.crc32(str(farmer_id).encode("utf-8")) % self.shards
+
+    def _collection(self, farmer_id: str):
+        return self._shard_collection(self.shard_of(farmer_id))
+
+    def _shard_collection(self, shard: int):
+        with self._lock:
+            collection = self._collections.get(shard)
+            if collection is None:
+                collection = self.client.get_or_create_collection(
+                    name=f"conversation_memory_{shard:02d}",
+                    embedding_function=self.embedding_fn
+                )
+                self._collections[shard] = collection
+            return collection
+
+    @staticmethod
+    def _where(farmer_id: str, doc_type: Optional[str] = None) -> Dict[str, Any]:
+        if doc_type is None:
+            return {"farmer_id": str(farmer_id)}
+        return {"$and": [{"farmer_id": str(farmer_id)}, {"type": doc_type}]}
+
+    def add_turns(self, turns: Iterable[Dict[str, Any]]):
+        """Upsert turns (one write per shard), then compact the farmers touched"""
+        by_farmer: Dict[str, List[Dict[str, Any]]] = {}
+        for turn in turns:
+            by_farmer.setdefault(str(turn.get("farmer_id") or "anonymous"), []).append(turn)
+
+        by_shard: Dict[int, Dict[str, list]] = {}
+        for farmer_id, farmer_turns in by_farmer.items():
+            batch = by_shard.setdefault(self.shard_of(farmer_id), {"documents": [], "metadatas": [], "ids": []})
+            for turn in farmer_turns:
+                turn_id = turn.get("turn_id")
+                timestamp = turn.get("timestamp")
+                batch["documents"].append(
+                    f"User: {turn.get('user_input_english')}\nAssistant: {turn.get('agent_response_english')}"
+                )
+                batch["metadatas"].append({
+                    "type": "conversation",
+                    "farmer_id": farmer_id,
+                    "id": str(turn_id),
+                    "name": f"Turn {turn_id}",
+                    "timestamp": str(timestamp),
+                    "ts": _as_epoch(timestamp),
+                    "data_json": json.dumps(turn, default=str),
+                })
+                batch["ids"].append(f"chat_{farmer_id}_{turn.get('session_id', '')}_{turn_id}_{timestamp}")
+
+        for shard, batch in by_shard.items():
+            self._shard_collection(shard).upsert(**batch)
+        for farmer_id in by_farmer:
+            self.compact(farmer_id)
+
+    def search(self, farmer_id: str, query_embedding, limit: int = 3) -> Dict[str, Any]:
+        """Raw Chroma result for one farmer's turns and summaries"""
+        collection = self._collection(farmer_id)
+        return collection.query(
+            query_embeddings=[query_embedding],
+            n_results=limit,
+            where=self._where(farmer_id)
+        )
+
+    def compact(self, farmer_id: str) -> int:
+        """
+        Fold the oldest raw turns into summaries when the farmer has more than
+        ``max_turns + compact_batch`` of them, or enough expired ones; returns
+        turns compacted.
+
+        Runs after every ingest batch, so the check only fetches ids; turn
+        metadata is loaded once there is something to compact.
+        """
+        collection = self._collection(farmer_id)
+        where = self._where(farmer_id, "conversation")
+        total = len(collection.get(where=where, include=[])["ids"])
+        expired = 0
+        if self.max_age_days:
+            cutoff = time.time() - self.max_age_days * 86400
+            old = {"$and": where["$and"] + [{"ts": {"$lt": cutoff}}]}
+            expired = len(collection.get(where=old, include=[])["ids"])
+
+        if total > self.max_turns + self.compact_batch:
+            count = max(total - self.max_turns, expired)
+        elif expired >= min(self.compact_batch, 10):
+            count = expired
+        else:
+            return 0
+
+        stored = collection.get(where=where, include=["metadatas"])
+        turns = sorted(zip(stored["ids"], stored["metadatas"]), key=lambda item: item[1].get("ts", 0.0))
+        count = min(count, len(turns))
+        selected = turns[:count]
+        for start in range(0, count, self.compact_batch):
+            self._write_summary(collection, farmer_id, selected[start:start + self.compact_batch])
+        collection.delete(ids=[turn_id for turn_id, _ in selected])
+        self.compactions += 1
+        self.compacted_turns += count
+        return count
+
+    def _write_summary(self, collection, farmer_id: str, turns: List[tuple]):
+        """Extractive summary document for a run of turns"""
+        intents = Counter()
+        questions = []
+        for _, meta in turns:
+            data = json.loads(meta.get("data_json", "{}"))
+            intents[data.get("intent", "unknown")] += 1
+            question = data.get("user_input_english")
+            if question and question not in questions:
+                questions.append(question)
+
+        first, last = turns[0][1], turns[-1][1]
+        first_day = str(first.get("timestamp", ""))[:10]
+        last_day = str(last.get("timestamp", ""))[:10]
+        topics = ", ".join(f"{intent} x{n}" for intent, n in intents.most_common())
+        text = (
+            f"Earlier conversations {first_day} to {last_day} ({len(turns)} turns). "
+            f"Topics: {topics}. Farmer asked: {'; '.join(questions)}"
+        )[:SUMMARY_MAX_CHARS]
+
+        collection.upsert(
+            documents=[text],
+            metadatas=[{
+                "type": "conversation_summary",
+                "farmer_id": farmer_id,
+                "id": f"summary_{first.get('ts', 0):.0f}",
+                "name": f"Summary {first_day}..{last_day}",
+                "timestamp": str(last.get("timestamp", "")),
+                "ts": last.get("ts", 0.0),
+                "data_json": json.dumps({
+                    "summary_of": len(turns),
+                    "from": first.get("timestamp"),
+                    "to": last.get("timestamp"),
+                    "intents": dict(intents),
+                }),
+            }],
+            ids=[f"summary_{farmer_id}_{first.get('ts', 0):.0f}_{zlib.crc32(''.join(i for i, _ in turns).encode()):08x}"]
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "shards": self.shards,
+            "open_shards": len(self._collections),
+            "max_turns": self.max_turns,
+            "compact_batch": self.compact_batch,
+            "max_age_days": self.max_age_days,
+            "compactions": self.compactions,
+            "compacted_turns": self.compacted_turns,
+        }
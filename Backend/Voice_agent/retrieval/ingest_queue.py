@@ -0,0 +1,197 @@
+"""
+Vector Ingest Queue
+Write-behind queue for conversation turns: requests only enqueue, and a
+background worker embeds and upserts the turns into the vector store in
+batches. Embedding and the Chroma write leave the user path.
+
+The queue is bounded. When it is full, the oldest pending turn is dropped
+and counted, because turns also live in session memory and the vector
+copy only feeds follow-up retrieval. ``flush()`` waits for everything
+queued so far; the API calls it on shutdown.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+
+class VectorIngestQueue:
+    """Bounded in-process queue with one batching worker thread"""
+
+    def __init__(
+        self,
+        store_factory: Callable[[], Any],
+        max_pending: int = 1000,
+        batch_size: int = 32,
+        max_wait_s: float = 0.5
+    ):
+        """
+        Args:
+            store_factory: Returns the vector store (called on the worker, so
+                loading the embedding model never blocks a request)
+            max_pending: Turns held before the oldest is dropped
+            batch_size: Turns per bulk upsert
+            max_wait_s: How long a partial batch waits for more turns
+        """
+        self.store_factory = store_factory
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.max_wait_s = max_wait_s
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self._flushing = 0  # callers waiting in flush(): don't hold partial batches
+        self._store = None
+        self._worker: Optional[threading.Thread] = None
+
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self.high_water = 0
+        self.last_batch_ms = 0.0
+        self._write_ms_total = 0.0
+
+    def put(self, turn: Dict[str, Any]) -> bool:
+        """
+        Queue one turn (never blocks). Returns False if the queue is closed;
+        a full queue drops its oldest turn instead.
+        """
+        with self._cond:
+            if self._closed:
+                return False
+            if len(self._pending) >= self.max_pending:
+                self._pending.popleft()
+                self.dropped += 1
+            self._pending.append(turn)
+            self.enqueued += 1
+            self.high_water = max(self.high_water, len(self._pending))
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="vector-ingest", daemon=True)
+                self._worker.start()
+            self._cond.notify_all()
+        return True
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        with self._cond:
+            while not self._pending and not self._closed:
+                self._cond.wait()
+            # Give a partial batch a moment to fill up
+            deadline = time.monotonic() + self.max_wait_s
+            while 0 < len(self._pending) < self.batch_size and not (self._closed or self._flushing):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch = [self._pending.popleft() for _ in range(min(self.batch_size, len(self._pending)))]
+            self._in_flight = len(batch)
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return  # closed and drained
+            started = time.perf_counter()
+            try:
+                if self._store is None:
+                    self._store = self.store_factory()
+                self._store.ingest_conversation_turns(batch)
+                ok = True
+            except Exception as e:
+                print(f"⚠️  Failed to ingest {len(batch)} turns into VectorDB: {e}")
+                ok = False
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._cond:
+                self.batches += 1
+                self.last_batch_ms = round(elapsed_ms, 1)
+                self._write_ms_total += elapsed_ms
+                if ok:
+                    self.written += len(batch)
+                else:
+                    self.failed += len(batch)
+                self._in_flight = 0
+                self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued turn is written; False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                while self._pending or self._in_flight:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+            finally:
+                self._flushing -= 1
+        return True
+
+    def close(self, timeout: Optional[float] = 10.0) -> bool:
+        """Flush, then stop the worker; later ``put`` calls are refused"""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout)
+        return flushed
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and backpressure counters"""
+        with self._cond:
+            return {
+                "pending": len(self._pending),
+                "in_flight": self._in_flight,
+                "max_pending": self.max_pending,
+                "high_water": self.high_water,
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "batches": self.batches,
+                "avg_batch_size": round((self.written + self.failed) / self.batches, 1) if self.batches else 0.0,
+                "last_batch_ms": self.last_batch_ms,
+                "avg_batch_ms": round(self._write_ms_total / self.batches, 1) if self.batches else 0.0,
+                "closed": self._closed,
+            }
+
+
+# Singleton
+_ingest_queue: Optional[VectorIngestQueue] = None
+_lock = threading.Lock()
+
+
+def get_ingest_queue() -> VectorIngestQueue:
+    """Process-wide queue feeding the shared vector store"""
+    global _ingest_queue
+    with _lock:
+        if _ingest_queue is None:
+            from Backend.Voice_agent.config import get_config
+            from Backend.Voice_agent.retrieval.vector_store import get_vector_store
+            config = get_config()
+            _ingest_queue = VectorIngestQueue(
+                get_vector_store,
+                max_pending=config.vector_ingest_max_pending,
+                batch_size=config.vector_ingest_batch_size,
+                max_wait_s=config.vector_ingest_max_wait_ms / 1000,
+            )
+        return _ingest_queue
+
+
+def close_ingest_queue(timeout: float = 10.0) -> bool:
+    """Flush and stop the queue (no-op if nothing was ever queued)"""
+    global _ingest_queue
+    with _lock:
+        queue, _ingest_queue = _ingest_queue, None
+    return queue.close(timeout) if queue is not None else True
+
+
+def ingest_queue_stats() -> Optional[Dict[str, Any]]:
+    """Queue stats, or None if the queue was never created"""
+    return _ingest_queue.stats() if _ingest_queue is not None else None
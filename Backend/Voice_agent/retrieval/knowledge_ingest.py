@@ -0,0 +1,234 @@
+"""
+Knowledge Ingestion
+Indexes the Mongo master collections (crops_master, schemes_master,
+disease_master) into the vector store's knowledge collection.
+
+Documents are streamed from a cursor and embedded in batches, one bulk
+upsert per batch. Each indexed document stores a content hash, so a
+re-run only embeds what changed; documents that disappeared from Mongo
+(or were deactivated) are deleted. Only documents this job wrote are ever
+deleted - the built-in bootstrap knowledge is left alone.
+
+Run with ``python -m Backend.Voice_agent.index_knowledge``.
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+def _join(values: Optional[Iterable[Any]]) -> str:
+    return ", ".join(str(v) for v in (values or []) if v)
+
+
+def _crop_text(doc: Dict[str, Any]) -> str:
+    names = doc.get("localNames") or {}
+    requirements = doc.get("requirements") or {}
+    temperature = requirements.get("temperatureRange") or {}
+    text = f"{names.get('en') or doc['cropKey']} ({names.get('hi', '')}). "
+    text += f"Suitable soil: {_join(doc.get('suitableSoils'))}. "
+    text += f"Season: {doc.get('season')}. Maturity: {doc.get('maturityDays')} days. "
+    text += f"Requirements: {doc.get('waterRequirement')} water"
+    if temperature:
+        text += f", {temperature.get('min')}-{temperature.get('max')} °C"
+    text += ". "
+    if doc.get("commonDiseases"):
+        text += f"Common diseases: {_join(doc['commonDiseases'])}. "
+    if doc.get("marketDemandTrend"):
+        text += f"Market demand: {doc['marketDemandTrend']}."
+    return text.strip()
+
+
+def _scheme_text(doc: Dict[str, Any]) -> str:
+    rules = doc.get("eligibilityRules") or {}
+    text = f"{doc['schemeName']} ({(doc.get('localizedNames') or {}).get('hi', '')}). "
+    text += f"{doc.get('description', '')}. Benefits: {doc.get('benefits', '')}. "
+    text += f"Category: {doc.get('category', '')}. "
+    eligibility = []
+    if rules.get("minLandSizeAcres"):
+        eligibility.append(f"at least {rules['minLandSizeAcres']} acres")
+    if rules.get("maxLandSizeAcres"):
+        eligibility.append(f"at most {rules['maxLandSizeAcres']} acres")
+    for label, key in (("crops", "crops"), ("states", "states"), ("soils", "soilTypes")):
+        if rules.get(key):
+            eligibility.append(f"{label}: {_join(rules[key])}")
+    text += f"Eligibility: {'; '.join(eligibility) or 'all farmers'}."
+    return text
+
+
+def _disease_text(doc: Dict[str, Any]) -> str:
+    remedy = doc.get("remedy") or {}
+    text = f"{doc['diseaseName']} ({(doc.get('localizedNames') or {}).get('hi', '')}). "
+    text += f"Affects: {_join(doc.get('affectedCrops'))}. "
+    text += f"Symptoms: {_join(doc.get('symptoms'))}. "
+    text += f"Severity: {doc.get('severity', '')}, spread risk: {doc.get('spreadRisk', '')}. "
+    if remedy:
+        text += f"Treatment: {remedy.get('treatment', '')} ({remedy.get('dosage', '')}, {remedy.get('applicationMethod', '')}). "
+        text += f"Prevention: {_join(remedy.get('preventionTips'))}."
+    return text.strip()
+
+
+def _crop_data(doc: Dict[str, Any]) -> Dict[str, Any]:
+    names = doc.get("localNames") or {}
+    # name / name_hindi / suitable_soil / season match the bootstrap shape the synthesizer reads
+    return {**doc, "name": names.get("en") or doc["cropKey"].title(), "name_hindi": names.get("hi"),
+            "suitable_soil": [s.lower() for s in doc.get("suitableSoils") or []]}
+
+
+def _scheme_data(doc: Dict[str, Any]) -> Dict[str, Any]:
+    return {**doc, "name": doc["schemeName"], "name_hindi": (doc.get("localizedNames") or {}).get("hi")}
+
+
+def _disease_data(doc: Dict[str, Any]) -> Dict[str, Any]:
+    return {**doc, "name": doc["diseaseName"], "name_hindi": (doc.get("localizedNames") or {}).get("hi")}
+
+
+@dataclass
+class KnowledgeSpec:
+    """How one master collection maps onto knowledge documents"""
+    collection: str
+    key_field: str
+    doc_type: str  # 'type' metadata the retriever filters on
+    id_prefix: str
+    to_text: Callable[[Dict[str, Any]], str]
+    to_data: Callable[[Dict[str, Any]], Dict[str, Any]]
+    name_field: str
+    query: Dict[str, Any] = field(default_factory=dict)
+
+
+KNOWLEDGE_SPECS = (
+    KnowledgeSpec("crops_master", "cropKey", "crop_info", "crop", _crop_text, _crop_data, "cropKey"),
+    KnowledgeSpec("schemes_master", "schemeKey", "scheme_info", "scheme", _scheme_text, _scheme_data, "schemeName",
+                  query={"isActive": {"$ne": False}}),
+    KnowledgeSpec("disease_master", "diseaseKey", "disease_info", "disease", _disease_text, _disease_data, "diseaseName"),
+)
+
+
+def content_hash(text: str, data: Dict[str, Any]) -> str:
+    payload = text + "\0" + json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _indexed_hashes(store, doc_type: str) -> Dict[str, str]:
+    """doc id -> content hash of what this job indexed earlier"""
+    existing = store.collection.get(
+        where={"$and": [{"type": doc_type}, {"source": "mongo"}]}, include=["metadatas"]
+    )
+    return {doc_id: meta.get("content_hash", "") for doc_id, meta in zip(existing["ids"], existing["metadatas"])}
+
+
+def ingest_collection(
+    store,
+    db,
+    spec: KnowledgeSpec,
+    batch_size: int = 128,
+    full: bool = False,
+    progress: Optional[Callable[[str], None]] = print
+) -> Dict[str, Any]:
+    """
+    Index one master collection
+
+    Args:
+        store: VectorStore
+        db: pymongo database
+        spec: Collection mapping
+        batch_size: Documents per embedding batch / upsert
+        full: Re-embed everything, ignoring stored hashes
+        progress: Called with a status line after every batch (None = quiet)
+
+    Returns:
+        Counters: scanned, embedded, unchanged, skipped (documents that could
+        not be converted), deleted, failed, seconds, docs_per_s
+    """
+    started = time.perf_counter()
+    indexed = _indexed_hashes(store, spec.doc_type)
+    seen = set()
+    counts = {"scanned": 0, "embedded": 0, "unchanged": 0, "skipped": 0, "deleted": 0, "failed": 0}
+    texts: List[str] = []
+    metadatas: List[Dict[str, Any]] = []
+    ids: List[str] = []
+
+    def flush():
+        if not ids:
+            return
+        try:
+            store.add_texts(texts, metadatas, ids)
+            counts["embedded"] += len(ids)
+        except Exception as e:
+            counts["failed"] += len(ids)
+            print(f"⚠️  {spec.collection}: batch of {len(ids)} failed: {e}")
+        texts.clear()
+        metadatas.clear()
+        ids.clear()
+        if progress:
+            elapsed = time.perf_counter() - started
+            progress(f"   {spec.collection}: {counts['scanned']} scanned, {counts['embedded']} embedded, "
+                     f"{counts['unchanged']} unchanged ({counts['scanned'] / elapsed:.0f} docs/s)")
+
+    cursor = db[spec.collection].find(spec.query, batch_size=batch_size)
+    for doc in cursor:
+        key = doc.get(spec.key_field)
+        if not key:
+            continue
+        doc.pop("_id", None)
+        counts["scanned"] += 1
+        doc_id = f"{spec.id_prefix}_{key}"
+        seen.add(doc_id)
+
+        # A malformed document is reported and skipped (its earlier version,
+        # if any, stays indexed) rather than aborting the whole run
+        try:
+            text = spec.to_text(doc)
+            data = spec.to_data(doc)
+            digest = content_hash(text, data)
+            metadata = {
+                "type": spec.doc_type,
+                "id": str(key),
+                "name": str(doc.get(spec.name_field) or key),
+                "source": "mongo",
+                "content_hash": digest,
+                "data": json.loads(json.dumps(data, default=str)),
+            }
+        except Exception as e:
+            counts["skipped"] += 1
+            print(f"⚠️  {spec.collection}: skipped {doc_id}: {type(e).__name__}: {e}")
+            continue
+        if not full and indexed.get(doc_id) == digest:
+            counts["unchanged"] += 1
+            continue
+
+        texts.append(text)
+        metadatas.append(metadata)
+        ids.append(doc_id)
+        if len(ids) >= batch_size:
+            flush()
+    flush()
+
+    removed = [doc_id for doc_id in indexed if doc_id not in seen]
+    for start in range(0, len(removed), 500):
+        store.collection.delete(ids=removed[start:start + 500])
+    counts["deleted"] = len(removed)
+
+    seconds = time.perf_counter() - started
+    counts["seconds"] = round(seconds, 2)
+    counts["docs_per_s"] = round(counts["scanned"] / seconds, 1) if seconds else 0.0
+    return counts
+
+
+def ingest_knowledge(
+    store,
+    db,
+    collections: Optional[Iterable[str]] = None,
+    batch_size: int = 128,
+    full: bool = False,
+    progress: Optional[Callable[[str], None]] = print
+) -> Dict[str, Dict[str, Any]]:
+    """Index every master collection (or the named ones); counters per collection"""
+    wanted = set(collections) if collections else None
+    return {
+        spec.collection: ingest_collection(store, db, spec, batch_size=batch_size, full=full, progress=progress)
+        for spec in KNOWLEDGE_SPECS
+        if wanted is None or spec.collection in wanted
+    }
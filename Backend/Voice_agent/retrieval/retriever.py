@@ -2,7 +2,7 @@
 Retriever - RAG-style information retrieval
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Tuple
 from Backend.Voice_agent.core.intent import Intent
 from Backend.Voice_agent.retrieval.weather_service import get_weather_service
 from Backend.Voice_agent.retrieval.market_service import get_market_service
@@ -22,10 +22,12 @@ except ImportError:
 class Retriever:
     """RAG-style retriever using Vector DB (Chroma) and specialized services"""
     
-    def __init__(self):
+    def __init__(self, vector_store=None):
         # Optional components - only initialize if available
         self.registry = get_knowledge_registry() if get_knowledge_registry else None
-        self.vector_store = get_vector_store() if get_vector_store else None
+        if vector_store is None and get_vector_store:
+            vector_store = get_vector_store()
+        self.vector_store = vector_store
         self.weather_service = get_weather_service()
         self.market_service = get_market_service()
     
@@ -47,37 +49,70 @@ class Retriever:
             List of retrieved documents/facts
         """
         retrieved = []
+        for _, fetch in self.sources_for(intent, query_text, context):
+            retrieved.extend(fetch())
+        return retrieved
+    
+    def sources_for(
+        self,
+        intent: Intent,
+        query_text: str,
+        context: Dict[str, Any] = None,
+        use_async: bool = False
+    ) -> List[Tuple[str, Callable[[], List[Dict[str, Any]]]]]:
+        """
+        Fetchers ``retrieve`` would call for this intent, in result order
+        
+        The fetchers are independent of each other, so the async agent
+        pipeline runs them concurrently and concatenates the results.
+        
+        Args:
+            use_async: Return coroutine fetchers where a source has one
+                (weather), for callers running on an event loop
+        
+        Returns:
+            (source name, zero-argument fetch function) pairs
+        """
+        location = ((context or {}).get("farmer_profile") or {}).get("location")
+        
+        async def weather_async():
+            return await self._retrieve_weather_info_async(location)
+        
+        weather = weather_async if use_async else (lambda: self._retrieve_weather_info(location))
         
         # Intent-based retrieval
         if intent == Intent.CROP_PLANNING:
-            # RAG Search for crops
-            retrieved.extend(self._retrieve_crop_info(query_text, context))
-            # Weather for context
-            retrieved.extend(self._retrieve_weather_info())
-            # Market for context
-            retrieved.extend(self._retrieve_market_info(query_text))
+            return [
+                # RAG Search for crops
+                ("crop_info", lambda: self._retrieve_crop_info(query_text, context)),
+                # Weather for context
+                ("weather", weather),
+                # Market for context
+                ("market", lambda: self._retrieve_market_info(query_text)),
+            ]
         
         elif intent == Intent.FINANCE_REPORT or intent == Intent.COST_ANALYSIS or intent == Intent.OPTIMIZATION_ADVICE:
              # Try retrieving semantic financial context
-             retrieved.extend(self._retrieve_financial_info(query_text))
+             return [("financial", lambda: self._retrieve_financial_info(query_text))]
 
         elif intent == Intent.STORAGE_DECISION or intent == Intent.SELLING_DECISION:
-            retrieved.extend(self._retrieve_market_info(query_text))
+            return [("market", lambda: self._retrieve_market_info(query_text))]
         
         elif intent == Intent.GOVERNMENT_SCHEME:
-            retrieved.extend(self._retrieve_scheme_info(query_text, context))
+            return [("schemes", lambda: self._retrieve_scheme_info(query_text, context))]
         
         elif intent == Intent.WEATHER_QUERY:
-            retrieved.extend(self._retrieve_weather_info())
+            return [("weather", weather)]
         
         elif intent == Intent.MARKET_PRICE:
-            retrieved.extend(self._retrieve_market_info(query_text))
+            return [("market", lambda: self._retrieve_market_info(query_text))]
             
         elif intent == Intent.FOLLOW_UP or intent == Intent.UNKNOWN:
             # For general conversation, search history
-            retrieved.extend(self._retrieve_conversation_history(query_text))
+            farmer_id = (context or {}).get("farmer_id")
+            return [("history", lambda: self._retrieve_conversation_history(query_text, farmer_id))]
         
-        return retrieved
+        return []
     
     def _retrieve_crop_info(self, query: str, context: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Retrieve crop information via Vector Search"""
@@ -106,10 +141,17 @@ class Retriever:
             
         return docs
     
-    def _retrieve_weather_info(self) -> List[Dict[str, Any]]:
+    def _retrieve_weather_info(self, location=None) -> List[Dict[str, Any]]:
         """Retrieve weather information via Live Service"""
-        weather_data = self.weather_service.get_current_weather()
-        
+        weather_data = self.weather_service.get_current_weather(location)
+        return self._weather_docs(weather_data)
+    
+    async def _retrieve_weather_info_async(self, location=None) -> List[Dict[str, Any]]:
+        """Weather for the farmer's location without blocking a worker thread"""
+        weather_data = await self.weather_service.get_current_weather_async(location)
+        return self._weather_docs(weather_data)
+    
+    def _weather_docs(self, weather_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         return [{
             "source": weather_data.get("source", "weather_service"),
             "type": "weather_info",
@@ -161,15 +203,15 @@ class Retriever:
         
         return docs
 
-    def _retrieve_conversation_history(self, query: str) -> List[Dict[str, Any]]:
-        """Retrieve relevant conversation history"""
-        if not self.vector_store:
+    def _retrieve_conversation_history(self, query: str, farmer_id: str = None) -> List[Dict[str, Any]]:
+        """Retrieve relevant conversation history (this farmer's only)"""
+        if not self.vector_store or not farmer_id:
             return []
             
-        results = self.vector_store.search(
+        results = self.vector_store.search_conversations(
+            farmer_id=farmer_id,
             query=query,
-            limit=3,
-            type_filter="conversation"
+            limit=3
         )
         
         docs = []
@@ -3,23 +3,45 @@ Vector Store - Semantic Search Engine using ChromaDB
 Stores and retrieves knowledge about crops, schemes, etc.
 """
 
-import chromadb
-from chromadb.utils import embedding_functions
 import os
-from typing import List, Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Sequence, Union
 import json
 
+from Backend.utils.lazy_import import lazy_import
+from Backend.Voice_agent.config import get_config
+from Backend.Voice_agent.retrieval.conversation_memory import ConversationMemoryIndex
+
+chromadb = lazy_import("chromadb")
+embedding_functions = lazy_import("chromadb.utils.embedding_functions")
+
 class VectorStore:
     """
     ChromaDB-based vector store for semantic search
+    
+    Query embeddings are computed by the store itself (in batches, through
+    an LRU keyed by query text) and passed to Chroma precomputed, so a text
+    is embedded once however many filtered searches use it.
+    
+    Conversation turns live in per-farmer partitions (see
+    conversation_memory.py), not in the knowledge collection.
     """
     
-    def __init__(self, persist_path: str = "chroma_db"):
+    def __init__(
+        self,
+        persist_path: str = "chroma_db",
+        embedding_cache_size: int = 1024,
+        conversation_options: Optional[Dict[str, Any]] = None
+    ):
         """
         Initialize Vector Store
         
         Args:
             persist_path: Path to store ChromaDB data
+            embedding_cache_size: Query embeddings kept in memory
+            conversation_options: ConversationMemoryIndex settings (shards,
+                max_turns, compact_batch, max_age_days)
         """
         # Initialize client
         base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -30,12 +52,23 @@ class VectorStore:
         # Use default MiniLM-L6-v2 embeddings (lightweight, runs on CPU)
         self.embedding_fn = embedding_functions.DefaultEmbeddingFunction()
         
+        # Query text -> embedding (LRU)
+        self.embedding_cache_size = embedding_cache_size
+        self._embeddings: "OrderedDict[str, Any]" = OrderedDict()
+        self._embed_lock = threading.Lock()
+        self.embedding_hits = 0
+        self.embedding_misses = 0
+        self.embedding_batches = 0
+        
         # Get or create collection
         self.collection = self.client.get_or_create_collection(
             name="farming_knowledge",
             embedding_function=self.embedding_fn
         )
         
+        # Per-farmer conversation memory (sharded collections)
+        self.conversations = ConversationMemoryIndex(self.client, self.embedding_fn, **(conversation_options or {}))
+        
         # Bootstrap if empty
         if self.collection.count() == 0:
             print("🚀 Bootstrapping Vector DB with initial knowledge...")
@@ -97,6 +130,29 @@ class VectorStore:
             )
             print(f"✅ Bootstrapped {len(documents)} documents into Vector DB")
             
+    def embed(self, texts: Sequence[str]) -> List[Any]:
+        """
+        Query embeddings for ``texts``, computing only the uncached ones
+        (in a single batch). Embedding runs under a lock, so concurrent
+        searches for the same text wait for one pass instead of repeating it.
+        """
+        with self._embed_lock:
+            missing = [text for text in dict.fromkeys(texts) if text not in self._embeddings]
+            self.embedding_hits += len(texts) - len(missing)
+            if missing:
+                self.embedding_misses += len(missing)
+                self.embedding_batches += 1
+                for text, embedding in zip(missing, self.embedding_fn(missing)):
+                    self._embeddings[text] = embedding
+            
+            embeddings = []
+            for text in texts:
+                self._embeddings.move_to_end(text)
+                embeddings.append(self._embeddings[text])
+            while len(self._embeddings) > self.embedding_cache_size:
+                self._embeddings.popitem(last=False)
+            return embeddings
+    
     def search(self, query: str, limit: int = 3, type_filter: str = None) -> List[Dict[str, Any]]:
         """
         Semantic search
@@ -109,18 +165,55 @@ class VectorStore:
         Returns:
             List of results with data
         """
-        where = {"type": type_filter} if type_filter else None
+        return self.search_many([query], [type_filter], limit)[0]
+    
+    def search_many(
+        self,
+        queries: Sequence[str],
+        filters: Optional[Sequence[Optional[str]]] = None,
+        limit: Union[int, Sequence[int]] = 3
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Several searches with one embedding pass
         
-        results = self.collection.query(
-            query_texts=[query],
-            n_results=limit,
-            where=where
-        )
+        Queries sharing a filter and limit go to Chroma in one call.
+        
+        Args:
+            queries: Search queries
+            filters: 'type' filter per query (None = unfiltered); default none
+            limit: Number of results, for all queries or per query
+            
+        Returns:
+            Results per query, in the order of ``queries``
+        """
+        filters = list(filters) if filters is not None else [None] * len(queries)
+        limits = [limit] * len(queries) if isinstance(limit, int) else list(limit)
+        if not (len(filters) == len(limits) == len(queries)):
+            raise ValueError("queries, filters and limits must have the same length")
+        
+        embeddings = self.embed(queries)
+        
+        groups: Dict[tuple, List[int]] = {}
+        for i, key in enumerate(zip(filters, limits)):
+            groups.setdefault(key, []).append(i)
         
+        output: List[List[Dict[str, Any]]] = [[] for _ in queries]
+        for (type_filter, n_results), indices in groups.items():
+            results = self.collection.query(
+                query_embeddings=[embeddings[i] for i in indices],
+                n_results=n_results,
+                where={"type": type_filter} if type_filter else None
+            )
+            for row, i in enumerate(indices):
+                output[i] = self._parse_results(results, row)
+        return output
+    
+    def _parse_results(self, results: Dict[str, Any], row: int) -> List[Dict[str, Any]]:
+        """Result dicts for one query of a Chroma response"""
         parsed_results = []
         if results["documents"]:
-            for i, doc in enumerate(results["documents"][0]):
-                meta = results["metadatas"][0][i]
+            for i, doc in enumerate(results["documents"][row]):
+                meta = results["metadatas"][row][i]
                 
                 # Parse stored JSON data back to dict
                 data = json.loads(meta["data_json"]) if "data_json" in meta else {}
@@ -131,26 +224,43 @@ class VectorStore:
                     "id": meta["id"],
                     "name": meta["name"],
                     "data": data,
-                    "distance": results["distances"][0][i] if "distances" in results else 0
+                    "distance": results["distances"][row][i] if results.get("distances") else 0
                 })
                 
         return parsed_results
+    
+    def embedding_stats(self) -> Dict[str, Any]:
+        """Query-embedding cache counters"""
+        lookups = self.embedding_hits + self.embedding_misses
+        return {
+            "entries": len(self._embeddings),
+            "max_entries": self.embedding_cache_size,
+            "hits": self.embedding_hits,
+            "misses": self.embedding_misses,
+            "batches": self.embedding_batches,
+            "hit_rate": round(self.embedding_hits / lookups, 4) if lookups else 0.0,
+        }
 
     def add_text(self, text: str, metadata: Dict[str, Any], doc_id: str):
         """Generic method to add text to vector store"""
-        # Ensure ID is unique string
-        doc_id = str(doc_id)
+        self.add_texts([text], [metadata], [doc_id])
+        # print(f"✓ Ingested doc {doc_id} into Vector DB")
+    
+    def add_texts(self, texts: List[str], metadatas: List[Dict[str, Any]], doc_ids: List[str]):
+        """Bulk upsert: one embedding batch and one write for all documents"""
+        # Ensure IDs are unique strings
+        doc_ids = [str(doc_id) for doc_id in doc_ids]
         
         # Serialize complex nested data in metadata
-        if "data" in metadata:
-            metadata["data_json"] = json.dumps(metadata.pop("data"))
+        for metadata in metadatas:
+            if "data" in metadata:
+                metadata["data_json"] = json.dumps(metadata.pop("data"))
             
         self.collection.upsert(
-            documents=[text],
-            metadatas=[metadata],
-            ids=[doc_id]
+            documents=texts,
+            metadatas=metadatas,
+            ids=doc_ids
         )
-        # print(f"✓ Ingested doc {doc_id} into Vector DB")
 
     def ingest_scheme(self, scheme_data: Dict[str, Any]):
         """Ingest single scheme"""
@@ -195,25 +305,27 @@ class VectorStore:
 
     def ingest_conversation_turn(self, turn_data: Dict[str, Any]):
         """Ingest conversation history"""
-        # We only want to index semantic content, not system metadata
-        user_text = turn_data.get("user_input_english")
-        agent_text = turn_data.get("agent_response_english")
-        turn_id = turn_data.get("turn_id")
-        timestamp = turn_data.get("timestamp")
-        
-        text = f"User: {user_text}\nAssistant: {agent_text}"
-        
-        self.add_text(
-            text=text,
-            metadata={
-                "type": "conversation",
-                "id": str(turn_id),
-                "name": f"Turn {turn_id}",
-                "timestamp": str(timestamp), 
-                "data": turn_data
-            },
-            doc_id=f"chat_{turn_id}_{timestamp}"
-        )
+        self.ingest_conversation_turns([turn_data])
+    
+    def ingest_conversation_turns(self, turns: List[Dict[str, Any]]):
+        """Ingest several conversation turns (bulk upsert into each farmer's partition)"""
+        if turns:
+            self.conversations.add_turns(turns)
+    
+    def search_conversations(self, farmer_id: str, query: str, limit: int = 3) -> List[Dict[str, Any]]:
+        """Semantic search over one farmer's past turns and summaries"""
+        results = self.conversations.search(farmer_id, self.embed([query])[0], limit)
+        return self._parse_results(results, 0)
+    
+    def delete_legacy_conversations(self) -> int:
+        """
+        Remove conversation turns stored in the knowledge collection before
+        memory was partitioned per farmer; returns how many were deleted
+        """
+        legacy = self.collection.get(where={"type": "conversation"}, include=[])
+        if legacy["ids"]:
+            self.collection.delete(ids=legacy["ids"])
+        return len(legacy["ids"])
 
 # Singleton
 _vector_store = None
@@ -221,5 +333,14 @@ _vector_store = None
 def get_vector_store() -> VectorStore:
     global _vector_store
     if _vector_store is None:
-        _vector_store = VectorStore()
+        config = get_config()
+        _vector_store = VectorStore(
+            embedding_cache_size=config.embedding_cache_size,
+            conversation_options={
+                "shards": config.conversation_shards,
+                "max_turns": config.conversation_max_turns,
+                "compact_batch": config.conversation_compact_batch,
+                "max_age_days": config.conversation_max_age_days,
+            }
+        )
     return _vector_store
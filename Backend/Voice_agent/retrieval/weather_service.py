@@ -1,12 +1,144 @@
 """
 Weather Service - Live weather data from OpenWeatherMap
+
+Lookups are keyed by the geohash cell of the farmer's coordinates
+(precision 5 is a ~5 km cell, about a village): every farmer in a cell
+shares one cached reading. A reading is served from cache for
+``cache_ttl_s``; after that, until ``stale_ttl_s``, the stale reading is
+returned at once while a single background request refreshes it. HTTP
+goes through pooled keep-alive clients (httpx), async for the API
+pipeline and sync for the CLI demos.
+
+Callers pass (lat, lon). ``find_farmer_location`` resolves a farmer's
+coordinates from the farmers collection, falling back to the centre of
+their district.
 """
 
-import requests
-from typing import Dict, Any, Optional
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Sequence, Set, Tuple
+
+import httpx
+
 from Backend.Voice_agent.config import get_config
 from Backend.Voice_agent.retrieval.sources import get_knowledge_registry
 
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+DEFAULT_LOCATION = (18.5204, 73.8567)  # Pune, used when the farmer has no coordinates
+
+# District centres, for farmers without stored coordinates (English and
+# Devanagari names, as onboarding and the mock data store them)
+DISTRICT_COORDINATES: Dict[str, Tuple[float, float]] = {
+    "pune": (18.5204, 73.8567), "पुणे": (18.5204, 73.8567),
+    "nashik": (19.9975, 73.7898), "nasik": (19.9975, 73.7898), "नाशिक": (19.9975, 73.7898),
+    "nagpur": (21.1458, 79.0882), "नागपुर": (21.1458, 79.0882),
+    "aurangabad": (19.8762, 75.3433), "औरंगाबाद": (19.8762, 75.3433),
+    "ahmednagar": (19.0948, 74.7480), "अहमदनगर": (19.0948, 74.7480),
+    "solapur": (17.6599, 75.9064), "सोलापुर": (17.6599, 75.9064),
+    "kolhapur": (16.7050, 74.2433), "कोल्हापुर": (16.7050, 74.2433),
+    "satara": (17.6805, 74.0183), "सातारा": (17.6805, 74.0183),
+    "mumbai": (19.0760, 72.8777),
+    "ludhiana": (30.9010, 75.8573),
+    "bangalore rural": (13.2846, 77.6078),
+}
+
+
+def parse_location(location: Any) -> Optional[Tuple[float, float]]:
+    """(lat, lon) from a pair of numbers, or None if it is not a valid coordinate"""
+    if isinstance(location, (str, bytes)):
+        return None  # e.g. "Nasik,IN": names go through DISTRICT_COORDINATES
+    try:
+        lat, lon = (float(v) for v in location)
+    except (TypeError, ValueError):
+        return None
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return None
+    return lat, lon
+
+
+def farmer_coordinates(farmer: Optional[Dict[str, Any]]) -> Optional[Tuple[float, float]]:
+    """
+    (lat, lon) of a farmer document or user dict: stored coordinates
+    (``location.lat/lon`` or ``location.coordinates``), else its district
+    """
+    if not farmer:
+        return None
+    location = farmer.get("location")
+    if isinstance(location, dict):
+        point = location.get("coordinates") or location
+        coordinates = parse_location((point.get("lat"), point.get("lon")))
+        district = location.get("district")
+    else:
+        coordinates = parse_location(location) if location is not None else None
+        district = None
+    if coordinates:
+        return coordinates
+    district = district or farmer.get("district")
+    if isinstance(district, str):
+        return DISTRICT_COORDINATES.get(district.split(",")[0].strip().lower())
+    return None
+
+
+def find_farmer_location(db, farmer_id: str, fallback: Optional[Dict[str, Any]] = None) -> Optional[Tuple[float, float]]:
+    """
+    Farmer's (lat, lon) from the farmers collection, else from ``fallback``
+    (e.g. the authenticated user's district); None if neither places them
+    """
+    if db is not None and farmer_id:
+        try:
+            doc = db.farmers.find_one(
+                {"$or": [{"_id": farmer_id}, {"farmer_id": farmer_id}]},
+                {"location": 1, "district": 1}
+            )
+            coordinates = farmer_coordinates(doc)
+            if coordinates:
+                return coordinates
+        except Exception as e:
+            print(f"⚠️  Farmer location lookup failed for {farmer_id}: {e}")
+    return farmer_coordinates(fallback)
+
+
+def geohash(lat: float, lon: float, precision: int = 5) -> str:
+    """Standard base-32 geohash of a point"""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, value, even = [], 0, 0, True
+    while len(chars) < precision:
+        rng, coord = (lon_range, lon) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        value <<= 1
+        if coord >= mid:
+            value |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_GEOHASH_ALPHABET[value])
+            bits, value = 0, 0
+    return "".join(chars)
+
+
+def geohash_center(cell: str) -> Tuple[float, float]:
+    """(lat, lon) at the centre of a geohash cell"""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    even = True
+    for char in cell:
+        value = _GEOHASH_ALPHABET.index(char)
+        for shift in range(4, -1, -1):
+            rng = lon_range if even else lat_range
+            mid = (rng[0] + rng[1]) / 2
+            if value >> shift & 1:
+                rng[0] = mid
+            else:
+                rng[1] = mid
+            even = not even
+    return (lat_range[0] + lat_range[1]) / 2, (lon_range[0] + lon_range[1]) / 2
+
+
 class WeatherService:
     """Service to fetch live weather data"""
     
@@ -15,13 +147,132 @@ class WeatherService:
     def __init__(self):
         self.config = get_config()
         self.api_key = self.config.openweather_api_key
+        self.precision = self.config.weather_geohash_precision
+        self.cache_ttl_s = self.config.weather_cache_ttl_s
+        self.stale_ttl_s = max(self.config.weather_stale_ttl_s, self.cache_ttl_s)
+        self.max_cells = self.config.weather_cache_max_cells
+        
+        # geohash cell -> (weather, fetched_at monotonic)
+        self._cache: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: set = set()  # cells with a request in flight
+        self._in_flight: Dict[str, asyncio.Future] = {}  # async misses, coalesced per cell
+        self._tasks: Set[asyncio.Future] = set()  # background refreshes (keeps them referenced)
         
-    def get_current_weather(self, location: str = "Pune,IN") -> Dict[str, Any]:
+        limits = httpx.Limits(
+            max_connections=self.config.weather_http_max_connections,
+            max_keepalive_connections=self.config.weather_http_max_connections,
+        )
+        self._client = httpx.Client(base_url=self.BASE_URL, timeout=5.0, limits=limits)
+        self._limits = limits
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_loop = None
+        
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.errors = 0  # failed requests a caller waited on
+        self.refresh_errors = 0  # failed background refreshes
+        self.invalid_locations = 0
+    
+    def _cell(self, location: Optional[Sequence[float]]) -> str:
+        if location is None:
+            lat, lon = DEFAULT_LOCATION
+        else:
+            coordinates = parse_location(location)
+            if coordinates is None:
+                with self._lock:
+                    self.invalid_locations += 1
+                print(f"⚠️  Invalid weather location {location!r} (expected (lat, lon)); using default")
+                coordinates = DEFAULT_LOCATION
+            lat, lon = coordinates
+        return geohash(lat, lon, self.precision)
+    
+    def _count_error(self, refresh: bool = False):
+        with self._lock:
+            if refresh:
+                self.refresh_errors += 1
+            else:
+                self.errors += 1
+    
+    def _params(self, cell: str) -> Dict[str, Any]:
+        # Query the cell centre, so the reading is the same for everyone in it
+        lat, lon = geohash_center(cell)
+        return {"lat": round(lat, 4), "lon": round(lon, 4), "appid": self.api_key, "units": "metric"}
+    
+    def _lookup(self, cell: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Cached reading and whether it needs a refresh. Returns (None, True)
+        when there is nothing usable.
+        """
+        with self._lock:
+            entry = self._cache.get(cell)
+            if entry is None:
+                self.misses += 1
+                return None, True
+            weather, fetched_at = entry
+            age = time.monotonic() - fetched_at
+            if age <= self.cache_ttl_s:
+                self.hits += 1
+                self._cache.move_to_end(cell)
+                return weather, False
+            if age <= self.stale_ttl_s:
+                self.stale_hits += 1
+                self._cache.move_to_end(cell)
+                return weather, True
+            self.misses += 1
+            return None, True
+    
+    def _store(self, cell: str, weather: Dict[str, Any]):
+        with self._lock:
+            self._cache[cell] = (weather, time.monotonic())
+            self._cache.move_to_end(cell)
+            while len(self._cache) > self.max_cells:
+                self._cache.popitem(last=False)
+    
+    def _claim_refresh(self, cell: str) -> bool:
+        """True if no other refresh of this cell is running"""
+        with self._lock:
+            if cell in self._refreshing:
+                return False
+            self._refreshing.add(cell)
+            self.refreshes += 1
+            return True
+    
+    def _release_refresh(self, cell: str):
+        with self._lock:
+            self._refreshing.discard(cell)
+    
+    def _parse(self, response: httpx.Response) -> Dict[str, Any]:
+        response.raise_for_status()
+        data = response.json()
+        
+        # Transform to our internal format
+        return {
+            "temperature": data["main"]["temp"],
+            "humidity": data["main"]["humidity"],
+            "condition": data["weather"][0]["main"],
+            "description": data["weather"][0]["description"],
+            "wind_speed": data["wind"]["speed"],
+            "rain_forecast": "Rain" in data["weather"][0]["main"],
+            "advisory": self._generate_advisory(data),
+            "location": data.get("name"),
+            "source": "OpenWeatherMap"
+        }
+    
+    def _fetch(self, cell: str) -> Dict[str, Any]:
+        weather = self._parse(self._client.get("/weather", params=self._params(cell)))
+        self._store(cell, weather)
+        return weather
+    
+    def get_current_weather(self, location: Optional[Sequence[float]] = None) -> Dict[str, Any]:
         """
         Get current weather for a location
         
         Args:
-            location: City name or "lat,lon"
+            location: Farmer's (lat, lon); None = default location (anything
+                else that is not a coordinate pair is logged and counted)
             
         Returns:
             Weather data dictionary
@@ -29,35 +280,131 @@ class WeatherService:
         if not self.api_key:
             print("⚠️  No OpenWeather API key found. Using fallback.")
             return self._get_fallback_weather()
-            
+        
+        cell = self._cell(location)
+        weather, refresh = self._lookup(cell)
+        if weather is not None:
+            if refresh and self._claim_refresh(cell):
+                threading.Thread(target=self._refresh_sync, args=(cell,), daemon=True).start()
+            return weather
+        
         try:
-            url = f"{self.BASE_URL}/weather"
-            params = {
-                "q": location,
-                "appid": self.api_key,
-                "units": "metric"
-            }
-            
-            response = requests.get(url, params=params, timeout=5)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Transform to our internal format
-            return {
-                "temperature": data["main"]["temp"],
-                "humidity": data["main"]["humidity"],
-                "condition": data["weather"][0]["main"],
-                "description": data["weather"][0]["description"],
-                "wind_speed": data["wind"]["speed"],
-                "rain_forecast": "Rain" in data["weather"][0]["main"],
-                "advisory": self._generate_advisory(data),
-                "source": "OpenWeatherMap"
-            }
-            
+            return self._fetch(cell)
+        except Exception as e:
+            self._count_error()
+            print(f"⚠️  Weather API error: {e}. Using fallback.")
+            return self._get_fallback_weather()
+    
+    def _refresh_sync(self, cell: str):
+        try:
+            self._fetch(cell)
+        except Exception as e:
+            self._count_error(refresh=True)
+            print(f"⚠️  Weather refresh for {cell} failed: {e}")
+        finally:
+            self._release_refresh(cell)
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        # An async client belongs to the event loop it first ran on
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            if self._async_client is not None:
+                self._close_stale_client(self._async_client, self._async_loop)
+            self._async_client = httpx.AsyncClient(base_url=self.BASE_URL, timeout=5.0, limits=self._limits)
+            self._async_loop = loop
+        return self._async_client
+    
+    def _close_stale_client(self, client: httpx.AsyncClient, loop):
+        """Close a client left by a previous event loop (on that loop if it still runs)"""
+        async def close():
+            try:
+                await client.aclose()
+            except Exception as e:  # its loop is gone; the sockets go with it
+                print(f"⚠️  Closing stale weather client failed: {e}")
+        
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(close(), loop)
+        else:
+            self._spawn(close())
+    
+    def _spawn(self, coro) -> asyncio.Future:
+        """Run ``coro`` in the background, holding a reference until it is done"""
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+    
+    async def _fetch_async(self, cell: str) -> Dict[str, Any]:
+        response = await self._get_async_client().get("/weather", params=self._params(cell))
+        weather = self._parse(response)
+        self._store(cell, weather)
+        return weather
+    
+    async def get_current_weather_async(self, location: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+        """Async ``get_current_weather``: runs on the event loop, no worker thread"""
+        if not self.api_key:
+            return self._get_fallback_weather()
+        
+        cell = self._cell(location)
+        weather, refresh = self._lookup(cell)
+        if weather is not None:
+            if refresh and self._claim_refresh(cell):
+                self._spawn(self._refresh_async(cell))
+            return weather
+        
+        # Concurrent misses for the same cell share one request
+        pending = self._in_flight.get(cell)
+        leader = pending is None
+        if leader:
+            pending = asyncio.ensure_future(self._fetch_async(cell))
+            self._in_flight[cell] = pending
+            pending.add_done_callback(lambda _: self._in_flight.pop(cell, None))
+        try:
+            return await asyncio.shield(pending)
         except Exception as e:
+            if leader:  # one failed request, however many callers shared it
+                self._count_error()
             print(f"⚠️  Weather API error: {e}. Using fallback.")
             return self._get_fallback_weather()
+    
+    async def _refresh_async(self, cell: str):
+        try:
+            await self._fetch_async(cell)
+        except Exception as e:
+            self._count_error(refresh=True)
+            print(f"⚠️  Weather refresh for {cell} failed: {e}")
+        finally:
+            self._release_refresh(cell)
+    
+    async def aclose(self):
+        """Finish background refreshes, then close both HTTP pools"""
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self._client.close()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Cache hit rates per kind and refresh/error counters"""
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                "cells": len(self._cache),
+                "max_cells": self.max_cells,
+                "geohash_precision": self.precision,
+                "ttl_s": self.cache_ttl_s,
+                "stale_ttl_s": self.stale_ttl_s,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+                "refreshes": self.refreshes,
+                "refreshes_running": len(self._tasks),
+                "errors": self.errors,
+                "refresh_errors": self.refresh_errors,
+                "invalid_locations": self.invalid_locations,
+            }
 
     def _generate_advisory(self, data: Dict[str, Any]) -> str:
         """Generate simple advisory based on weather"""
@@ -94,9 +441,24 @@ class WeatherService:
 
 # Singleton
 _weather_service = None
+_weather_service_lock = threading.Lock()
 
 def get_weather_service() -> WeatherService:
     global _weather_service
     if _weather_service is None:
-        _weather_service = WeatherService()
+        # Dashboard sections call this from several worker threads at once
+        with _weather_service_lock:
+            if _weather_service is None:
+                _weather_service = WeatherService()
     return _weather_service
+
+
+async def close_weather_service():
+    """Close the HTTP pools (no-op if the service was never created)"""
+    if _weather_service is not None:
+        await _weather_service.aclose()
+
+
+def weather_cache_stats() -> Optional[Dict[str, Any]]:
+    """Weather cache stats, or None if the service was never created"""
+    return _weather_service.stats() if _weather_service is not None else None
@@ -0,0 +1,188 @@
+"""
+Train Intent Fast Path
+Reports accuracy and latency of the local intent classifier, and retrains
+it from the production log of LLM classifications (INTENT_LOG_PATH).
+See core/fast_intent.py.
+
+``report`` runs leave-one-out over the seed + learned examples. ``train``
+first scores the current model against the logged LLM labels (queries it
+has never seen), then adds the confident ones to the learned examples file
+that the agent loads at startup.
+
+Usage (from the repository root):
+    python -m Backend.Voice_agent.train_intent_classifier report
+    python -m Backend.Voice_agent.train_intent_classifier train
+    python -m Backend.Voice_agent.train_intent_classifier train --log old.jsonl --log new.jsonl --min-confidence 0.85
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from Backend.utils.kv_cache import resolve_path
+from Backend.Voice_agent.core.fast_intent import (
+    DEFAULT_FAST_INTENTS,
+    LocalIntentClassifier,
+    load_examples,
+    normalize,
+)
+from Backend.Voice_agent.core.intent_examples import SEED_EXAMPLES
+
+DEFAULT_EXAMPLES_PATH = "models/intent_examples.jsonl"
+DEFAULT_LOG_PATH = "logs/intent_classifications.jsonl"
+
+
+def read_log(paths: List[str], min_confidence: float) -> Tuple[List[Tuple[str, str]], int]:
+    """
+    Confident LLM labels from the classification logs, one per query text
+    (majority label when the LLM answered the same query differently).
+    Returns the examples and how many log entries were skipped.
+    """
+    labels: Dict[str, Counter] = defaultdict(Counter)
+    texts: Dict[str, str] = {}
+    skipped = 0
+    for path in paths:
+        path = resolve_path(path)
+        if not os.path.exists(path):
+            print(f"⚠️  No log at {path}")
+            continue
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                # Keyword fallbacks and low-confidence answers are not labels
+                if (entry.get("confidence", 0) < min_confidence or entry["intent"] == "unknown"
+                        or str(entry.get("reasoning", "")).startswith("Fallback")):
+                    skipped += 1
+                    continue
+                key = normalize(entry["text"])
+                labels[key][entry["intent"]] += 1
+                texts.setdefault(key, entry["text"])
+    return [(texts[key], counts.most_common(1)[0][0]) for key, counts in labels.items()], skipped
+
+
+def evaluate(model: LocalIntentClassifier, cases: List[Tuple[str, str]], threshold: float,
+             fast_intents, leave_one_out: bool = False) -> Dict:
+    """Accuracy overall and of the answers the fast path would give, plus latency"""
+    correct = fast = fast_correct = 0
+    per_intent: Dict[str, Counter] = defaultdict(Counter)
+    latencies = []
+    for row, (text, label) in enumerate(cases):
+        started = time.perf_counter()
+        prediction = model.predict(text, exclude=row if leave_one_out else None)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+        correct += prediction.intent == label
+        per_intent[label]["total"] += 1
+        per_intent[label]["correct"] += prediction.intent == label
+        if prediction.intent in fast_intents and prediction.confidence >= threshold:
+            fast += 1
+            fast_correct += prediction.intent == label
+            per_intent[label]["fast"] += prediction.intent == label
+            per_intent[prediction.intent]["fast_wrong"] += prediction.intent != label
+
+    eligible = sum(1 for _, label in cases if label in fast_intents)
+    return {
+        "cases": len(cases),
+        "accuracy": correct / len(cases) if cases else 0.0,
+        "fast_answers": fast,
+        "fast_precision": fast_correct / fast if fast else 0.0,
+        "fast_coverage": fast / eligible if eligible else 0.0,
+        "per_intent": per_intent,
+        "p50_ms": float(np.percentile(latencies, 50)) if latencies else 0.0,
+        "p95_ms": float(np.percentile(latencies, 95)) if latencies else 0.0,
+    }
+
+
+def print_report(title: str, report: Dict, fast_intents):
+    print(f"\n{title}: {report['cases']} queries")
+    print(f"   accuracy (all intents):   {report['accuracy']:.1%}")
+    print(f"   fast-path answers:        {report['fast_answers']} "
+          f"({report['fast_coverage']:.0%} of fast-intent queries)")
+    print(f"   fast-path precision:      {report['fast_precision']:.1%}")
+    print(f"   local predict latency:    p50 {report['p50_ms']:.3f} ms | p95 {report['p95_ms']:.3f} ms")
+    print(f"   {'intent':<22}{'cases':>7}{'correct':>9}{'fast':>6}{'fast wrong':>12}")
+    for intent in sorted(report["per_intent"], key=lambda i: (i not in fast_intents, i)):
+        c = report["per_intent"][intent]
+        if c["total"] or c["fast_wrong"]:
+            marker = "⚡" if intent in fast_intents else "  "
+            print(f" {marker}{intent:<22}{c['total']:>7}{c['correct']:>9}{c['fast']:>6}{c['fast_wrong']:>12}")
+
+
+def write_examples(path: str, examples: List[Tuple[str, str]]):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        for text, intent in examples:
+            f.write(json.dumps({"text": text, "intent": intent}, ensure_ascii=False) + "\n")
+    os.replace(tmp, path)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Evaluate and retrain the local intent fast path")
+    parser.add_argument("command", choices=("report", "train"))
+    parser.add_argument(
+        "--examples", default=os.getenv("INTENT_EXAMPLES_PATH", DEFAULT_EXAMPLES_PATH),
+        help="Learned examples file (relative paths are under Backend/)"
+    )
+    parser.add_argument(
+        "--log", action="append", dest="logs",
+        help=f"Classification log to learn from (repeatable, default {DEFAULT_LOG_PATH})"
+    )
+    parser.add_argument("--min-confidence", type=float, default=0.8, help="Minimum LLM confidence to trust a label")
+    parser.add_argument("--threshold", type=float, default=float(os.getenv("INTENT_FAST_THRESHOLD", "0.45")))
+    args = parser.parse_args()
+
+    fast_intents = frozenset(
+        i.strip() for i in os.getenv("INTENT_FAST_INTENTS", ",".join(DEFAULT_FAST_INTENTS)).split(",") if i.strip()
+    )
+    examples_path = resolve_path(args.examples)
+    learned = load_examples(examples_path)
+
+    print("=" * 70)
+    print("⚡ LOCAL INTENT FAST PATH")
+    print("=" * 70)
+    print(f"Seed examples: {len(SEED_EXAMPLES)} | learned: {len(learned)} | threshold: {args.threshold}")
+
+    try:
+        if args.command == "train":
+            logged, skipped = read_log(args.logs or [os.getenv("INTENT_LOG_PATH", DEFAULT_LOG_PATH)], args.min_confidence)
+            print(f"Log: {len(logged)} labelled queries ({skipped} entries below confidence / fallback skipped)")
+            if not logged:
+                print("❌ Nothing to learn from")
+                return 1
+
+            # Logged queries are unseen by the current model: a true holdout
+            current = LocalIntentClassifier().fit(SEED_EXAMPLES + learned)
+            print_report("Current model vs logged LLM labels",
+                         evaluate(current, logged, args.threshold, fast_intents), fast_intents)
+
+            merged = {normalize(text): (text, intent) for text, intent in learned}
+            merged.update({normalize(text): (text, intent) for text, intent in logged})
+            learned = list(merged.values())
+            write_examples(examples_path, learned)
+            print(f"\n✅ Wrote {len(learned)} learned examples to {examples_path} (restart the API to load them)")
+
+        examples = SEED_EXAMPLES + learned
+        started = time.perf_counter()
+        model = LocalIntentClassifier().fit(examples)
+        fit_ms = (time.perf_counter() - started) * 1000
+        training = list(zip(model.texts, model.labels))
+        print_report("Leave-one-out over training examples",
+                     evaluate(model, training, args.threshold, fast_intents, leave_one_out=True), fast_intents)
+        print(f"   fit time: {fit_ms:.0f} ms for {len(model)} unique examples")
+        return 0
+    except Exception as e:
+        print(f"❌ {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""
+Response Cache
+Per-route TTL cache for read-heavy GET endpoints with ETag / If-None-Match
+support, so repeated dashboard polling from the app is answered from memory
+(or with an empty 304) instead of recomputing the payload.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import compile_path
+
+from .config import settings
+from .dependencies import request_user
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """Caching policy for one route template"""
+    ttl_s: int
+    tags: Tuple[str, ...]
+    bypass_params: Tuple[str, ...] = ()
+
+
+# Route template (without the API prefix) -> policy. Tags group routes so a
+# write endpoint can drop everything it affects with one invalidate() call.
+CACHE_RULES: Dict[str, CacheRule] = {
+    "/farming/market-price": CacheRule(ttl_s=300, tags=("market",)),
+    "/schemes": CacheRule(ttl_s=600, tags=("schemes",), bypass_params=("force_refresh",)),
+    "/schemes/{scheme_id}": CacheRule(ttl_s=3600, tags=("schemes",)),
+    "/dashboard/stats": CacheRule(ttl_s=30, tags=("dashboard",)),
+    "/dashboard/timeline": CacheRule(ttl_s=30, tags=("dashboard",)),
+    "/dashboard/bundle": CacheRule(ttl_s=30, tags=("dashboard",)),
+    "/collaborative/marketplace": CacheRule(ttl_s=60, tags=("collaborative",)),
+}
+
+# Response headers worth replaying on a hit
+_REPLAY_HEADERS = ("content-type", "content-language")
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    headers: Dict[str, str]
+    etag: str
+    expires_at: float
+    tags: Tuple[str, ...]
+    farmer_id: Optional[str]  # None: the route did not authenticate a farmer
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag derived from the response body"""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def credential_scope(request: Request) -> Optional[str]:
+    """
+    Cache scope of the caller's credentials. The auth dependency only runs
+    inside the route, so lookups are keyed by a fingerprint of the
+    credentials; None for a request without any (it is never cached).
+    """
+    credentials = request.headers.get("authorization") or request.cookies.get("session")
+    if not credentials:
+        return None
+    return "cred:" + hashlib.blake2b(credentials.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 9110 weak comparison of an If-None-Match header against ``etag``"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """
+    In-memory LRU of serialized GET responses.
+
+    Entries are keyed by path, sorted query string and caller credentials,
+    expire after their route's TTL and can be dropped early by tag (and
+    farmer) via ``invalidate``.
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(path: str, query: str, scope: str) -> str:
+        params = "&".join(sorted(query.split("&"))) if query else ""
+        return f"{scope}|{path}?{params}"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *tags: str, farmer_id: Optional[str] = None) -> int:
+        """
+        Drop cached responses carrying any of ``tags`` (all tags if none are
+        given). When ``farmer_id`` is set only that farmer's entries go,
+        plus entries whose farmer is unknown.
+
+        Returns:
+            Number of entries removed
+        """
+        wanted = set(tags)
+        stale = [
+            key for key, entry in self._entries.items()
+            if (not wanted or wanted.intersection(entry.tags))
+            and (farmer_id is None or entry.farmer_id in (None, farmer_id))
+        ]
+        for key in stale:
+            del self._entries[key]
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters (exposed via /health/cache)"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+response_cache = ResponseCache(max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES)
+
+
+def invalidate_cache(*tags: str, farmer_id: Optional[str] = None) -> int:
+    """Invalidation hook for write endpoints (see ResponseCache.invalidate)"""
+    return response_cache.invalidate(*tags, farmer_id=farmer_id)
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    """
+    Serves GET requests for routes in ``CACHE_RULES`` from ``response_cache``.
+
+    Every cacheable response carries an ETag; a matching If-None-Match gets
+    a 304 with no body. ``Cache-Control: no-cache`` on the request (or a
+    rule's bypass parameter such as ``force_refresh``) skips the lookup but
+    still refreshes the entry. Responses marked ``Cache-Control: no-store``
+    (e.g. a partial dashboard bundle) and requests without credentials are
+    passed through uncached.
+
+    Concurrent misses for one key are computed once: the first registers a
+    future in ``_inflight`` and later ones await its entry.
+    """
+
+    def __init__(self, app, cache: ResponseCache = response_cache, rules: Dict[str, CacheRule] = None):
+        super().__init__(app)
+        self.cache = cache
+        self._inflight: Dict[str, "asyncio.Future[Optional[CacheEntry]]"] = {}
+        self.rules = [
+            (compile_path(settings.API_V1_STR + path)[0], rule)
+            for path, rule in (rules or CACHE_RULES).items()
+        ]
+
+    def _match_rule(self, path: str) -> Optional[CacheRule]:
+        for path_regex, rule in self.rules:
+            if path_regex.match(path):
+                return rule
+        return None
+
+    def _build_response(self, entry: CacheEntry, request: Request, status: str) -> Response:
+        headers = {
+            **entry.headers,
+            "ETag": entry.etag,
+            "Cache-Control": f"private, max-age={max(0, int(entry.expires_at - time.monotonic()))}",
+            "X-Cache": status,
+        }
+        if etag_matches(request.headers.get("if-none-match"), entry.etag):
+            self.cache.not_modified += 1
+            headers.pop("content-type", None)
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, status_code=200, headers=headers)
+
+    async def dispatch(self, request: Request, call_next):
+        if request.method != "GET":
+            return await call_next(request)
+        rule = self._match_rule(request.url.path)
+        scope = credential_scope(request)
+        if rule is None or scope is None:
+            return await call_next(request)
+
+        key = self.cache.make_key(request.url.path, request.url.query, scope)
+        bypass = "no-cache" in request.headers.get("cache-control", "") or any(
+            request.query_params.get(p, "").lower() in ("1", "true") for p in rule.bypass_params
+        )
+
+        pending = None
+        if not bypass:
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.cache.hits += 1
+                return self._build_response(entry, request, "HIT")
+            # Collapse concurrent misses for the same key onto one computation
+            pending = asyncio.get_running_loop().create_future()
+            leader = self._inflight.setdefault(key, pending)
+            if leader is not pending:
+                entry = await asyncio.shield(leader)
+                if entry is not None:
+                    self.cache.hits += 1
+                    return self._build_response(entry, request, "HIT")
+                pending = None  # the first response was not cacheable: compute our own
+        self.cache.misses += 1
+
+        entry = None
+        try:
+            response = await call_next(request)
+            if response.status_code != 200 or "no-store" in response.headers.get("cache-control", ""):
+                return response
+            body = b"".join([chunk async for chunk in response.body_iterator])
+            # Farmer the auth dependency (or its override) resolved in the route
+            user = request_user(request)
+            entry = CacheEntry(
+                body=body,
+                headers={h: response.headers[h] for h in _REPLAY_HEADERS if h in response.headers},
+                etag=make_etag(body),
+                expires_at=time.monotonic() + rule.ttl_s,
+                tags=rule.tags,
+                farmer_id=user.get("id") if user else None,
+            )
+            self.cache.set(key, entry)
+            return self._build_response(entry, request, "MISS")
+        finally:
+            if pending is not None:
+                del self._inflight[key]
+                pending.set_result(entry)
@@ -18,7 +18,46 @@ class Settings(BaseSettings):
     
     # Database
     MONGODB_URI: str = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
-    DATABASE_NAME: str = os.getenv("DATABASE_NAME", "kisaan_mitra")
+    DATABASE_NAME: str = os.getenv("DATABASE_NAME", "kisanmitra")
+    
+    # MongoDB connection pool (one shared client per worker)
+    MONGODB_MAX_POOL_SIZE: int = 50
+    MONGODB_MIN_POOL_SIZE: int = 0
+    MONGODB_MAX_IDLE_TIME_MS: int = 60000
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = 2000
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 2000
+    MONGODB_CONNECT_TIMEOUT_MS: int = 5000
+    MONGODB_SOCKET_TIMEOUT_MS: int = 10000
+    
+    # Thread pool for blocking engine/service calls made from async routes
+    EXECUTOR_MAX_WORKERS: int = 32
+    
+    # Whisper model pool (same env vars as Voice_agent/config.py); sizes the
+    # "stt" executor lane so each in-flight transcription has its own model
+    WHISPER_POOL_SIZE: int = 1
+    WHISPER_MAX_QUEUE: int = 16
+    
+    # Opt-in warm-up: also build heavy services at startup (Keras model, Whisper,
+    # voice agent) and run their warm-up hooks. Otherwise they load on first use.
+    SERVICES_WARMUP: bool = False
+    
+    # In-memory GET response cache with ETags (see api/cache.py for per-route TTLs)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_ENTRIES: int = 2048
+    
+    # Stage timing spans -> Server-Timing header and /metrics histograms
+    METRICS_ENABLED: bool = True
+    
+    # List endpoints: default and server-enforced maximum page size
+    PAGE_SIZE_DEFAULT: int = 50
+    PAGE_SIZE_MAX: int = 200
+    
+    # gzip/brotli for responses of at least COMPRESSION_MIN_BYTES (brotli needs the
+    # optional `brotli` package)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_BYTES: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
     
     # External APIs
     OPENWEATHER_API_KEY: Optional[str] = os.getenv("OPENWEATHER_API_KEY")
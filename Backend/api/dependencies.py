@@ -1,39 +1,41 @@
-from typing import Generator, Optional
-try:
-    from pymongo import MongoClient
-    from pymongo.errors import ConnectionFailure
-except ImportError:
-    MongoClient = None
-
-from .config import settings
-
-class DatabaseSession:
-    _client: Optional[MongoClient] = None
-
-    @classmethod
-    def get_client(cls) -> Optional[MongoClient]:
-        if cls._client is None and MongoClient:
-            try:
-                cls._client = MongoClient(settings.MONGODB_URI, serverSelectionTimeoutMS=2000)
-                # Check connection
-                cls._client.admin.command('ping')
-                print("Connected to MongoDB")
-            except Exception as e:
-                print(f"Could not connect to MongoDB: {e}. Using in-memory mode.")
-                cls._client = None
-        return cls._client
+from typing import Optional
+
+from fastapi import Request
+
+from Backend.database.connection import db as mongo
+
 
 def get_db_client():
-    """Dependency to get MongoDB client"""
-    return DatabaseSession.get_client()
+    """
+    Dependency to get the MongoDB database handle.
+
+    Backed by the process-wide client opened in the app lifespan, so every
+    router and repository shares one connection pool. Returns None when
+    MongoDB is unreachable (repositories then use in-memory mode).
+    """
+    return mongo.get_sync_database()
 
-def get_current_user():
-    """Mock authentication dependency"""
+def get_current_user(request: Request = None):
+    """
+    Mock authentication dependency
+
+    The resolved user is also left on ``request.state.user`` so middleware
+    (the response cache) sees whoever the dependency - or its override -
+    authenticated.
+    """
     # In a real app, this would verify JWT tokens
-    return {
+    user = {
         "id": "F001",
         "username": "kisaan_demo",
         "role": "farmer",
         "state": "Maharashtra",
         "district": "Nasik"
     }
+    if request is not None:
+        request.state.user = user
+    return user
+
+
+def request_user(request: Request) -> Optional[dict]:
+    """User resolved by the auth dependency for this request, if it ran"""
+    return getattr(request.state, "user", None)
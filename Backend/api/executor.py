@@ -0,0 +1,202 @@
+"""
+Blocking Call Executor
+Runs synchronous engines, services and pymongo calls off the event loop
+on a bounded thread pool, with per-lane concurrency limits and timeouts.
+"""
+
+import asyncio
+import contextvars
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException
+
+from .config import settings
+
+
+@dataclass
+class LaneConfig:
+    """Limits for one class of blocking work"""
+    max_concurrency: int
+    timeout_s: float
+    max_queue: int
+
+
+@dataclass
+class LaneStats:
+    """Counters for one lane (exposed via /health/executor)"""
+    in_flight: int = 0
+    queued: int = 0
+    completed: int = 0
+    failed: int = 0
+    timeouts: int = 0
+    rejected: int = 0
+    max_queued: int = 0
+    total_wait_s: float = 0.0
+    total_run_s: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        finished = self.completed + self.failed + self.timeouts
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.total_wait_s * 1000 / finished, 2) if finished else 0.0,
+            "avg_run_ms": round(self.total_run_s * 1000 / finished, 2) if finished else 0.0,
+        }
+
+
+# Lane name -> limits. Slow, CPU-heavy or network-bound work gets its own
+# lane so it cannot starve the cheap database calls.
+DEFAULT_LANES: Dict[str, LaneConfig] = {
+    "db": LaneConfig(max_concurrency=16, timeout_s=10.0, max_queue=200),
+    "services": LaneConfig(max_concurrency=8, timeout_s=20.0, max_queue=100),
+    "planning": LaneConfig(max_concurrency=4, timeout_s=30.0, max_queue=50),
+    "external": LaneConfig(max_concurrency=8, timeout_s=15.0, max_queue=100),
+    "voice": LaneConfig(max_concurrency=4, timeout_s=60.0, max_queue=32),
+    "stt": LaneConfig(
+        max_concurrency=settings.WHISPER_POOL_SIZE, timeout_s=120.0, max_queue=settings.WHISPER_MAX_QUEUE
+    ),
+    "vision": LaneConfig(max_concurrency=2, timeout_s=60.0, max_queue=16),
+}
+
+
+@dataclass
+class _Lane:
+    config: LaneConfig
+    semaphore: asyncio.Semaphore
+    stats: LaneStats = field(default_factory=LaneStats)
+
+
+class BlockingExecutor:
+    """
+    Bounded thread-pool for blocking calls made from async routes.
+
+    Each lane has its own concurrency limit, wait-queue cap and timeout.
+    A lane slot is only released once the worker thread actually finishes,
+    so a timed-out call still counts against the limit until it returns.
+    """
+
+    def __init__(self, max_workers: int, lanes: Optional[Dict[str, LaneConfig]] = None):
+        self.max_workers = max_workers
+        self.lane_configs = dict(lanes or DEFAULT_LANES)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lanes: Dict[str, _Lane] = {}
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="kisaan-blocking"
+            )
+        return self._pool
+
+    def _get_lane(self, name: str) -> _Lane:
+        lane = self._lanes.get(name)
+        if lane is None:
+            config = self.lane_configs.get(name) or self.lane_configs["services"]
+            lane = _Lane(config=config, semaphore=asyncio.Semaphore(config.max_concurrency))
+            self._lanes[name] = lane
+        return lane
+
+    async def run(
+        self,
+        lane_name: str,
+        fn: Callable[..., Any],
+        *args,
+        timeout_s: Optional[float] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Run ``fn(*args, **kwargs)`` on the pool under the given lane's limits.
+
+        Raises:
+            HTTPException(503): lane wait-queue is full
+            HTTPException(504): call did not finish within the lane timeout
+        """
+        lane = self._get_lane(lane_name)
+        stats = lane.stats
+        timeout = timeout_s if timeout_s is not None else lane.config.timeout_s
+
+        queued_at = time.perf_counter()
+        if not lane.semaphore.locked():
+            await lane.semaphore.acquire()
+        else:
+            if stats.queued >= lane.config.max_queue:
+                stats.rejected += 1
+                raise HTTPException(status_code=503, detail=f"Server busy ({lane_name}), please retry")
+
+            stats.queued += 1
+            stats.max_queued = max(stats.max_queued, stats.queued)
+            try:
+                await asyncio.wait_for(lane.semaphore.acquire(), timeout=timeout)
+            except asyncio.TimeoutError:
+                stats.timeouts += 1
+                raise HTTPException(status_code=504, detail=f"Timed out waiting for {lane_name} worker")
+            finally:
+                stats.queued -= 1
+
+        started_at = time.perf_counter()
+        stats.total_wait_s += started_at - queued_at
+        stats.in_flight += 1
+
+        # Carry the caller's context into the worker so request-scoped state
+        # (timing spans) recorded there is visible to the request
+        ctx = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_pool(), functools.partial(ctx.run, fn, *args, **kwargs))
+
+        def _release(_):
+            stats.in_flight -= 1
+            stats.total_run_s += time.perf_counter() - started_at
+            lane.semaphore.release()
+
+        future.add_done_callback(_release)
+
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            raise HTTPException(status_code=504, detail=f"{lane_name} call timed out after {timeout:.0f}s")
+        except Exception:
+            stats.failed += 1
+            raise
+
+        stats.completed += 1
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of per-lane queue depth and counters"""
+        return {
+            "max_workers": self.max_workers,
+            "lanes": {
+                name: {
+                    "max_concurrency": lane.config.max_concurrency,
+                    "timeout_s": lane.config.timeout_s,
+                    **lane.stats.to_dict(),
+                }
+                for name, lane in self._lanes.items()
+            },
+        }
+
+    def shutdown(self):
+        """Stop accepting work and wait for running calls (called on app shutdown)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        self._lanes.clear()
+
+
+executor = BlockingExecutor(max_workers=settings.EXECUTOR_MAX_WORKERS)
+
+
+async def run_blocking(lane: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Offload a blocking call from an async route (see BlockingExecutor.run)"""
+    return await executor.run(lane, fn, *args, **kwargs)
@@ -1,10 +1,33 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import os
 
 from .config import settings
+from Backend.database.connection import db as mongo
+from .executor import executor
+from .services import registry
+from .cache import ResponseCacheMiddleware, response_cache
+from .metrics import TimingMiddleware, render_metrics
+from .responses import FastJSONResponse
+from .compression import CompressionMiddleware
+from Backend.utils import timing
+from Backend.Voice_agent.core.agent import flush_pending_saves
+from Backend.Voice_agent.input_processing.translator import translation_cache_stats
+from Backend.Voice_agent.core.fast_intent import fast_intent_stats
+from Backend.Voice_agent.core.intent_cache import intent_cache_stats
+from Backend.Voice_agent.core.session_cache import session_cache_stats
+from Backend.Voice_agent.retrieval.ingest_queue import ingest_queue_stats
+from Backend.Voice_agent.retrieval.weather_service import close_weather_service, weather_cache_stats
 from .routers import (
+    auth,
+    onboarding,
+    crops,
+    calendar,
+    alerts,
     farm_management,
     voice_agent,
     gov_schemes,
@@ -14,7 +37,36 @@ from .routers import (
     inventory
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open the shared MongoDB pool and build the service registry once per
+    worker; close both on shutdown. Services warm up in the background and
+    /health/ready reports 503 until they are done.
+    """
+    await mongo.connect_db(
+        uri=settings.MONGODB_URI,
+        db_name=settings.DATABASE_NAME,
+        maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+        minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+        maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+        waitQueueTimeoutMS=settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        connectTimeoutMS=settings.MONGODB_CONNECT_TIMEOUT_MS,
+        socketTimeoutMS=settings.MONGODB_SOCKET_TIMEOUT_MS,
+    )
+    warmup = asyncio.create_task(registry.start(warm=settings.SERVICES_WARMUP))
+    yield
+    warmup.cancel()
+    await flush_pending_saves()
+    await close_weather_service()
+    registry.clear()
+    executor.shutdown()
+    mongo.close_db()
+
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     description="Backend API for KisaanMitra - Voice-First Farming Assistant",
@@ -30,6 +82,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.RESPONSE_CACHE_ENABLED:
+    app.add_middleware(ResponseCacheMiddleware, cache=response_cache)
+
+# Wraps the cache so cached bodies are stored once and encoded per client
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_BYTES,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
+# Added last so it wraps the cache and reports hits as well
+timing.set_enabled(settings.METRICS_ENABLED)
+if settings.METRICS_ENABLED:
+    app.add_middleware(TimingMiddleware)
+
 # Include Routers
 app.include_router(auth.router, prefix=settings.API_V1_STR, tags=["Authentication"])
 app.include_router(onboarding.router, prefix=settings.API_V1_STR, tags=["Onboarding"])
@@ -59,7 +128,56 @@ def read_root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
+    return {"status": "healthy", "database": "connected" if mongo.available else "in-memory"}
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Ready only once shared services are built and warmed"""
+    status = registry.status()
+    return JSONResponse(status_code=200 if status["ready"] else 503, content=status)
+
+@app.get("/health/cache")
+async def cache_stats():
+    """Response cache hit rate and size"""
+    return response_cache.stats()
+
+@app.get("/health/translation")
+async def translation_stats():
+    """Translation cache hit rate per tier (memory / SQLite)"""
+    return translation_cache_stats() or {"loaded": False}
+
+@app.get("/health/intent")
+async def intent_stats():
+    """Local fast path (share answered on-box, latency per path) and LLM result cache hit rates"""
+    return {
+        "fast_path": fast_intent_stats() or {"enabled": False},
+        "cache": intent_cache_stats() or {"enabled": False},
+    }
+
+@app.get("/health/ingest")
+async def ingest_stats():
+    """Write-behind vector ingest queue: depth, drops and batch timings"""
+    return ingest_queue_stats() or {"started": False}
+
+@app.get("/health/sessions")
+async def session_stats():
+    """Live conversation contexts held by the voice agent: resident count/bytes and evictions"""
+    return session_cache_stats() or {"started": False}
+
+@app.get("/health/weather")
+async def weather_stats():
+    """Weather cache per geohash cell: fresh/stale hit rates, refreshes and API errors"""
+    return weather_cache_stats() or {"started": False}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus scrape endpoint (stage/request histograms, executor and cache counters)"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+@app.get("/health/executor")
+async def executor_stats():
+    """Queue depth and timing per blocking-call lane"""
+    return executor.stats()
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,119 @@
+"""
+Request Metrics
+Per-request timing middleware (``Server-Timing`` header + latency
+histograms) and the Prometheus text rendered at /metrics.
+"""
+
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from Backend.utils import timing
+from Backend.utils.timing import metrics
+from Backend.Voice_agent.input_processing.translator import translation_cache_stats
+from Backend.Voice_agent.core.fast_intent import fast_intent_stats
+from Backend.Voice_agent.core.intent_cache import intent_cache_stats
+from Backend.Voice_agent.core.session_cache import session_cache_stats
+from Backend.Voice_agent.retrieval.ingest_queue import ingest_queue_stats
+from Backend.Voice_agent.retrieval.weather_service import weather_cache_stats
+from .cache import response_cache
+from .executor import executor
+
+
+class TimingMiddleware(BaseHTTPMiddleware):
+    """
+    Collects the spans recorded while handling a request, adds them as a
+    ``Server-Timing`` header and records overall latency per route.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        if not timing.is_enabled():
+            return await call_next(request)
+
+        spans = timing.start_request()
+        started = time.perf_counter()
+        response = await call_next(request)
+        elapsed = time.perf_counter() - started
+
+        route = request.scope.get("route")
+        metrics.observe(
+            "kisaan_http_request_duration_seconds",
+            elapsed,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=str(response.status_code),
+        )
+        response.headers["Server-Timing"] = timing.server_timing_header(spans, elapsed)
+        return response
+
+
+def render_metrics() -> str:
+    """Histograms plus executor, cache and intent fast-path counters in Prometheus format"""
+    lines = [metrics.render_prometheus().rstrip("\n")]
+
+    lanes = executor.stats()["lanes"]
+    for gauge in ("in_flight", "queued"):
+        lines.append(f"# TYPE kisaan_executor_{gauge} gauge")
+        lines.extend(f'kisaan_executor_{gauge}{{lane="{lane}"}} {s[gauge]}' for lane, s in lanes.items())
+    for counter in ("completed", "failed", "timeouts", "rejected"):
+        lines.append(f"# TYPE kisaan_executor_{counter}_total counter")
+        lines.extend(f'kisaan_executor_{counter}_total{{lane="{lane}"}} {s[counter]}' for lane, s in lanes.items())
+
+    cache = response_cache.stats()
+    lines.append("# TYPE kisaan_response_cache_entries gauge")
+    lines.append(f"kisaan_response_cache_entries {cache['entries']}")
+    for counter in ("hits", "misses", "not_modified", "invalidations"):
+        lines.append(f"# TYPE kisaan_response_cache_{counter}_total counter")
+        lines.append(f"kisaan_response_cache_{counter}_total {cache[counter]}")
+
+    translation = translation_cache_stats()
+    if translation is not None:
+        lines.append("# TYPE kisaan_translation_cache_entries gauge")
+        lines.append(f"kisaan_translation_cache_entries {translation['memory_entries']}")
+        for counter in ("memory_hits", "disk_hits", "misses"):
+            lines.append(f"# TYPE kisaan_translation_cache_{counter}_total counter")
+            lines.append(f"kisaan_translation_cache_{counter}_total {translation[counter]}")
+
+    intent = fast_intent_stats()
+    if intent is not None:
+        lines.append("# TYPE kisaan_intent_classifications_total counter")
+        lines.append(f'kisaan_intent_classifications_total{{path="local"}} {intent["fast_hits"]}')
+        lines.append(f'kisaan_intent_classifications_total{{path="llm"}} {intent["llm_calls"]}')
+
+    intent_caches = intent_cache_stats() or {}
+    for counter in ("memory_hits", "disk_hits", "misses", "coalesced"):
+        if intent_caches:
+            lines.append(f"# TYPE kisaan_intent_cache_{counter}_total counter")
+        lines.extend(
+            f'kisaan_intent_cache_{counter}_total{{cache="{name}"}} {stats[counter]}'
+            for name, stats in intent_caches.items()
+        )
+
+    ingest = ingest_queue_stats()
+    if ingest is not None:
+        for gauge in ("pending", "high_water"):
+            lines.append(f"# TYPE kisaan_vector_ingest_{gauge} gauge")
+            lines.append(f"kisaan_vector_ingest_{gauge} {ingest[gauge]}")
+        for counter in ("enqueued", "written", "dropped", "failed", "batches"):
+            lines.append(f"# TYPE kisaan_vector_ingest_{counter}_total counter")
+            lines.append(f"kisaan_vector_ingest_{counter}_total {ingest[counter]}")
+
+    sessions = session_cache_stats()
+    if sessions is not None:
+        for gauge in ("sessions", "bytes"):
+            lines.append(f"# TYPE kisaan_active_context_{gauge} gauge")
+            lines.append(f"kisaan_active_context_{gauge} {sessions[gauge]}")
+        for counter in ("hits", "misses", "evictions", "expirations", "write_backs", "write_back_failures"):
+            lines.append(f"# TYPE kisaan_active_context_{counter}_total counter")
+            lines.append(f"kisaan_active_context_{counter}_total {sessions[counter]}")
+
+    weather = weather_cache_stats()
+    if weather is not None:
+        lines.append("# TYPE kisaan_weather_cache_cells gauge")
+        lines.append(f"kisaan_weather_cache_cells {weather['cells']}")
+        for counter in ("hits", "stale_hits", "misses", "refreshes", "errors"):
+            lines.append(f"# TYPE kisaan_weather_cache_{counter}_total counter")
+            lines.append(f"kisaan_weather_cache_{counter}_total {weather[counter]}")
+
+    return "\n".join(line for line in lines if line) + "\n"
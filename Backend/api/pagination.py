@@ -0,0 +1,111 @@
+"""
+Cursor Pagination
+Keyset pagination over (sort field, _id) with opaque cursors, ``fields=``
+projection and a server-enforced maximum page size for list endpoints.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import json_util
+from fastapi import HTTPException, Query
+
+from .config import settings
+
+
+@dataclass
+class PageParams:
+    """Validated paging/projection query parameters"""
+    limit: int
+    cursor: Optional[str]
+    fields: Optional[List[str]]
+
+
+def page_params(
+    limit: int = Query(None, ge=1, description="Page size (capped at the server maximum)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
+) -> PageParams:
+    """FastAPI dependency for list endpoints"""
+    size = min(limit or settings.PAGE_SIZE_DEFAULT, settings.PAGE_SIZE_MAX)
+    return PageParams(limit=size, cursor=cursor, fields=parse_fields(fields))
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    if not fields:
+        return None
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    for name in names:
+        if name.startswith("$") or any(part == "" for part in name.split(".")):
+            raise HTTPException(status_code=400, detail=f"Invalid field name: {name}")
+    return names
+
+
+def encode_cursor(sort_value: Any, doc_id: Any) -> str:
+    payload = json_util.dumps({"v": sort_value, "id": doc_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json_util.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        return data["v"], data["id"]
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError, json.JSONDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _after_cursor(sort_field: str, direction: int, value: Any, doc_id: Any) -> Dict[str, Any]:
+    """Filter selecting documents strictly after (value, doc_id) in sort order"""
+    op = "$gt" if direction > 0 else "$lt"
+    if sort_field == "_id":
+        return {"_id": {op: doc_id}}
+    if value is None:
+        # Missing sort values order first ascending and last descending
+        same = {sort_field: None, "_id": {op: doc_id}}
+        return {"$or": [same, {sort_field: {"$ne": None}}]} if direction > 0 else same
+    after = [
+        {sort_field: {op: value}},
+        {sort_field: value, "_id": {op: doc_id}},
+    ]
+    if direction < 0:
+        # Comparison operators never match null, so add the trailing null block
+        after.append({sort_field: None})
+    return {"$or": after}
+
+
+def paginate(
+    collection,
+    query: Dict[str, Any],
+    page: PageParams,
+    sort_field: str = "_id",
+    direction: int = 1,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Fetch one page from a pymongo collection (blocking; run via run_blocking).
+
+    Returns:
+        (documents, next_cursor) where next_cursor is None on the last page
+    """
+    if page.cursor:
+        value, doc_id = decode_cursor(page.cursor)
+        query = {"$and": [query, _after_cursor(sort_field, direction, value, doc_id)]}
+
+    projection = None
+    if page.fields:
+        # Sort key and _id are always needed to build the next cursor
+        projection = {name: 1 for name in page.fields}
+        projection[sort_field] = 1
+
+    sort = [(sort_field, direction)] if sort_field == "_id" else [(sort_field, direction), ("_id", direction)]
+    docs = list(collection.find(query, projection).sort(sort).limit(page.limit + 1))
+
+    next_cursor = None
+    if len(docs) > page.limit:
+        docs = docs[:page.limit]
+        last = docs[-1]
+        next_cursor = encode_cursor(last.get(sort_field) if sort_field != "_id" else None, last["_id"])
+    return docs, next_cursor
@@ -0,0 +1,75 @@
+"""
+JSON Responses
+orjson-backed default response class. ObjectId, datetime/date, enums,
+dataclasses, numpy values and pydantic models are encoded natively, so
+routes can return Mongo documents and ``AgentResponse`` objects without
+``str(_id)`` loops or ``to_dict()`` passes.
+
+Return ``FastJSONResponse(content)`` from a route to also skip FastAPI's
+``jsonable_encoder`` walk (which rejects ObjectId). Routes with a
+``response_model`` already serialize through pydantic-core.
+"""
+
+import dataclasses
+import json
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def json_default(obj: Any) -> Any:
+    """Fallback for types orjson (or the stdlib encoder) does not handle"""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", errors="replace")
+    if ORJSON_AVAILABLE:
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+    # stdlib path: cover what orjson would have encoded natively
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize ``content`` to UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            content,
+            default=json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(
+        content, default=json_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class for the API (see module docstring)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
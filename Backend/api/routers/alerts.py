@@ -10,6 +10,10 @@ from datetime import datetime
 from bson import ObjectId
 
 from Backend.api.dependencies import get_db_client
+from Backend.api.executor import run_blocking
+from Backend.api.cache import invalidate_cache
+from Backend.api.pagination import PageParams, page_params, paginate
+from Backend.api.responses import FastJSONResponse
 
 router = APIRouter(prefix="/alerts", tags=["Alerts"])
 
@@ -28,40 +32,43 @@ class CreateAlertRequest(BaseModel):
 async def get_alerts(
     farmer_id: str,
     unread_only: bool = False,
-    db_client = Depends(get_db_client)
+    page: PageParams = Depends(page_params),
+    db = Depends(get_db_client)
 ):
-    """Get all alerts for a farmer"""
+    """Get alerts for a farmer, newest first (cursor-paginated)"""
     try:
-        db = db_client["kisanmitra"]
-        
         query = {"farmer_id": farmer_id}
         if unread_only:
             query["is_read"] = False
         
-        alerts = list(db.alerts.find(query).sort("created_at", -1))
+        alerts, next_cursor = await run_blocking(
+            "db", paginate, db.alerts, query, page, sort_field="created_at", direction=-1
+        )
         
         for alert in alerts:
-            alert["_id"] = str(alert["_id"])
-            alert["alert_id"] = alert.get("alert_id", str(alert["_id"]))
+            alert.setdefault("alert_id", str(alert["_id"]))
         
-        return {
+        return FastJSONResponse({
             "success": True,
             "alerts": alerts,
-            "count": len(alerts)
-        }
+            "count": len(alerts),
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
+        })
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/mark-read/{alert_id}")
 async def mark_alert_read(
     alert_id: str,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """Mark alert as read"""
     try:
-        db = db_client["kisanmitra"]
-        
-        result = db.alerts.update_one(
+        result = await run_blocking(
+            "db", db.alerts.update_one,
             {"_id": ObjectId(alert_id)},
             {
                 "$set": {
@@ -74,6 +81,8 @@ async def mark_alert_read(
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Alert not found")
         
+        invalidate_cache("dashboard")
+        
         return {
             "success": True,
             "message": "Alert marked as read"
@@ -86,13 +95,12 @@ async def mark_alert_read(
 @router.put("/mark-all-read/{farmer_id}")
 async def mark_all_read(
     farmer_id: str,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """Mark all alerts as read for a farmer"""
     try:
-        db = db_client["kisanmitra"]
-        
-        result = db.alerts.update_many(
+        result = await run_blocking(
+            "db", db.alerts.update_many,
             {"farmer_id": farmer_id, "is_read": False},
             {
                 "$set": {
@@ -102,27 +110,31 @@ async def mark_all_read(
             }
         )
         
+        invalidate_cache("dashboard", farmer_id=farmer_id)
+        
         return {
             "success": True,
             "message": f"Marked {result.modified_count} alerts as read"
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/{alert_id}")
 async def delete_alert(
     alert_id: str,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """Delete/dismiss alert"""
     try:
-        db = db_client["kisanmitra"]
-        
-        result = db.alerts.delete_one({"_id": ObjectId(alert_id)})
+        result = await run_blocking("db", db.alerts.delete_one, {"_id": ObjectId(alert_id)})
         
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Alert not found")
         
+        invalidate_cache("dashboard")
+        
         return {
             "success": True,
             "message": "Alert deleted successfully"
@@ -135,12 +147,10 @@ async def delete_alert(
 @router.post("/create")
 async def create_alert(
     request: CreateAlertRequest,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """Create new alert (for system/admin use)"""
     try:
-        db = db_client["kisanmitra"]
-        
         from datetime import timedelta
         import uuid
         
@@ -156,13 +166,17 @@ async def create_alert(
             "expires_at": datetime.utcnow() + timedelta(days=request.expires_days)
         }
         
-        result = db.alerts.insert_one(alert)
+        result = await run_blocking("db", db.alerts.insert_one, alert)
         alert["_id"] = str(result.inserted_id)
         
+        invalidate_cache("dashboard", farmer_id=request.farmer_id)
+        
         return {
             "success": True,
             "message": "Alert created successfully",
             "alert": alert
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -11,6 +11,7 @@ from datetime import datetime
 from Backend.auth.twilio_service import get_twilio_service
 from Backend.auth.jwt_service import get_jwt_service
 from Backend.api.dependencies import get_db_client
+from Backend.api.executor import run_blocking
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -54,7 +55,7 @@ async def send_otp(request: SendOTPRequest):
     - **phone_number**: Phone number in E.164 format (e.g., +919876543210)
     """
     twilio_service = get_twilio_service()
-    result = twilio_service.send_otp(request.phone_number)
+    result = await run_blocking("external", twilio_service.send_otp, request.phone_number)
     
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result["message"])
@@ -64,7 +65,7 @@ async def send_otp(request: SendOTPRequest):
 @router.post("/verify-otp", response_model=VerifyOTPResponse)
 async def verify_otp(
     request: VerifyOTPRequest,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """
     Verify OTP and authenticate user
@@ -79,14 +80,15 @@ async def verify_otp(
     jwt_service = get_jwt_service()
     
     # Verify OTP
-    verification_result = twilio_service.verify_otp(request.phone_number, request.otp)
+    verification_result = await run_blocking(
+        "external", twilio_service.verify_otp, request.phone_number, request.otp
+    )
     
     if not verification_result["success"]:
         raise HTTPException(status_code=400, detail=verification_result["message"])
     
     # OTP verified - check if user exists in database
-    db = db_client["kisanmitra"]
-    user = db.farmers.find_one({"phone": request.phone_number})
+    user = await run_blocking("db", db.farmers.find_one, {"phone": request.phone_number})
     
     is_new_user = user is None
     needs_onboarding = False
@@ -108,7 +110,7 @@ async def verify_otp(
             "updated_at": datetime.utcnow()
         }
         
-        db.farmers.insert_one(new_user)
+        await run_blocking("db", db.farmers.insert_one, new_user)
         needs_onboarding = True
     else:
         user_id = user.get("user_id")
@@ -142,7 +144,7 @@ async def resend_otp(request: SendOTPRequest):
     - **phone_number**: Phone number in E.164 format
     """
     twilio_service = get_twilio_service()
-    result = twilio_service.resend_otp(request.phone_number)
+    result = await run_blocking("external", twilio_service.resend_otp, request.phone_number)
     
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result["message"])
@@ -11,6 +11,10 @@ from bson import ObjectId
 import uuid
 
 from Backend.api.dependencies import get_db_client
+from Backend.api.executor import run_blocking
+from Backend.api.cache import invalidate_cache
+from Backend.api.pagination import PageParams, page_params, paginate
+from Backend.api.responses import FastJSONResponse
 
 router = APIRouter(prefix="/calendar", tags=["Calendar"])
 
@@ -30,35 +34,37 @@ class EventRequest(BaseModel):
 @router.get("/events/{farmer_id}")
 async def get_events(
     farmer_id: str,
-    db_client = Depends(get_db_client)
+    page: PageParams = Depends(page_params),
+    db = Depends(get_db_client)
 ):
-    """Get all calendar events for a farmer"""
+    """Get calendar events for a farmer by date (cursor-paginated)"""
     try:
-        db = db_client["kisanmitra"]
-        
-        events = list(db.calendar_events.find({"farmer_id": farmer_id}).sort("date", 1))
+        events, next_cursor = await run_blocking(
+            "db", paginate, db.calendar_events, {"farmer_id": farmer_id}, page, sort_field="date"
+        )
         
         for event in events:
-            event["_id"] = str(event["_id"])
-            event["event_id"] = event.get("event_id", str(event["_id"]))
+            event.setdefault("event_id", str(event["_id"]))
         
-        return {
+        return FastJSONResponse({
             "success": True,
             "events": events,
-            "count": len(events)
-        }
+            "count": len(events),
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
+        })
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/event")
 async def create_event(
     request: EventRequest,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """Create new calendar event"""
     try:
-        db = db_client["kisanmitra"]
-        
         event = {
             "event_id": f"EVT{str(uuid.uuid4())[:8].upper()}",
             "farmer_id": request.farmer_id,
@@ -73,14 +79,18 @@ async def create_event(
             "created_at": datetime.utcnow()
         }
         
-        result = db.calendar_events.insert_one(event)
+        result = await run_blocking("db", db.calendar_events.insert_one, event)
         event["_id"] = str(result.inserted_id)
         
+        invalidate_cache("dashboard", farmer_id=request.farmer_id)
+        
         return {
             "success": True,
             "message": "Event created successfully",
             "event": event
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -88,12 +98,10 @@ async def create_event(
 async def update_event(
     event_id: str,
     request: EventRequest,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """Update calendar event"""
     try:
-        db = db_client["kisanmitra"]
-        
         update_data = {
             "title": request.title,
             "description": request.description,
@@ -104,7 +112,8 @@ async def update_event(
             "updated_at": datetime.utcnow()
         }
         
-        result = db.calendar_events.update_one(
+        result = await run_blocking(
+            "db", db.calendar_events.update_one,
             {"_id": ObjectId(event_id)},
             {"$set": update_data}
         )
@@ -112,6 +121,8 @@ async def update_event(
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Event not found")
         
+        invalidate_cache("dashboard")
+        
         return {
             "success": True,
             "message": "Event updated successfully"
@@ -124,17 +135,17 @@ async def update_event(
 @router.delete("/event/{event_id}")
 async def delete_event(
     event_id: str,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """Delete calendar event"""
     try:
-        db = db_client["kisanmitra"]
-        
-        result = db.calendar_events.delete_one({"_id": ObjectId(event_id)})
+        result = await run_blocking("db", db.calendar_events.delete_one, {"_id": ObjectId(event_id)})
         
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Event not found")
         
+        invalidate_cache("dashboard")
+        
         return {
             "success": True,
             "message": "Event deleted successfully"
@@ -147,13 +158,12 @@ async def delete_event(
 @router.put("/event/{event_id}/complete")
 async def mark_event_complete(
     event_id: str,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """Mark event as completed"""
     try:
-        db = db_client["kisanmitra"]
-        
-        result = db.calendar_events.update_one(
+        result = await run_blocking(
+            "db", db.calendar_events.update_one,
             {"_id": ObjectId(event_id)},
             {
                 "$set": {
@@ -166,6 +176,8 @@ async def mark_event_complete(
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Event not found")
         
+        invalidate_cache("dashboard")
+        
         return {
             "success": True,
             "message": "Event marked as complete"
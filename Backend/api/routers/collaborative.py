@@ -3,7 +3,10 @@ from typing import Optional, Dict
 from datetime import datetime
 from pydantic import BaseModel
 
-from Backend.api.dependencies import get_current_user, get_db_client
+from Backend.api.dependencies import get_current_user
+from Backend.api.executor import run_blocking
+from Backend.api.cache import invalidate_cache
+from Backend.api.services import get_collaborative_service
 from Backend.Collaborative_Farming.service import CollaborativeFarmingService
 from Backend.Collaborative_Farming.models import CollaborativeOutput, EquipmentListing, RentalRequest, LandPoolRequest
 from Backend.Collaborative_Farming.constants import EquipmentType, PaymentMethod, PoolRequestType
@@ -36,80 +39,94 @@ class LandPoolCreate(BaseModel):
 async def get_marketplace(
     district: Optional[str] = None,
     equipment_type: Optional[str] = None,
-    db_client = Depends(get_db_client),
+    service: CollaborativeFarmingService = Depends(get_collaborative_service),
     current_user = Depends(get_current_user)
 ):
     """
     Get marketplace dashboard with rentals, pools, and reminders.
     """
     try:
-        service = CollaborativeFarmingService(db_client=db_client)
         filters = {}
         if district: filters["district"] = district
         if equipment_type: filters["equipmentType"] = equipment_type
         
-        return service.run_marketplace_view(
+        return await run_blocking(
+            "services", service.run_marketplace_view,
             farmer_id=current_user["id"],
             filters=filters
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/collaborative/equipment", response_model=EquipmentListing)
 async def list_equipment(
     data: EquipmentCreate,
-    db_client = Depends(get_db_client),
+    service: CollaborativeFarmingService = Depends(get_collaborative_service),
     current_user = Depends(get_current_user)
 ):
     """
     List equipment for rent.
     """
     try:
-        service = CollaborativeFarmingService(db_client=db_client)
-        return service.create_equipment_listing(
+        result = await run_blocking(
+            "services", service.create_equipment_listing,
             owner_id=current_user["id"],
             **data.dict()
         )
+        invalidate_cache("collaborative")
+        return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/collaborative/rental", response_model=RentalRequest)
 async def request_rental(
     data: RentalCreate,
-    db_client = Depends(get_db_client),
+    service: CollaborativeFarmingService = Depends(get_collaborative_service),
     current_user = Depends(get_current_user)
 ):
     """
     Request to rent equipment.
     """
     try:
-        service = CollaborativeFarmingService(db_client=db_client)
-        return service.request_equipment_rental(
+        result = await run_blocking(
+            "services", service.request_equipment_rental,
             renter_id=current_user["id"],
             listing_id=data.listing_id,
             start_date=data.start_date,
             end_date=data.end_date,
             payment_method=data.payment_method
         )
+        invalidate_cache("collaborative")
+        return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/collaborative/land-pool", response_model=LandPoolRequest)
 async def create_land_pool(
     data: LandPoolCreate,
-    db_client = Depends(get_db_client),
+    service: CollaborativeFarmingService = Depends(get_collaborative_service),
     current_user = Depends(get_current_user)
 ):
     """
     Create a land pooling request.
     """
     try:
-        service = CollaborativeFarmingService(db_client=db_client)
-        return service.create_land_pool_request(
+        result = await run_blocking(
+            "services", service.create_land_pool_request,
             farmer_id=current_user["id"],
             req_type=data.req_type,
             land_size=data.land_size,
             crop_pref=data.crop_pref
         )
+        invalidate_cache("collaborative")
+        return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -11,6 +11,10 @@ from bson import ObjectId
 import uuid
 
 from Backend.api.dependencies import get_db_client
+from Backend.api.executor import run_blocking
+from Backend.api.cache import invalidate_cache
+from Backend.api.pagination import PageParams, page_params, paginate
+from Backend.api.responses import FastJSONResponse
 
 router = APIRouter(prefix="/crops", tags=["Active Crops"])
 
@@ -35,35 +39,37 @@ class UpdateCropRequest(BaseModel):
 @router.get("/active/{farmer_id}")
 async def get_active_crops(
     farmer_id: str,
-    db_client = Depends(get_db_client)
+    page: PageParams = Depends(page_params),
+    db = Depends(get_db_client)
 ):
-    """Get all active crops for a farmer"""
+    """Get active crops for a farmer (cursor-paginated)"""
     try:
-        db = db_client["kisanmitra"]
-        
-        crops = list(db.active_crops.find({"farmer_id": farmer_id}))
+        crops, next_cursor = await run_blocking(
+            "db", paginate, db.active_crops, {"farmer_id": farmer_id}, page
+        )
         
         for crop in crops:
-            crop["_id"] = str(crop["_id"])
-            crop["active_crop_id"] = crop.get("active_crop_id", str(crop["_id"]))
+            crop.setdefault("active_crop_id", str(crop["_id"]))
         
-        return {
+        return FastJSONResponse({
             "success": True,
             "crops": crops,
-            "count": len(crops)
-        }
+            "count": len(crops),
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
+        })
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/add")
 async def add_crop(
     request: AddCropRequest,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """Add new active crop"""
     try:
-        db = db_client["kisanmitra"]
-        
         crop = {
             "active_crop_id": f"AC{str(uuid.uuid4())[:8].upper()}",
             "farmer_id": request.farmer_id,
@@ -82,14 +88,18 @@ async def add_crop(
             "updated_at": datetime.utcnow()
         }
         
-        result = db.active_crops.insert_one(crop)
+        result = await run_blocking("db", db.active_crops.insert_one, crop)
         crop["_id"] = str(result.inserted_id)
         
+        invalidate_cache("dashboard", farmer_id=request.farmer_id)
+        
         return {
             "success": True,
             "message": "Crop added successfully",
             "crop": crop
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -97,12 +107,10 @@ async def add_crop(
 async def update_crop(
     crop_id: str,
     request: UpdateCropRequest,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """Update crop details"""
     try:
-        db = db_client["kisanmitra"]
-        
         update_data = {"updated_at": datetime.utcnow()}
         
         if request.current_stage:
@@ -114,7 +122,8 @@ async def update_crop(
         if request.notes:
             update_data["notes"] = request.notes
         
-        result = db.active_crops.update_one(
+        result = await run_blocking(
+            "db", db.active_crops.update_one,
             {"_id": ObjectId(crop_id)},
             {"$set": update_data}
         )
@@ -122,6 +131,8 @@ async def update_crop(
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Crop not found")
         
+        invalidate_cache("dashboard")
+        
         return {
             "success": True,
             "message": "Crop updated successfully"
@@ -134,17 +145,17 @@ async def update_crop(
 @router.delete("/{crop_id}")
 async def delete_crop(
     crop_id: str,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """Delete/harvest crop"""
     try:
-        db = db_client["kisanmitra"]
-        
-        result = db.active_crops.delete_one({"_id": ObjectId(crop_id)})
+        result = await run_blocking("db", db.active_crops.delete_one, {"_id": ObjectId(crop_id)})
         
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Crop not found")
         
+        invalidate_cache("dashboard")
+        
         return {
             "success": True,
             "message": "Crop removed successfully"
@@ -157,13 +168,12 @@ async def delete_crop(
 @router.post("/water/{crop_id}")
 async def water_crop(
     crop_id: str,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """Log watering activity"""
     try:
-        db = db_client["kisanmitra"]
-        
-        result = db.active_crops.update_one(
+        result = await run_blocking(
+            "db", db.active_crops.update_one,
             {"_id": ObjectId(crop_id)},
             {
                 "$set": {
@@ -176,6 +186,8 @@ async def water_crop(
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Crop not found")
         
+        invalidate_cache("dashboard")
+        
         return {
             "success": True,
             "message": "Watering logged successfully"
@@ -188,13 +200,12 @@ async def water_crop(
 @router.post("/fertilize/{crop_id}")
 async def fertilize_crop(
     crop_id: str,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """Log fertilizing activity"""
     try:
-        db = db_client["kisanmitra"]
-        
-        result = db.active_crops.update_one(
+        result = await run_blocking(
+            "db", db.active_crops.update_one,
             {"_id": ObjectId(crop_id)},
             {
                 "$set": {
@@ -207,6 +218,8 @@ async def fertilize_crop(
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Crop not found")
         
+        invalidate_cache("dashboard")
+        
         return {
             "success": True,
             "message": "Fertilizing logged successfully"
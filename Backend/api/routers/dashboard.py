@@ -1,39 +1,180 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+import asyncio
 from Backend.database.connection import get_database
 from Backend.database.models import User, Farmer, Task, Alert, FinanceTransaction, ConversationMeta, Session
+from Backend.api.dependencies import get_db_client, get_current_user
+from Backend.api.executor import run_blocking
+from Backend.api.responses import FastJSONResponse
+from Backend.api.services import get_finance_service
+from Backend.Financial_tracking.constants import SeasonType
+from Backend.utils.timing import span
 from bson import ObjectId
 
 router = APIRouter()
 
+# Per-section budget for /dashboard/bundle; a section that misses it is
+# reported in "errors" and left null instead of holding up the response
+SECTION_TIMEOUTS_MS: Dict[str, int] = {
+    "active_crops": 1500,
+    "unread_alerts": 1500,
+    "today_tasks": 1500,
+    "finance": 3000,
+    "weather": 2500,
+}
+
+# --- Section loaders (blocking; run via run_blocking) ---
+
+def _count_active_crops(db, farmer_id: str) -> int:
+    if db is None:
+        return 0
+    return db.active_crops.count_documents({"farmer_id": farmer_id})
+
+def _count_unread_alerts(db, farmer_id: str) -> int:
+    if db is None:
+        return 0
+    return db.alerts.count_documents({"farmer_id": farmer_id, "is_read": False})
+
+def _today_tasks(db, farmer_id: str) -> List[Dict[str, Any]]:
+    if db is None:
+        return []
+    today = datetime.now().strftime("%Y-%m-%d")
+    events = db.calendar_events.find({"farmer_id": farmer_id, "date": today}).sort("time", 1).limit(20)
+    return [
+        {
+            "id": e.get("event_id", str(e["_id"])),
+            "title": e.get("title"),
+            "type": e.get("event_type"),
+            "time": e.get("time"),
+            "duration_hours": e.get("duration_hours"),
+            "status": e.get("status"),
+        }
+        for e in events
+    ]
+
+def _finance_summary(service, farmer_id: str, season: str) -> Dict[str, Any]:
+    report = service.run_finance_report(farmerId=farmer_id, season=season, language="en")
+    totals = report.totals
+    top_cause = report.lossCauses[0].title if report.lossCauses else None
+    return {
+        "revenue": totals.totalIncome,
+        "expenses": totals.totalExpense,
+        "profit": totals.profitOrLoss,
+        "revenue_change": f"{totals.profitMarginPct:+.0f}%",
+        "expenses_change": top_cause or "No major loss cause",
+    }
+
+def _current_weather(db, user: Dict[str, Any]) -> Dict[str, Any]:
+    from Backend.Voice_agent.retrieval.weather_service import find_farmer_location, get_weather_service
+    # Stored coordinates, else the user's district centre (None = service default)
+    location = find_farmer_location(db, user["id"], fallback=user)
+    weather = get_weather_service().get_current_weather(location)
+    return {
+        "temp": weather.get("temperature"),
+        "condition": weather.get("condition"),
+        "humidity": weather.get("humidity"),
+        "rain_expected": weather.get("rain_forecast", False),
+        "advisory": weather.get("advisory"),
+    }
+
+def _parse_timeouts(timeouts: Optional[str]) -> Dict[str, int]:
+    """``"weather:800,finance:2000"`` -> per-section overrides in ms"""
+    budget = dict(SECTION_TIMEOUTS_MS)
+    for part in (timeouts or "").split(","):
+        name, _, value = part.partition(":")
+        name = name.strip()
+        if not name:
+            continue
+        if name not in budget or not value.strip().isdigit():
+            raise HTTPException(status_code=400, detail=f"Invalid section timeout: {part.strip()}")
+        budget[name] = int(value)
+    return budget
+
+async def _gather_sections(loaders: Dict[str, Any], budget: Dict[str, int]):
+    """
+    Await section coroutines concurrently, each under its own timeout.
+
+    Returns:
+        (results, errors) - failed or slow sections are None in results
+    """
+    async def _run(name, coro):
+        with span(f"dashboard.{name}"):
+            return await asyncio.wait_for(coro, timeout=budget[name] / 1000)
+
+    names = list(loaders)
+    outcomes = await asyncio.gather(
+        *(_run(name, loaders[name]) for name in names), return_exceptions=True
+    )
+    results, errors = {}, {}
+    for name, outcome in zip(names, outcomes):
+        if isinstance(outcome, asyncio.TimeoutError):
+            results[name] = None
+            errors[name] = f"timed out after {budget[name]} ms"
+        elif isinstance(outcome, HTTPException):
+            results[name] = None
+            errors[name] = outcome.detail
+        elif isinstance(outcome, Exception):
+            results[name] = None
+            errors[name] = str(outcome) or type(outcome).__name__
+        else:
+            results[name] = outcome
+    return results, errors
+
+@router.get("/dashboard/bundle")
+async def get_dashboard_bundle(
+    season: str = SeasonType.KHARIF.value,
+    timeouts: Optional[str] = Query(None, description='Per-section overrides in ms, e.g. "weather:800,finance:2000"'),
+    db = Depends(get_db_client),
+    finance_service = Depends(get_finance_service),
+    current_user = Depends(get_current_user)
+):
+    """
+    Everything the home screen needs in one round-trip: active crop count,
+    unread alerts, today's tasks, finance summary and weather.
+
+    Sections load concurrently. A section that fails or exceeds its timeout
+    comes back null with the reason in ``errors`` and ``partial`` is true.
+    """
+    budget = _parse_timeouts(timeouts)
+    farmer_id = current_user["id"]
+
+    results, errors = await _gather_sections({
+        "active_crops": run_blocking("db", _count_active_crops, db, farmer_id),
+        "unread_alerts": run_blocking("db", _count_unread_alerts, db, farmer_id),
+        "today_tasks": run_blocking("db", _today_tasks, db, farmer_id),
+        "finance": run_blocking("services", _finance_summary, finance_service, farmer_id, season),
+        "weather": run_blocking("external", _current_weather, db, current_user),
+    }, budget)
+
+    # Don't let the response cache pin a degraded bundle
+    headers = {"Cache-Control": "no-store"} if errors else None
+    return FastJSONResponse({
+        "farmer_id": farmer_id,
+        **results,
+        "partial": bool(errors),
+        "errors": errors,
+    }, headers=headers)
+
 @router.get("/dashboard/stats")
-async def get_dashboard_stats(db=Depends(get_database)):
+async def get_dashboard_stats(
+    db = Depends(get_db_client),
+    current_user = Depends(get_current_user)
+):
     """
     Get summary statistics for the dashboard.
     """
-    # Mock hardcoded farmer ID for MVP (Demo User: Ramesh)
-    # In production, get from auth token
-    
-    # Try to find a demo farmer, or use a placeholder ID
-    # For now, we'll assume a dummy ID if not found, but ideally init_db seeds this.
-    
-    # 1. Active Crops Count
-    # active_crops_count = await db.components.count_documents({"farmerId": farmer_id, "status": "active"})
-    
-    # 2. Alerts Count (Unread)
-    # unread_alerts = await db.alerts_notifications.count_documents({"farmerId": farmer_id, "isRead": False})
-    
-    # Return mock stats for now if DB is empty to prevent UI crashing
-    return {
-        "active_crops": 3,
-        "unread_alerts": 2,
-        "weather": {
-            "temp": 32,
-            "condition": "Sunny",
-            "chance_of_rain": 10
-        }
-    }
+    farmer_id = current_user["id"]
+    results, errors = await _gather_sections({
+        "active_crops": run_blocking("db", _count_active_crops, db, farmer_id),
+        "unread_alerts": run_blocking("db", _count_unread_alerts, db, farmer_id),
+        "weather": run_blocking("external", _current_weather, db, current_user),
+    }, SECTION_TIMEOUTS_MS)
+    if errors:
+        # Don't let the response cache pin a degraded answer
+        results["errors"] = errors
+        return FastJSONResponse(results, headers={"Cache-Control": "no-store"})
+    return results
 
 @router.get("/dashboard/timeline", response_model=List[Dict[str, Any]])
 async def get_dashboard_timeline(db=Depends(get_database)):
@@ -79,16 +220,15 @@ async def get_dashboard_timeline(db=Depends(get_database)):
     return result
 
 @router.get("/dashboard/finance")
-async def get_dashboard_finance(db=Depends(get_database)):
+async def get_dashboard_finance(
+    season: str = SeasonType.KHARIF.value,
+    finance_service = Depends(get_finance_service),
+    current_user = Depends(get_current_user)
+):
     """
     Get financial summary.
     """
-    return {
-        "revenue": 124500,
-        "expenses": 45200,
-        "revenue_change": "+12%",
-        "expenses_change": "High fertilizer cost"
-    }
+    return await run_blocking("services", _finance_summary, finance_service, current_user["id"], season)
 
 @router.get("/alerts", response_model=List[Alert])
 async def get_alerts(db=Depends(get_database)):
@@ -1,10 +1,16 @@
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
 from typing import Dict, Any, Optional
 
-from ..dependencies import get_db_client, get_current_user
+from ..dependencies import get_current_user
+from ..executor import run_blocking
+from ..services import (
+    get_pre_seeding_service,
+    get_vision_engine,
+    get_market_engine,
+    get_post_harvest_engine
+)
 from Backend.Farm_management.Planning_stage.service import PreSeedingService
 from Backend.Farm_management.Planning_stage.models import PlanningRequest, PreSeedingOutput
-from Backend.Farm_management.Farming_stage.engines.vision_engine import VisionEngine
 from Backend.Farm_management.Farming_stage.engines.market_engine import MarketEngine
 from Backend.Farm_management.Post_Harvest_stage.core.engine import PostHarvestDecisionEngine, DecisionResult as PostHarvestPlan
 from Backend.Farm_management.Post_Harvest_stage.core.context import FarmerContext as HarvestContext
@@ -18,16 +24,14 @@ router = APIRouter()
 @router.post("/planning/pre-seeding", response_model=PreSeedingOutput)
 async def get_pre_seeding_plan(
     request: PlanningRequest,
-    db_client = Depends(get_db_client),
+    service: PreSeedingService = Depends(get_pre_seeding_service),
     current_user = Depends(get_current_user)
 ):
     """
     Get comprehensive crop recommendations and scheme eligibility.
     """
     try:
-        # Initialize service with user's DB connection if available
-        service = PreSeedingService(db_client=db_client) 
-        output = service.run(request)
+        output = await run_blocking("planning", service.run, request)
         return output
     except ValueError as e:
         error_msg = str(e)
@@ -41,6 +45,8 @@ async def get_pre_seeding_plan(
                 }
             )
         raise HTTPException(status_code=400, detail=error_msg)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -51,6 +57,7 @@ async def get_pre_seeding_plan(
 @router.post("/farming/disease-detect")
 async def detect_disease(
     file: UploadFile = File(...),
+    engine = Depends(get_vision_engine),
     current_user = Depends(get_current_user)
 ):
     """
@@ -69,13 +76,14 @@ async def detect_disease(
             shutil.copyfileobj(file.file, buffer)
             
         # Run detection
-        engine = VisionEngine()
-        result = engine.detect_disease(temp_path)
+        result = await run_blocking("vision", engine.detect_disease, temp_path)
         
         # Cleanup
         os.remove(temp_path)
         
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -83,22 +91,25 @@ async def detect_disease(
 async def get_market_prices(
     crop: str,
     state: Optional[str] = None,
+    engine: MarketEngine = Depends(get_market_engine),
     current_user = Depends(get_current_user)
 ):
     """
     Get real-time market prices.
     """
     try:
-        engine = MarketEngine()
-        market_data = engine.get_market_data(crop)
+        market_data = await run_blocking("services", engine.get_market_data, crop)
+        forecast = await run_blocking("services", engine.get_price_forecast, crop)
         return {
             "crop": crop,
             "state": state or current_user.get("state"),
             "current_price": market_data.current_price,
             "trend": market_data.price_trend.value,
             "demand": market_data.demand_level.value,
-            "forecast": engine.get_price_forecast(crop)
+            "forecast": forecast
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -109,13 +120,15 @@ async def get_market_prices(
 @router.post("/post-harvest/plan", response_model=PostHarvestPlan)
 async def get_post_harvest_plan(
     context: HarvestContext,
+    engine: PostHarvestDecisionEngine = Depends(get_post_harvest_engine),
     current_user = Depends(get_current_user)
 ):
     """
     Get post-harvest optimization plan (sell vs store, market selection).
     """
     try:
-        engine = PostHarvestDecisionEngine()
-        return engine.run_decision(context)
+        return await run_blocking("planning", engine.run_decision, context)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
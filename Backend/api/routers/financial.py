@@ -7,6 +7,9 @@ from datetime import datetime
 from Backend.Financial_tracking.service import FinanceTrackingService
 from Backend.Financial_tracking.models import FinanceModuleOutput, FinanceTransaction
 from Backend.Financial_tracking.constants import SeasonType, TransactionType
+from Backend.api.executor import run_blocking
+from Backend.api.services import get_finance_service
+from Backend.api.cache import invalidate_cache
 
 router = APIRouter()
 
@@ -36,27 +39,23 @@ class FinanceDashboardResponse(BaseModel):
     recent_transactions: List[dict]
     insights: Any # FinanceModuleOutput (or subset)
 
-# --- Service Helper ---
-def get_service():
-    return FinanceTrackingService()
-
 # --- Endpoints ---
 
 @router.get("/finance/{farmer_id}/dashboard", response_model=FinanceDashboardResponse)
 async def get_finance_dashboard(
     farmer_id: str,
     season: str = SeasonType.KHARIF.value,
-    language: str = "en"
+    language: str = "en",
+    service: FinanceTrackingService = Depends(get_finance_service)
 ):
     """
     Get complete financial dashboard data in one go.
     Aggregates report, crop performance, and transactions.
     """
     try:
-        service = get_service()
-        
         # 1. Get Main Report (Totals, Insights)
-        report = service.run_finance_report(
+        report = await run_blocking(
+            "services", service.run_finance_report,
             farmerId=farmer_id,
             season=season,
             language=language,
@@ -64,7 +63,9 @@ async def get_finance_dashboard(
         )
 
         # 2. Get Raw Transactions
-        transactions = service.transaction_repo.list_transactions(farmer_id, season)
+        transactions = await run_blocking(
+            "services", service.transaction_repo.list_transactions, farmer_id, season
+        )
         
         # 3. Calculate Crop Performance
         # Group transactions by crop (using relatedCropId or inferring from notes/mock)
@@ -140,6 +141,8 @@ async def get_finance_dashboard(
             insights=report
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -148,15 +151,16 @@ async def get_finance_dashboard(
 @router.post("/finance/{farmer_id}/transaction")
 async def add_transaction(
     farmer_id: str,
-    data: TransactionCreate
+    data: TransactionCreate,
+    service: FinanceTrackingService = Depends(get_finance_service)
 ):
     """
     Record a new transaction (expense or income)
     """
     try:
-        service = get_service()
         if data.type.lower() == "income":
-            return service.add_income(
+            transaction = await run_blocking(
+                "services", service.add_income,
                 farmerId=farmer_id,
                 season=data.season,
                 category=data.category,
@@ -165,7 +169,8 @@ async def add_transaction(
                 relatedCropId=data.relatedCropId
             )
         else:
-            return service.add_expense(
+            transaction = await run_blocking(
+                "services", service.add_expense,
                 farmerId=farmer_id,
                 season=data.season,
                 category=data.category,
@@ -173,6 +178,11 @@ async def add_transaction(
                 notes=data.notes,
                 relatedCropId=data.relatedCropId
             )
+        
+        invalidate_cache("dashboard", farmer_id=farmer_id)
+        return transaction
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -2,6 +2,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Optional
 
 from Backend.api.dependencies import get_current_user
+from Backend.api.executor import run_blocking
+from Backend.api.services import get_gov_schemes_service
 from Backend.Gov_Schemes.service import GovSchemesDisplayService
 from Backend.Gov_Schemes.models import GovSchemesOutput, SchemeRecord
 from Backend.Gov_Schemes.constants import SchemeCategory
@@ -14,19 +16,19 @@ async def get_schemes_display(
     state: Optional[str] = None,
     district: Optional[str] = None,
     force_refresh: bool = False,
+    service: GovSchemesDisplayService = Depends(get_gov_schemes_service),
     current_user = Depends(get_current_user)
 ):
     """
     Get eligible schemes, filtered by location/category, with voice summary.
     """
     try:
-        service = GovSchemesDisplayService()
-        
         # Use location from params or user profile
         filter_state = state or current_user.get("state")
         filter_district = district or current_user.get("district")
         
-        return service.get_schemes_display(
+        return await run_blocking(
+            "services", service.get_schemes_display,
             farmer_id=current_user["id"],
             state=filter_state,
             district=filter_district,
@@ -34,20 +36,22 @@ async def get_schemes_display(
             force_refresh=force_refresh,
             generate_alerts=True
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/schemes/{scheme_id}", response_model=SchemeRecord)
 async def get_scheme_details(
     scheme_id: str,
+    service: GovSchemesDisplayService = Depends(get_gov_schemes_service),
     current_user = Depends(get_current_user)
 ):
     """
     Get detailed information for a specific scheme.
     """
     try:
-        service = GovSchemesDisplayService()
-        scheme = service.get_scheme_by_id(scheme_id)
+        scheme = await run_blocking("services", service.get_scheme_by_id, scheme_id)
         if not scheme:
             raise HTTPException(status_code=404, detail="Scheme not found")
         return scheme
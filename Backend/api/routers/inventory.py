@@ -10,6 +10,10 @@ from datetime import datetime
 from bson import ObjectId
 
 from Backend.api.dependencies import get_db_client
+from Backend.api.executor import run_blocking
+from Backend.api.cache import invalidate_cache
+from Backend.api.pagination import PageParams, page_params, paginate
+from Backend.api.responses import FastJSONResponse
 
 router = APIRouter(prefix="/inventory", tags=["Inventory"])
 
@@ -56,43 +60,45 @@ class RestockItemRequest(BaseModel):
 async def get_inventory_items(
     farmer_id: str,
     category: Optional[str] = None,
-    db_client = Depends(get_db_client)
+    page: PageParams = Depends(page_params),
+    db = Depends(get_db_client)
 ):
     """
-    Get all inventory items for a farmer
+    Get inventory items for a farmer (cursor-paginated)
     
     - **farmer_id**: Farmer ID
     - **category**: Optional filter by category
+    - **limit** / **cursor**: Page size and next_cursor from the previous page
+    - **fields**: Optional comma-separated projection
     """
     try:
-        db = db_client["kisanmitra"]
-        
         # Build query
         query = {"farmer_id": farmer_id}
         if category:
             query["category"] = category
         
         # Fetch items
-        items = list(db.inventory.find(query))
+        items, next_cursor = await run_blocking("db", paginate, db.inventory, query, page)
         
-        # Convert ObjectId to string
         for item in items:
-            item["_id"] = str(item["_id"])
-            if "item_id" not in item:
-                item["item_id"] = item["_id"]
+            item.setdefault("item_id", str(item["_id"]))
         
-        return {
+        return FastJSONResponse({
             "success": True,
             "items": items,
-            "count": len(items)
-        }
+            "count": len(items),
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
+        })
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/add")
 async def add_inventory_item(
     request: AddItemRequest,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """
     Add new inventory item
@@ -105,8 +111,6 @@ async def add_inventory_item(
     - **cost_per_unit**: Cost per unit
     """
     try:
-        db = db_client["kisanmitra"]
-        
         # Calculate total cost
         total_cost = request.quantity * request.cost_per_unit
         
@@ -137,15 +141,19 @@ async def add_inventory_item(
         }
         
         # Insert into database
-        result = db.inventory.insert_one(item)
+        result = await run_blocking("db", db.inventory.insert_one, item)
         item["item_id"] = str(result.inserted_id)
         item["_id"] = str(result.inserted_id)
         
+        invalidate_cache("dashboard", farmer_id=request.farmer_id)
+        
         return {
             "success": True,
             "message": "Item added successfully",
             "item": item
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -153,7 +161,7 @@ async def add_inventory_item(
 async def use_inventory_item(
     item_id: str,
     request: UseItemRequest,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """
     Use/consume inventory item (reduces quantity)
@@ -162,10 +170,8 @@ async def use_inventory_item(
     - **quantity**: Quantity to use
     """
     try:
-        db = db_client["kisanmitra"]
-        
         # Find item
-        item = db.inventory.find_one({"_id": ObjectId(item_id)})
+        item = await run_blocking("db", db.inventory.find_one, {"_id": ObjectId(item_id)})
         if not item:
             raise HTTPException(status_code=404, detail="Item not found")
         
@@ -185,7 +191,8 @@ async def use_inventory_item(
             status = "in_stock"
         
         # Update in database
-        db.inventory.update_one(
+        await run_blocking(
+            "db", db.inventory.update_one,
             {"_id": ObjectId(item_id)},
             {
                 "$set": {
@@ -196,6 +203,8 @@ async def use_inventory_item(
             }
         )
         
+        invalidate_cache("dashboard")
+        
         return {
             "success": True,
             "message": f"Used {request.quantity} {item['unit']}",
@@ -211,7 +220,7 @@ async def use_inventory_item(
 async def restock_inventory_item(
     item_id: str,
     request: RestockItemRequest,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """
     Restock inventory item (increases quantity)
@@ -221,10 +230,8 @@ async def restock_inventory_item(
     - **cost_per_unit**: Optional new cost per unit
     """
     try:
-        db = db_client["kisanmitra"]
-        
         # Find item
-        item = db.inventory.find_one({"_id": ObjectId(item_id)})
+        item = await run_blocking("db", db.inventory.find_one, {"_id": ObjectId(item_id)})
         if not item:
             raise HTTPException(status_code=404, detail="Item not found")
         
@@ -252,11 +259,14 @@ async def restock_inventory_item(
             "updated_at": datetime.utcnow()
         }
         
-        db.inventory.update_one(
+        await run_blocking(
+            "db", db.inventory.update_one,
             {"_id": ObjectId(item_id)},
             {"$set": update_data}
         )
         
+        invalidate_cache("dashboard")
+        
         return {
             "success": True,
             "message": f"Restocked {request.quantity} {item['unit']}",
@@ -271,7 +281,7 @@ async def restock_inventory_item(
 @router.delete("/delete/{item_id}")
 async def delete_inventory_item(
     item_id: str,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """
     Delete inventory item
@@ -279,13 +289,13 @@ async def delete_inventory_item(
     - **item_id**: Item ID
     """
     try:
-        db = db_client["kisanmitra"]
-        
-        result = db.inventory.delete_one({"_id": ObjectId(item_id)})
+        result = await run_blocking("db", db.inventory.delete_one, {"_id": ObjectId(item_id)})
         
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Item not found")
         
+        invalidate_cache("dashboard")
+        
         return {
             "success": True,
             "message": "Item deleted successfully"
@@ -298,7 +308,7 @@ async def delete_inventory_item(
 @router.get("/summary/{farmer_id}")
 async def get_inventory_summary(
     farmer_id: str,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """
     Get inventory summary statistics
@@ -306,25 +316,27 @@ async def get_inventory_summary(
     - **farmer_id**: Farmer ID
     """
     try:
-        db = db_client["kisanmitra"]
-        
-        # Get all items
-        items = list(db.inventory.find({"farmer_id": farmer_id}))
+        # Aggregate per category in MongoDB instead of pulling every item
+        pipeline = [
+            {"$match": {"farmer_id": farmer_id}},
+            {"$group": {
+                "_id": {"$ifNull": ["$category", "other"]},
+                "count": {"$sum": 1},
+                "value": {"$sum": {"$ifNull": ["$total_cost", 0]}},
+                "low_stock": {"$sum": {"$cond": [{"$eq": ["$status", "low_stock"]}, 1, 0]}},
+                "out_of_stock": {"$sum": {"$cond": [{"$eq": ["$status", "out_of_stock"]}, 1, 0]}},
+            }},
+        ]
+        groups = await run_blocking("db", lambda: list(db.inventory.aggregate(pipeline)))
         
         # Calculate statistics
-        total_items = len(items)
-        total_value = sum(item.get("total_cost", 0) for item in items)
-        low_stock_items = len([item for item in items if item.get("status") == "low_stock"])
-        out_of_stock_items = len([item for item in items if item.get("status") == "out_of_stock"])
+        total_items = sum(g["count"] for g in groups)
+        total_value = sum(g["value"] for g in groups)
+        low_stock_items = sum(g["low_stock"] for g in groups)
+        out_of_stock_items = sum(g["out_of_stock"] for g in groups)
         
         # Category breakdown
-        categories = {}
-        for item in items:
-            category = item.get("category", "other")
-            if category not in categories:
-                categories[category] = {"count": 0, "value": 0}
-            categories[category]["count"] += 1
-            categories[category]["value"] += item.get("total_cost", 0)
+        categories = {g["_id"]: {"count": g["count"], "value": g["value"]} for g in groups}
         
         return {
             "success": True,
@@ -336,5 +348,7 @@ async def get_inventory_summary(
                 "categories": categories
             }
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
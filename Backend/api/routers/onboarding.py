@@ -3,6 +3,7 @@ from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
 from Backend.api.dependencies import get_db_client
+from Backend.api.executor import run_blocking
 
 router = APIRouter(prefix="/onboarding", tags=["onboarding"])
 
@@ -29,14 +30,12 @@ class OnboardingCompleteResponse(BaseModel):
 @router.post("/complete", response_model=OnboardingCompleteResponse)
 async def complete_onboarding(
     request: OnboardingCompleteRequest,
-    db_client = Depends(get_db_client)
+    db = Depends(get_db_client)
 ):
     """
     Complete the onboarding process and create/update farmer profile
     """
     try:
-        db = db_client["kisanmitra"]
-        
         # Generate unique IDs (in production, use proper ID generation or get from auth)
         import uuid
         user_id = f"U{str(uuid.uuid4())[:8].upper()}"
@@ -68,7 +67,7 @@ async def complete_onboarding(
         }
         
         # Insert into farmers collection
-        result = db.farmers.insert_one(farmer_document)
+        result = await run_blocking("db", db.farmers.insert_one, farmer_document)
         
         if not result.inserted_id:
             raise HTTPException(status_code=500, detail="Failed to create farmer profile")
@@ -79,6 +78,8 @@ async def complete_onboarding(
             message="Onboarding completed successfully"
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error in complete_onboarding: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to complete onboarding: {str(e)}")
@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, WebSocket, WebSocketDisconnect
 from typing import Optional
 from pydantic import BaseModel
-import os
-import shutil
+import asyncio
+import json
 
 from Backend.api.dependencies import get_db_client, get_current_user
+from Backend.api.executor import run_blocking
+from Backend.api.responses import FastJSONResponse, dumps
 from Backend.Voice_agent.core.agent import get_voice_agent
-from Backend.Voice_agent.input_processing.speech_to_text import get_speech_to_text, WhisperSTT as SpeechToText
+from Backend.Voice_agent.input_processing.speech_to_text import WhisperPool, STTBusyError, decode_audio
+from Backend.Voice_agent.input_processing.streaming import FrameDecoder, StreamingTranscriber
+from Backend.api.services import get_speech_to_text_service
 
 router = APIRouter()
 
@@ -38,17 +42,22 @@ async def process_voice_input(
         sid = request.session_id
         
         # Initialize Agent
-        agent = get_voice_agent(db_client=db_client)
+        agent = await run_blocking("voice", get_voice_agent, db_client=db_client)
         
-        # Process through Agent
-        response = agent.process_input(
+        # Process through Agent (stages run concurrently on executor lanes;
+        # the session is saved after the response is sent)
+        response = await agent.process_input_async(
             hindi_text=request.hindi_text,
             farmer_id=fid,
-            session_id=sid
+            session_id=sid,
+            run=run_blocking
         )
         
-        return response.to_dict()
+        # AgentResponse (dataclass, Intent enum, datetimes) encodes natively
+        return FastJSONResponse(response)
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -58,51 +67,149 @@ async def process_audio_input(
     farmer_id: Optional[str] = None,
     session_id: Optional[str] = None,
     db_client = Depends(get_db_client),
+    stt: WhisperPool = Depends(get_speech_to_text_service),
     current_user = Depends(get_current_user)
 ):
     """
     Process audio input for the conversational voice agent.
     Upload an audio file (wav, mp3, m4a, etc.) and it will be transcribed.
     """
-    temp_path = None
     try:
-        # Initialize STT
-        stt = SpeechToText()
-        
-        # Save temp file
-        temp_dir = "temp_voice"
-        os.makedirs(temp_dir, exist_ok=True)
-        temp_path = os.path.join(temp_dir, audio.filename or "input.wav")
+        audio_bytes = await audio.read()
+        if not audio_bytes:
+            raise HTTPException(status_code=400, detail="Empty audio upload")
         
-        with open(temp_path, "wb") as buffer:
-            shutil.copyfileobj(audio.file, buffer)
+        # Decode in memory; only the transcription itself holds a pooled model
+        try:
+            samples = await run_blocking("services", decode_audio, audio_bytes)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
         # Transcribe (auto-detect language)
-        hindi_text = stt.transcribe(temp_path, language=None)
-        
-        # Cleanup temp file
-        os.remove(temp_path)
-        temp_path = None
+        try:
+            hindi_text = await run_blocking("stt", stt.transcribe, samples, language=None)
+        except STTBusyError as e:
+            raise HTTPException(status_code=503, detail=str(e))
         
         # Resolve Farmer ID
         fid = farmer_id or current_user.get("id", "F001")
         
         # Initialize Agent
-        agent = get_voice_agent(db_client=db_client)
+        agent = await run_blocking("voice", get_voice_agent, db_client=db_client)
         
         # Process through Agent
-        response = agent.process_input(
+        response = await agent.process_input_async(
             hindi_text=hindi_text,
             farmer_id=fid,
-            session_id=session_id
+            session_id=session_id,
+            run=run_blocking
         )
         
         response_dict = response.to_dict()
         response_dict["transcription"] = hindi_text
-        return response_dict
+        return FastJSONResponse(response_dict)
         
+    except HTTPException:
+        raise
     except Exception as e:
-        # Clean up temp file on error
-        if temp_path and os.path.exists(temp_path):
-            os.remove(temp_path)
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.websocket("/voice/stream")
+async def voice_stream(
+    websocket: WebSocket,
+    farmer_id: Optional[str] = None,
+    session_id: Optional[str] = None,
+    format: str = "pcm16",
+    language: Optional[str] = "hi"
+):
+    """
+    Streaming voice input.
+    
+    Client sends binary frames of 16 kHz mono audio (``format=pcm16``:
+    little-endian int16; ``format=opus``: one Opus packet per frame, needs
+    opuslib) and may send ``{"type": "end"}`` to end an utterance early.
+    
+    Server sends:
+        {"type": "partial", "text": ..., "audio_ms": ...}   while speaking
+        {"type": "final", "text": ..., "audio_ms": ...}     at end of speech
+        {"type": "response", "response": {...}}             agent reply
+        {"type": "error", "detail": ...}
+    
+    The socket stays open for follow-up utterances in the same session.
+    """
+    await websocket.accept()
+    try:
+        decoder = FrameDecoder(format)
+        stt = await get_speech_to_text_service()
+    except (ValueError, HTTPException) as e:
+        await websocket.send_json({"type": "error", "detail": getattr(e, "detail", str(e))})
+        await websocket.close(code=1003 if isinstance(e, ValueError) else 1011)
+        return
+    
+    fid = farmer_id or get_current_user().get("id", "F001")
+    transcriber = StreamingTranscriber(stt, language=language or None)
+    partial_task: Optional[asyncio.Task] = None
+    
+    async def send_partial():
+        try:
+            text = await run_blocking("stt", transcriber.decode_partial)
+        except (STTBusyError, HTTPException):
+            return  # skip this partial; the final decode still runs
+        if text:
+            await websocket.send_json({"type": "partial", "text": text, "audio_ms": transcriber.audio_ms})
+    
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            
+            if message.get("bytes") is not None:
+                ended = transcriber.feed(decoder.decode(message["bytes"]))
+            else:
+                try:
+                    ended = json.loads(message.get("text") or "{}").get("type") == "end"
+                except (ValueError, AttributeError):
+                    ended = False
+            
+            if not ended:
+                if (partial_task is None or partial_task.done()) and transcriber.should_decode():
+                    partial_task = asyncio.create_task(send_partial())
+                continue
+            
+            # End of speech: finish the tail and hand the text to the agent
+            if partial_task is not None:
+                await partial_task
+            try:
+                text = await run_blocking("stt", transcriber.finish)
+            except STTBusyError as e:
+                await websocket.send_json({"type": "error", "detail": str(e)})
+                transcriber.reset()
+                continue
+            await websocket.send_json({"type": "final", "text": text, "audio_ms": transcriber.audio_ms})
+            transcriber.reset()
+            if not text:
+                continue
+            
+            agent = await run_blocking("voice", get_voice_agent, db_client=get_db_client())
+            response = await agent.process_input_async(
+                hindi_text=text,
+                farmer_id=fid,
+                session_id=session_id,
+                run=run_blocking
+            )
+            session_id = response.session_id
+            await websocket.send_text(dumps({"type": "response", "response": response}).decode())
+    
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        detail = e.detail if isinstance(e, HTTPException) else str(e)
+        try:
+            await websocket.send_json({"type": "error", "detail": detail})
+            await websocket.close(code=1011)
+        except RuntimeError:
+            pass  # client already gone
+    finally:
+        if partial_task is not None and not partial_task.done():
+            partial_task.cancel()
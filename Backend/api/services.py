@@ -0,0 +1,225 @@
+"""
+Service Registry
+Builds the domain services once per worker and hands the same instances to
+every request through ``Depends``, so repository seeds and caches (SchemeRepo
+sync, SummaryRepo, the Keras model) survive between requests.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException
+
+from Backend.database.connection import db as mongo
+from .executor import run_blocking
+
+
+@dataclass
+class _Entry:
+    factory: Callable[[], Any]
+    warm: Optional[Callable[[Any], None]] = None
+    lane: str = "services"
+    heavy: bool = False
+    instance: Any = None
+    error: Optional[str] = None
+    failures: int = 0  # consecutive failed builds
+    retry_at: float = 0.0  # monotonic time the next build may be attempted
+    build_ms: float = 0.0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class ServiceRegistry:
+    """
+    Application-scoped container for services and engines.
+
+    ``start()`` runs from the app lifespan: it builds the registered
+    services off the event loop and, when warm-up is enabled, also builds
+    the heavy ones and runs the warm-up hooks. A request that arrives
+    before its service is built waits for (or triggers) the build instead
+    of constructing a private copy. ``ready`` flips only after the whole
+    start-up pass, warm-ups included, has finished.
+    """
+
+    # A failed build is retried after 1s, 2s, 4s ... (capped), so a dependency
+    # that was briefly down (Mongo starting) doesn't disable a service for good
+    RETRY_BASE_S = 1.0
+    RETRY_MAX_S = 60.0
+
+    def __init__(self):
+        self._entries: Dict[str, _Entry] = {}
+        self.ready = False
+        self.started_at: Optional[float] = None
+        self.ready_in_ms: Optional[float] = None
+
+    def register(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        warm: Optional[Callable[[Any], None]] = None,
+        lane: str = "services",
+        heavy: bool = False
+    ):
+        """
+        Register a zero-argument factory (and optional warm-up hook) under ``name``.
+        Heavy services (large models, TensorFlow/Whisper imports) are only
+        built at startup when warm-up is enabled, otherwise on first use.
+        """
+        self._entries[name] = _Entry(factory=factory, warm=warm, lane=lane, heavy=heavy)
+
+    async def _build(self, name: str) -> _Entry:
+        entry = self._entries[name]
+        async with entry.lock:
+            if entry.instance is None and time.monotonic() >= entry.retry_at:
+                t0 = time.perf_counter()
+                try:
+                    entry.instance = await run_blocking(entry.lane, entry.factory)
+                    entry.error, entry.failures, entry.retry_at = None, 0, 0.0
+                    print(f"✅ Service ready: {name}")
+                except Exception as e:
+                    entry.error = str(e)
+                    entry.failures += 1
+                    backoff = min(self.RETRY_BASE_S * 2 ** (entry.failures - 1), self.RETRY_MAX_S)
+                    entry.retry_at = time.monotonic() + backoff
+                    print(f"⚠️  Service '{name}' unavailable (retry in {backoff:.0f}s): {e}")
+                entry.build_ms = round((time.perf_counter() - t0) * 1000, 2)
+        return entry
+
+    async def get(self, name: str) -> Any:
+        """Shared instance for ``name``; 503 while it fails to build (retried with backoff)"""
+        if name not in self._entries:
+            raise KeyError(f"Unknown service: {name}")
+        entry = self._entries[name]
+        if entry.instance is None:
+            entry = await self._build(name)
+        if entry.instance is None:
+            raise HTTPException(status_code=503, detail=f"{name} service unavailable: {entry.error}")
+        return entry.instance
+
+    def provide(self, name: str) -> Callable:
+        """FastAPI dependency resolving to the shared instance of ``name``"""
+        async def _dependency():
+            return await self.get(name)
+        _dependency.__name__ = f"get_{name}_service"
+        return _dependency
+
+    async def start(self, warm: bool = True):
+        """Build services and optionally warm them up (called from the lifespan)"""
+        self.started_at = time.perf_counter()
+        for name, entry in self._entries.items():
+            if entry.heavy and not warm:
+                continue
+            await self._build(name)
+            if warm and entry.warm and entry.instance is not None:
+                try:
+                    await run_blocking(entry.lane, entry.warm, entry.instance)
+                except Exception as e:
+                    print(f"⚠️  Warm-up failed for '{name}': {e}")
+        self.ready_in_ms = round((time.perf_counter() - self.started_at) * 1000, 2)
+        self.ready = True
+        print(f"✅ Service registry ready in {self.ready_in_ms:.0f} ms")
+
+    def status(self) -> Dict[str, Any]:
+        """Readiness plus per-service build state (exposed via /health/ready)"""
+        return {
+            "ready": self.ready,
+            "ready_in_ms": self.ready_in_ms,
+            "services": {
+                name: {
+                    "built": entry.instance is not None,
+                    "error": entry.error,
+                    "failures": entry.failures,
+                    "retry_in_s": round(max(0.0, entry.retry_at - time.monotonic()), 1) if entry.error else None,
+                    "build_ms": entry.build_ms,
+                }
+                for name, entry in self._entries.items()
+            },
+        }
+
+    def clear(self):
+        """Drop all instances (called on app shutdown)"""
+        for entry in self._entries.values():
+            entry.instance = None
+            entry.error = None
+            entry.failures = 0
+            entry.retry_at = 0.0
+            entry.lock = asyncio.Lock()
+        self.ready = False
+
+
+# --- Factories ---
+# Imports stay inside the factories so the API can start (and report the
+# failure) even when an optional stack such as TensorFlow is missing.
+
+def _finance():
+    from Backend.Financial_tracking.service import FinanceTrackingService
+    return FinanceTrackingService()
+
+def _gov_schemes():
+    from Backend.Gov_Schemes.service import GovSchemesDisplayService
+    return GovSchemesDisplayService()
+
+def _warm_gov_schemes(service):
+    service.fetch_engine.sync_schemes()
+
+def _collaborative():
+    from Backend.Collaborative_Farming.service import CollaborativeFarmingService
+    return CollaborativeFarmingService(db_client=mongo.get_sync_database())
+
+def _pre_seeding():
+    from Backend.Farm_management.Planning_stage.service import PreSeedingService
+    return PreSeedingService(db_client=mongo.get_sync_database())
+
+def _market():
+    from Backend.Farm_management.Farming_stage.engines.market_engine import MarketEngine
+    return MarketEngine()
+
+def _vision():
+    from Backend.Farm_management.Farming_stage.engines.vision_engine import VisionEngine
+    return VisionEngine()
+
+def _warm_vision(engine):
+    engine.warmup()
+
+def _translator():
+    from Backend.Voice_agent.input_processing.translator import get_translator
+    return get_translator()
+
+def _speech_to_text():
+    from Backend.Voice_agent.input_processing.speech_to_text import get_speech_to_text
+    return get_speech_to_text()
+
+def _warm_speech_to_text(pool):
+    pool.warmup()
+
+def _voice_agent():
+    from Backend.Voice_agent.core.agent import get_voice_agent
+    return get_voice_agent(db_client=mongo.get_sync_database())
+
+def _post_harvest():
+    from Backend.Farm_management.Post_Harvest_stage.core.engine import PostHarvestDecisionEngine
+    return PostHarvestDecisionEngine()
+
+
+registry = ServiceRegistry()
+registry.register("finance", _finance)
+registry.register("gov_schemes", _gov_schemes, warm=_warm_gov_schemes)
+registry.register("collaborative", _collaborative)
+registry.register("pre_seeding", _pre_seeding)
+registry.register("market", _market)
+registry.register("post_harvest", _post_harvest)
+registry.register("vision", _vision, warm=_warm_vision, lane="vision", heavy=True)
+registry.register("translator", _translator, lane="voice", heavy=True)
+registry.register("speech_to_text", _speech_to_text, warm=_warm_speech_to_text, lane="stt", heavy=True)
+registry.register("voice_agent", _voice_agent, lane="voice", heavy=True)
+
+# Dependencies
+get_finance_service = registry.provide("finance")
+get_gov_schemes_service = registry.provide("gov_schemes")
+get_collaborative_service = registry.provide("collaborative")
+get_pre_seeding_service = registry.provide("pre_seeding")
+get_market_engine = registry.provide("market")
+get_post_harvest_engine = registry.provide("post_harvest")
+get_vision_engine = registry.provide("vision")
+get_speech_to_text_service = registry.provide("speech_to_text")
@@ -0,0 +1,216 @@
+"""
+Response Serialization Benchmark
+Compares the old response path (``to_dict()`` / ``jsonable_encoder`` +
+stdlib ``json.dumps``) with ``FastJSONResponse`` (orjson, native ObjectId /
+datetime / enum / dataclass handling) for representative voice, finance
+dashboard and schemes payloads, and reports wire size with gzip/brotli.
+
+Usage (from the repository root):
+    python Backend/benchmarks/response_serialization.py
+    python Backend/benchmarks/response_serialization.py --iterations 2000
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+
+from Backend.api.responses import ORJSON_AVAILABLE, dumps
+from Backend.api.compression import BROTLI_AVAILABLE, brotli
+from Backend.Voice_agent.cards.base_card import BaseCard
+from Backend.Voice_agent.core.intent import Intent
+from Backend.Financial_tracking.models import (
+    ExpenseBreakdown, FinanceModuleOutput, FinanceTotals, LossCause, OptimizationSuggestion,
+)
+from Backend.Gov_Schemes.constants import Language, SchemeCategory
+from Backend.Gov_Schemes.models import GovSchemesOutput, SchemeCardOutput
+
+
+def _stdlib_dumps(content: Any) -> bytes:
+    """What starlette's JSONResponse.render does"""
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+# ----------------------------------------------------------------------------
+# Sample payloads
+# ----------------------------------------------------------------------------
+
+def voice_response():
+    # Imported here: the agent module pulls in the whole voice stack
+    from Backend.Voice_agent.core.agent import AgentResponse
+
+    cards = [
+        BaseCard(
+            card_type="crop",
+            title=f"गेहूं (Wheat) #{i}",
+            summary="Score: 82.5/100 - High profit potential",
+            details={
+                "crop_name": "Wheat",
+                "crop_name_hindi": "गेहूं",
+                "score": 82.5,
+                "reasons": ["मिट्टी उपयुक्त है", "पानी उपलब्ध है", "बाजार भाव अच्छा है"],
+                "risks": ["पाला पड़ने का खतरा"],
+                "profit_level": "High",
+            },
+            metadata={"source_doc": ObjectId(), "season": "rabi"},
+        )
+        for i in range(4)
+    ]
+    response = AgentResponse(
+        session_id="sess-2f9c",
+        intent=Intent.CROP_PLANNING,
+        intent_confidence=0.91,
+        cards=cards,
+        explanation_hindi="आपके खेत की मिट्टी और मौसम के आधार पर गेहूं सबसे अच्छा विकल्प है। " * 4,
+        explanation_english="Based on your soil and the weather, wheat is the best option. " * 4,
+        reasoning="soil=loamy; rainfall=normal; mandi_trend=up; " * 6,
+        retrieved_sources=5,
+        timestamp=datetime.now(),
+        metadata={"farmer_id": "F001", "latency_ms": 812.4},
+    )
+    old = lambda: _stdlib_dumps(jsonable_encoder(response.to_dict(), custom_encoder={ObjectId: str}))
+    new = lambda: dumps(response)
+    return old, new
+
+
+def finance_dashboard():
+    now = datetime.now()
+    insights = FinanceModuleOutput(
+        header="Finance Report",
+        language="en",
+        speechText="Your season profit margin is 18 percent.",
+        totals=FinanceTotals(farmerId="F001", season="kharif", totalExpense=84250.0,
+                             totalIncome=102400.0, profitOrLoss=18150.0, profitMarginPct=17.7),
+        topExpenseCategories=[
+            ExpenseBreakdown(category=c, amount=12000.0 + i, percent=14.2, categoryNameEn=c.title(), categoryNameHi="खर्च")
+            for i, c in enumerate(["seeds", "fertilizer", "labour", "irrigation", "transport"])
+        ],
+        lossCauses=[LossCause(title="High fertilizer cost", description="Urea bought above MSP rate",
+                              impactAmount=3200.0, confidenceScore=0.7)],
+        suggestions=[
+            OptimizationSuggestion(suggestionTitle="Buy inputs via FPO", whyThisHelps="Bulk rates",
+                                   estimatedSavings=2500.0, priority=2, actionableSteps=["Join FPO", "Pool orders"])
+            for _ in range(3)
+        ],
+        detailedReasoning="Expenses were driven by fertilizer and labour. " * 5,
+        urgencyLevel="MEDIUM",
+    )
+    payload = {
+        "totals": insights.totals,
+        "crop_performance": [
+            {"id": c, "name": c.title(), "area": "5 Acres", "income": 34000.0, "expense": 26000.0,
+             "profit": 8000.0, "status": "Profitable", "trend": "up"}
+            for c in ("wheat", "mustard", "chana", "other")
+        ],
+        "recent_transactions": [
+            {"id": str(ObjectId()), "_id": ObjectId(), "title": "Urea 45kg", "date": now - timedelta(days=i),
+             "amount": 1450.0, "type": "expense", "category": "fertilizer"}
+            for i in range(50)
+        ],
+        "insights": insights,
+    }
+    old = lambda: _stdlib_dumps(jsonable_encoder(payload, custom_encoder={ObjectId: str}))
+    new = lambda: dumps(payload)
+    return old, new
+
+
+def schemes():
+    output = GovSchemesOutput(
+        header="सरकारी योजनाएं",
+        language=Language.HINDI,
+        speechText="आपके लिए 40 योजनाएं उपलब्ध हैं।",
+        schemeCards=[
+            SchemeCardOutput(
+                schemeId=f"SCH{i:03d}",
+                schemeName=f"PM Kisan Samman Nidhi {i}",
+                category=list(SchemeCategory)[i % len(SchemeCategory)],
+                categoryDisplay="Income Support",
+                description="Direct income support of Rs 6000 per year to landholding farmer families. " * 2,
+                benefits="Rs 2000 every four months directly to the bank account.",
+                eligibility="All landholding farmer families",
+                howToApply="Apply at the nearest CSC or on pmkisan.gov.in",
+                officialLink="https://pmkisan.gov.in",
+                contactNumber="155261",
+                scope="All India",
+                isNew=i % 7 == 0,
+                daysRemaining=30 + i,
+            )
+            for i in range(40)
+        ],
+        totalSchemes=40,
+        newSchemesCount=6,
+        filterApplied={"state": "Maharashtra", "district": "Pune", "category": None},
+        detailedReasoning="Filtered by state and district; sorted by newest first.",
+    )
+    old = lambda: _stdlib_dumps(jsonable_encoder(output))
+    new = lambda: dumps(output)
+    return old, new
+
+
+# ----------------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------------
+
+def cpu_us(fn: Callable[[], Any], iterations: int) -> float:
+    """CPU time per call in microseconds"""
+    fn()
+    start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - start) / iterations * 1e6
+
+
+def compressed_sizes(body: bytes, iterations: int) -> List[Tuple[str, int, float]]:
+    rows = [("gzip-6", len(gzip.compress(body, 6)), cpu_us(lambda: gzip.compress(body, 6), iterations))]
+    if BROTLI_AVAILABLE:
+        rows.append(("br-4", len(brotli.compress(body, quality=4)),
+                     cpu_us(lambda: brotli.compress(body, quality=4), iterations)))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare JSON serialization paths for API responses")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("📦 RESPONSE SERIALIZATION BENCHMARK")
+    print("=" * 70)
+    print(f"orjson: {'yes' if ORJSON_AVAILABLE else 'no (stdlib fallback)'}   "
+          f"brotli: {'yes' if BROTLI_AVAILABLE else 'no'}   iterations: {args.iterations}\n")
+
+    payloads: Dict[str, Callable] = {
+        "voice/process": voice_response,
+        "finance/dashboard": finance_dashboard,
+        "schemes": schemes,
+    }
+    for name, build in payloads.items():
+        try:
+            old, new = build()
+        except ImportError as e:
+            print(f"⚠️  {name}: skipped ({e})\n")
+            continue
+
+        old_body, new_body = old(), new()
+        old_us, new_us = cpu_us(old, args.iterations), cpu_us(new, args.iterations)
+        print(f"{name}")
+        print(f"   old  (jsonable_encoder + json): {len(old_body):7d} B  {old_us:9.1f} µs")
+        print(f"   new  (FastJSONResponse):        {len(new_body):7d} B  {new_us:9.1f} µs  "
+              f"({old_us / new_us:.1f}x faster)")
+        for label, size, us in compressed_sizes(new_body, args.iterations):
+            print(f"   {label:<31} {size:7d} B  {us:9.1f} µs  ({size / len(new_body):.0%} of raw)")
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
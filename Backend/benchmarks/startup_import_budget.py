@@ -0,0 +1,112 @@
+"""
+Startup Import Budget
+Imports the API in a fresh interpreter with ``-X importtime`` and fails if
+startup exceeds the time/memory budget or pulls in a heavy dependency that
+should only load on first use.
+
+Usage (from the repository root):
+    python Backend/benchmarks/startup_import_budget.py
+    python Backend/benchmarks/startup_import_budget.py --budget-ms 1500 --top 15
+    python Backend/benchmarks/startup_import_budget.py --module Backend.api.routers.farm_management
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Must stay lazy (see Backend/utils/lazy_import.py)
+HEAVY_MODULES = ["whisper", "torch", "tensorflow", "keras", "chromadb", "argostranslate", "onnxruntime", "faster_whisper", "ctranslate2"]
+
+_PROBE = """
+import importlib, resource, sys
+importlib.import_module({module!r})
+heavy = sorted({{m.split('.')[0] for m in sys.modules}} & set({heavy!r}))
+print('HEAVY=' + ','.join(heavy))
+print('MAXRSS_KB=' + str(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+"""
+
+
+def run_probe(module: str) -> Tuple[str, str, int]:
+    """Import ``module`` in a child interpreter; return (stdout, importtime stderr, returncode)"""
+    code = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    return proc.stdout, proc.stderr, proc.returncode
+
+
+def parse_importtime(stderr: str) -> List[Tuple[int, int, str, int]]:
+    """Parse ``-X importtime`` lines into (self_us, cumulative_us, module, depth); depth 0 = top level"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            name = name.rstrip()[1:]  # drop the separator space after "|"
+            depth = (len(name) - len(name.lstrip())) // 2
+            rows.append((int(self_us), int(cumulative_us), name.strip(), depth))
+        except ValueError:
+            continue
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fail when API startup imports exceed the budget")
+    parser.add_argument("--module", default="Backend.api.main", help="Module to import (default: Backend.api.main)")
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("STARTUP_BUDGET_MS", "2500")))
+    parser.add_argument("--rss-budget-mb", type=float, default=float(os.getenv("STARTUP_RSS_BUDGET_MB", "250")))
+    parser.add_argument("--top", type=int, default=10, help="Show the N slowest top-level imports")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"⏱️  STARTUP IMPORT BUDGET: {args.module}")
+    print("=" * 70)
+
+    stdout, stderr, returncode = run_probe(args.module)
+    if returncode != 0:
+        print(f"❌ Import failed:\n{stderr.splitlines()[-1] if stderr else stdout}")
+        return 1
+
+    rows = parse_importtime(stderr)
+    total_ms = sum(row[0] for row in rows) / 1000
+    info: Dict[str, str] = dict(line.split("=", 1) for line in stdout.splitlines() if "=" in line)
+    heavy = [m for m in info.get("HEAVY", "").split(",") if m]
+    rss_mb = int(info.get("MAXRSS_KB", "0")) / 1024
+
+    # Top-level entries carry the cumulative cost of their whole subtree
+    top_level = sorted((r for r in rows if r[3] == 0), key=lambda r: r[1], reverse=True)
+    print("\nSlowest top-level imports:")
+    for _, cumulative_us, name, _ in top_level[:args.top]:
+        print(f"   {cumulative_us / 1000:9.1f} ms  {name}")
+
+    print(f"\nTotal import time: {total_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"Peak RSS:          {rss_mb:.0f} MB (budget {args.rss_budget_mb:.0f} MB)")
+    print(f"Heavy modules:     {', '.join(heavy) or 'none'}")
+
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"import time {total_ms:.0f} ms > {args.budget_ms:.0f} ms")
+    if rss_mb > args.rss_budget_mb:
+        failures.append(f"RSS {rss_mb:.0f} MB > {args.rss_budget_mb:.0f} MB")
+    if heavy:
+        failures.append(f"heavy modules imported eagerly: {', '.join(heavy)}")
+
+    print()
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+    print("✅ Startup within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
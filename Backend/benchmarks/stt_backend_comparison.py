@@ -0,0 +1,171 @@
+"""
+STT Backend Comparison
+Accuracy (WER/CER against reference transcripts) and latency (p50/p95,
+real-time factor) of each speech-to-text backend on the same Hindi clips,
+to decide whether the int8 faster-whisper backend can replace the
+reference openai-whisper one.
+
+The manifest lists one clip per line, either JSONL
+    {"audio": "clips/001.wav", "text": "गेहूं में कौन सी खाद डालें"}
+or CSV with ``audio,text`` columns. Audio paths are relative to the
+manifest. Without ``--manifest`` a synthetic clip is used and only
+latency is reported.
+
+Usage (from the repository root):
+    python Backend/benchmarks/stt_backend_comparison.py --manifest hindi_eval/manifest.jsonl
+    python Backend/benchmarks/stt_backend_comparison.py --manifest m.csv \\
+        --configs openai-whisper:small,faster-whisper:small:int8,faster-whisper:small:float32
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import statistics
+import sys
+import time
+import unicodedata
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from Backend.utils.lazy_import import is_available
+from Backend.Voice_agent.input_processing.speech_to_text import SAMPLE_RATE, create_stt_backend, decode_audio
+from whisper_pool import percentile, synthetic_audio
+
+BACKEND_MODULES = {"openai-whisper": "whisper", "faster-whisper": "faster_whisper"}
+
+# Danda, double danda and ASCII punctuation carry no meaning for WER
+_PUNCTUATION = re.compile(r"[।॥.,!?;:\"'()\[\]{}\-–—…]")
+
+
+def normalize(text: str) -> str:
+    """NFC, lowercase (for Latin loanwords), no punctuation, single spaces"""
+    text = unicodedata.normalize("NFC", text).lower()
+    return " ".join(_PUNCTUATION.sub(" ", text).split())
+
+
+def edit_distance(ref: list, hyp: list) -> int:
+    previous = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        current = [i]
+        for j, h in enumerate(hyp, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (r != h)))
+        previous = current
+    return previous[-1]
+
+
+def load_manifest(path: str) -> List[Tuple[str, np.ndarray, Optional[str]]]:
+    base = os.path.dirname(os.path.abspath(path))
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            rows = list(csv.DictReader(f))
+        else:
+            rows = [json.loads(line) for line in f if line.strip()]
+
+    clips = []
+    for row in rows:
+        with open(os.path.join(base, row["audio"]), "rb") as audio_file:
+            clips.append((row["audio"], decode_audio(audio_file.read()), row.get("text")))
+    return clips
+
+
+def parse_config(spec: str) -> Tuple[str, str, str]:
+    """"backend:model[:compute_type]" -> (backend, model, compute_type)"""
+    parts = spec.split(":")
+    if len(parts) < 2:
+        raise ValueError(f"Expected backend:model[:compute_type], got '{spec}'")
+    return parts[0], parts[1], parts[2] if len(parts) > 2 else "int8"
+
+
+def evaluate(spec: str, clips, args) -> dict:
+    backend, model_name, compute_type = parse_config(spec)
+    started = time.perf_counter()
+    stt = create_stt_backend(backend, model_name, compute_type, args.cpu_threads)
+    load_s = time.perf_counter() - started
+    stt.transcribe(np.zeros(SAMPLE_RATE, dtype=np.float32), language="hi")  # warm up
+
+    latencies, audio_s = [], 0.0
+    word_errors = word_total = char_errors = char_total = 0
+    for _, audio, reference in clips:
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            hypothesis = stt.transcribe(audio, language="hi")
+            latencies.append(time.perf_counter() - t0)
+        audio_s += len(audio) / SAMPLE_RATE
+        if reference:
+            ref, hyp = normalize(reference), normalize(hypothesis)
+            word_errors += edit_distance(ref.split(), hyp.split())
+            word_total += len(ref.split())
+            char_errors += edit_distance(list(ref.replace(" ", "")), list(hyp.replace(" ", "")))
+            char_total += len(ref.replace(" ", ""))
+
+    return {
+        "config": spec,
+        "load_s": load_s,
+        "wer": word_errors / word_total if word_total else None,
+        "cer": char_errors / char_total if char_total else None,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "rtf": sum(latencies) / (audio_s * args.repeat),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare STT backends on Hindi audio")
+    parser.add_argument("--manifest", help="JSONL/CSV of audio paths and reference text")
+    parser.add_argument("--configs", default="openai-whisper:base,faster-whisper:base:int8",
+                        help="Comma-separated backend:model[:compute_type]")
+    parser.add_argument("--repeat", type=int, default=1, help="Transcriptions per clip")
+    parser.add_argument("--cpu-threads", type=int, default=int(os.getenv("STT_CPU_THREADS", "0")))
+    parser.add_argument("--seconds", type=float, default=8.0, help="Synthetic clip length without a manifest")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("🎙️  STT BACKEND COMPARISON (Hindi)")
+    print("=" * 70)
+
+    if args.manifest:
+        clips = load_manifest(args.manifest)
+        if not clips:
+            print(f"❌ No clips in {args.manifest}")
+            return 1
+    else:
+        print("⚠️  No --manifest: synthetic clip, latency only\n")
+        clips = [("synthetic", synthetic_audio(args.seconds), None)]
+    total_s = sum(len(audio) for _, audio, _ in clips) / SAMPLE_RATE
+    print(f"Clips: {len(clips)} ({total_s:.1f} s audio) | repeat: {args.repeat}\n")
+
+    print(f"{'config':<32} {'load s':>7} {'WER':>7} {'CER':>7} {'p50 ms':>8} {'p95 ms':>8} {'RTF':>6}")
+    results = []
+    for spec in [c.strip() for c in args.configs.split(",") if c.strip()]:
+        backend = spec.split(":")[0]
+        if backend in BACKEND_MODULES and not is_available(BACKEND_MODULES[backend]):
+            print(f"{spec:<32} ❌ {backend} is not installed (pip install {backend})")
+            continue
+        try:
+            r = evaluate(spec, clips, args)
+        except Exception as e:
+            print(f"{spec:<32} ❌ {e}")
+            continue
+        results.append(r)
+        wer = f"{r['wer']:.1%}" if r["wer"] is not None else "-"
+        cer = f"{r['cer']:.1%}" if r["cer"] is not None else "-"
+        print(f"{r['config']:<32} {r['load_s']:7.1f} {wer:>7} {cer:>7} "
+              f"{r['p50_ms']:8.0f} {r['p95_ms']:8.0f} {r['rtf']:6.2f}")
+
+    if len(results) >= 2:
+        baseline, best = results[0], min(results[1:], key=lambda r: r["p50_ms"])
+        print(f"\n✅ {best['config']} is {baseline['p50_ms'] / best['p50_ms']:.1f}x faster (p50) than {baseline['config']}")
+        if baseline["wer"] is not None and best["wer"] is not None:
+            print(f"   WER change: {(best['wer'] - baseline['wer']) * 100:+.1f} points")
+
+    print("\nRTF = processing seconds per second of audio (lower is better)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
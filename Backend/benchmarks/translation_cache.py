@@ -0,0 +1,112 @@
+"""
+Translation Cache Benchmark
+Replays a day-like stream of voice turns (a few common questions asked
+over and over, Zipf-distributed, plus a tail of one-off ones) through
+ArgosTranslator with and without the cache and reports hit rate and
+per-turn translation time.
+
+Each turn is one hindi_to_english for the question plus the Hindi
+explanation, translated sentence by sentence as ExplanationBuilder does.
+
+Usage (from the repository root; needs argostranslate with hi/en models):
+    python Backend/benchmarks/translation_cache.py
+    python Backend/benchmarks/translation_cache.py --turns 2000 --unique 0.2
+"""
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from Backend.utils.kv_cache import TwoTierCache
+from Backend.utils.lazy_import import is_available
+from Backend.Voice_agent.input_processing.translator import ArgosTranslator
+from whisper_pool import percentile
+
+QUESTIONS = [
+    "आज मौसम कैसा रहेगा",
+    "गेहूं का भाव क्या है",
+    "इस मौसम में कौन सी फसल लगाऊं",
+    "प्याज का मंडी भाव बताओ",
+    "क्या कल बारिश होगी",
+    "पीएम किसान योजना के बारे में बताओ",
+    "मेरी फसल में कीड़े लग गए हैं",
+    "सोयाबीन कब बेचना चाहिए",
+]
+EXPLANATIONS = [
+    "Current temperature is 31°C. Clear weather expected.",
+    "Current temperature is 28°C. Rain is expected.",
+    "I recommend growing Wheat (गेहूं). Reasons: good soil match, stable prices.",
+    "Onion price is ₹24/kg, बढ़ रहा है. Wheat price is ₹22/kg, स्थिर.",
+    "You are eligible for 2 schemes: पीएम किसान, फसल बीमा.",
+]
+
+
+def workload(turns: int, unique_share: float, seed: int = 3):
+    rng = np.random.default_rng(seed)
+    weights = 1 / np.arange(1, len(QUESTIONS) + 1)
+    weights /= weights.sum()
+    for i in range(turns):
+        if rng.random() < unique_share:
+            yield f"{QUESTIONS[i % len(QUESTIONS)]} {i}", f"Question {i} needs a custom answer. Please check again."
+        else:
+            q = rng.choice(len(QUESTIONS), p=weights)
+            yield QUESTIONS[q], EXPLANATIONS[q % len(EXPLANATIONS)]
+
+
+def run(translator: ArgosTranslator, turns, cached: bool):
+    timings = []
+    for question, explanation in turns:
+        if not cached:
+            translator.cache.clear()
+        t0 = time.perf_counter()
+        translator.hindi_to_english(question)
+        translator.translate_batch(re.split(r"(?<=[.!?])\s+", explanation), from_code="en", to_code="hi")
+        timings.append(time.perf_counter() - t0)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure the translation cache on repeated questions")
+    parser.add_argument("--turns", type=int, default=500)
+    parser.add_argument("--unique", type=float, default=0.1, help="Share of one-off questions")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("🌐 TRANSLATION CACHE BENCHMARK")
+    print("=" * 70)
+    if not is_available("argostranslate"):
+        print("❌ argostranslate is not installed (pip install argostranslate)")
+        return 1
+
+    turns = list(workload(args.turns, args.unique))
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = TwoTierCache("translation", path=os.path.join(tmp, "cache.sqlite3"), max_entries=4096)
+        translator = ArgosTranslator(cache=cache)
+        if not translator.initialized:
+            print("❌ Argos hi/en models are not installed")
+            return 1
+
+        uncached = run(translator, turns[:min(50, len(turns))], cached=False)
+        cache.clear()
+        cache.memory_hits = cache.disk_hits = cache.misses = 0
+        cached = run(translator, turns, cached=True)
+        stats = cache.stats()
+
+    print(f"Turns: {len(turns)} | one-off questions: {args.unique:.0%}\n")
+    print(f"   without cache: p50 {statistics.median(uncached) * 1000:7.1f} ms   p95 {percentile(uncached, 95) * 1000:7.1f} ms")
+    print(f"   with cache:    p50 {statistics.median(cached) * 1000:7.1f} ms   p95 {percentile(cached, 95) * 1000:7.1f} ms")
+    print(f"\n✅ hit rate {stats['hit_rate']:.1%} ({stats['memory_hits']} memory, {stats['disk_hits']} disk, "
+          f"{stats['misses']} misses)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Translator Warm Start
+Starts ArgosTranslator from the provisioned models directory in a fresh
+interpreter with networking disabled, and fails if it reaches for the
+network, falls back to untranslated output or loads slower than the
+budget. The first run includes cold disk reads; the budget applies to
+the warm runs after it.
+
+Usage (from the repository root, after provisioning):
+    python -m Backend.Voice_agent.provision_translation_models provision
+    python Backend/benchmarks/translator_warm_start.py
+    python Backend/benchmarks/translator_warm_start.py --runs 5 --budget-ms 3000
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, REPO_ROOT)
+
+from Backend.utils.kv_cache import resolve_path
+
+_PROBE = """
+import socket, time
+
+def _offline(*args, **kwargs):
+    raise OSError("network disabled for warm-start check")
+
+socket.socket.connect = _offline
+socket.create_connection = _offline
+socket.getaddrinfo = _offline
+
+from Backend.utils.kv_cache import TwoTierCache
+from Backend.Voice_agent.input_processing.translator import ArgosTranslator
+
+started = time.perf_counter()
+translator = ArgosTranslator(cache=TwoTierCache("translation"), models_dir={models_dir!r}, auto_download=False)
+print("INIT_MS=" + str((time.perf_counter() - started) * 1000))
+print("INITIALIZED=" + str(translator.initialized))
+print("SAMPLE=" + translator.english_to_hindi("Rain is expected."))
+"""
+
+
+def run_probe(models_dir: str) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(models_dir=models_dir)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    info = dict(line.split("=", 1) for line in proc.stdout.splitlines() if "=" in line and line[:1].isupper())
+    info["returncode"] = proc.returncode
+    info["stderr"] = proc.stderr.strip().splitlines()[-1:] if proc.stderr else []
+    return info
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Assert offline translator warm start time")
+    parser.add_argument("--dir", default=os.getenv("ARGOS_MODELS_DIR", "models/argos"))
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("TRANSLATOR_WARM_BUDGET_MS", "3000")))
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("🌐 TRANSLATOR WARM START (offline)")
+    print("=" * 70)
+
+    models_dir = resolve_path(args.dir)
+    if not os.path.exists(os.path.join(models_dir, "manifest.json")):
+        print(f"❌ {models_dir} is not provisioned "
+              f"(python -m Backend.Voice_agent.provision_translation_models provision)")
+        return 1
+
+    timings = []
+    for run in range(1, args.runs + 1):
+        info = run_probe(models_dir)
+        if info["returncode"] != 0 or info.get("INITIALIZED") != "True":
+            print(f"❌ run {run}: translator did not load offline {info['stderr']}")
+            return 1
+        timings.append(float(info["INIT_MS"]))
+        print(f"   run {run}: {timings[-1]:8.0f} ms  {'(cold)' if run == 1 else ''}  sample: {info.get('SAMPLE', '')}")
+
+    warm = timings[1:] or timings
+    warm_ms = statistics.median(warm)
+    print(f"\nWarm start: {warm_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    if warm_ms > args.budget_ms:
+        print(f"❌ warm start {warm_ms:.0f} ms > {args.budget_ms:.0f} ms")
+        return 1
+    print("✅ Translator loads offline within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""
+VAD Compute Savings
+Runs the VAD over a corpus of recordings and reports how much audio and
+how many 30 s Whisper windows it removes, and how many clips are skipped
+as silent. With ``--decode`` (needs openai-whisper) it also times the
+actual transcription with the VAD off and on.
+
+Without ``--corpus`` a synthetic corpus of field-style recordings is used:
+5-60 s clips with leading/trailing silence, pauses and background noise,
+about one in ten with no speech at all.
+
+Usage (from the repository root):
+    python Backend/benchmarks/vad_savings.py
+    python Backend/benchmarks/vad_savings.py --corpus recordings/ --decode --model base
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from Backend.utils.lazy_import import is_available
+from Backend.Voice_agent.input_processing.speech_to_text import SAMPLE_RATE, WhisperPool, decode_audio
+from Backend.Voice_agent.input_processing.vad import EnergyVAD
+
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".m4a", ".ogg", ".opus", ".flac", ".webm")
+
+
+def _speechlike(seconds: float, rng) -> np.ndarray:
+    """Voiced bursts (syllables) with pitch drift"""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    pitch = 140 + 40 * np.sin(2 * np.pi * 0.5 * t + rng.uniform(0, 6))
+    envelope = np.clip(np.sin(2 * np.pi * rng.uniform(3, 5) * t), 0, None)
+    return 0.2 * envelope * np.sin(2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE)
+
+
+def synthetic_corpus(count: int, seed: int = 7) -> List[Tuple[str, np.ndarray]]:
+    rng = np.random.default_rng(seed)
+    corpus = []
+    for i in range(count):
+        noise_level = rng.uniform(0.003, 0.02)
+        parts = [np.zeros(int(rng.uniform(0.5, 6) * SAMPLE_RATE))]
+        if i % 10 != 9:
+            for _ in range(rng.integers(1, 5)):
+                parts.append(_speechlike(rng.uniform(2, 12), rng))
+                parts.append(np.zeros(int(rng.uniform(0.3, 4) * SAMPLE_RATE)))
+        parts.append(np.zeros(int(rng.uniform(0.5, 6) * SAMPLE_RATE)))
+        clip = np.concatenate(parts)
+        clip = clip + noise_level * rng.standard_normal(clip.size)
+        corpus.append((f"synthetic_{i:03d}", clip.astype(np.float32)))
+    return corpus
+
+
+def load_corpus(path: str) -> List[Tuple[str, np.ndarray]]:
+    corpus = []
+    for name in sorted(os.listdir(path)):
+        if name.lower().endswith(AUDIO_EXTENSIONS):
+            with open(os.path.join(path, name), "rb") as f:
+                corpus.append((name, decode_audio(f.read())))
+    return corpus
+
+
+def windows(samples: int) -> int:
+    return math.ceil(samples / (30 * SAMPLE_RATE)) if samples else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure compute saved by VAD before Whisper")
+    parser.add_argument("--corpus", help="Directory of recordings (default: synthetic corpus)")
+    parser.add_argument("--count", type=int, default=40, help="Synthetic corpus size")
+    parser.add_argument("--decode", action="store_true", help="Also time Whisper with VAD off/on")
+    parser.add_argument("--model", default=os.getenv("WHISPER_MODEL", "base"))
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("🔇 VAD COMPUTE SAVINGS")
+    print("=" * 70)
+
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.count)
+    if not corpus:
+        print(f"❌ No audio files in {args.corpus}")
+        return 1
+
+    vad = EnergyVAD(backend="auto")
+    audio_s = speech_s = 0.0
+    windows_before = windows_after = skipped = 0
+    vad_cpu = 0.0
+    for _, clip in corpus:
+        t0 = time.process_time()
+        result = vad.detect(clip)
+        chunks = vad.chunks(clip, result) if not result.is_empty else []
+        vad_cpu += time.process_time() - t0
+
+        audio_s += len(clip) / SAMPLE_RATE
+        speech_s += result.speech_samples / SAMPLE_RATE
+        windows_before += windows(len(clip))
+        windows_after += len(chunks)
+        skipped += result.is_empty
+
+    print(f"Corpus: {len(corpus)} clips, {audio_s / 60:.1f} min audio | VAD backend: {vad.backend}\n")
+    print(f"   audio decoded:    {audio_s:8.1f} s -> {speech_s:8.1f} s  ({1 - speech_s / audio_s:.0%} less)")
+    print(f"   Whisper windows:  {windows_before:8d}   -> {windows_after:8d}    "
+          f"({1 - windows_after / max(windows_before, 1):.0%} fewer)")
+    print(f"   silent clips skipped: {skipped}")
+    print(f"   VAD cost: {vad_cpu * 1000 / (audio_s / 60):.1f} ms CPU per audio-minute")
+
+    if args.decode:
+        if not is_available("whisper"):
+            print("\n❌ --decode needs openai-whisper installed")
+            return 1
+        print(f"\nDecoding with Whisper '{args.model}'...")
+        timings = {}
+        for vad_on in (False, True):
+            pool = WhisperPool(model_name=args.model, size=1, max_queue=1, vad=vad_on)
+            t0 = time.perf_counter()
+            for _, clip in corpus:
+                pool.transcribe(clip, language="hi")
+            timings[vad_on] = time.perf_counter() - t0
+        print(f"   without VAD: {timings[False]:8.1f} s")
+        print(f"   with VAD:    {timings[True]:8.1f} s  ({1 - timings[True] / timings[False]:.0%} saved)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
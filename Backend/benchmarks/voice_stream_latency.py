@@ -0,0 +1,93 @@
+"""
+Streaming vs Batch Transcription Latency
+Perceived latency is the time from the end of speech to the final
+transcript. Batch decodes the whole clip after upload; streaming has
+already committed most windows while the farmer was speaking and only
+decodes the tail.
+
+Audio is fed at real-time pace in 200 ms frames, so partial decodes
+compete with the clock as they would on a live socket.
+
+Usage (from the repository root; needs openai-whisper installed):
+    python Backend/benchmarks/voice_stream_latency.py --audio question.wav
+    python Backend/benchmarks/voice_stream_latency.py --model tiny --seconds 30
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from Backend.utils.lazy_import import is_available
+from Backend.Voice_agent.input_processing.speech_to_text import SAMPLE_RATE, WhisperPool, decode_audio
+from Backend.Voice_agent.input_processing.streaming import StreamingTranscriber
+from whisper_pool import synthetic_audio
+
+FRAME = int(0.2 * SAMPLE_RATE)
+
+
+def streaming_latency(pool, audio, args) -> float:
+    transcriber = StreamingTranscriber(pool, window_s=args.window_s, overlap_s=args.overlap_s)
+    worker = None
+    start = time.perf_counter()
+    for i in range(0, len(audio), FRAME):
+        # Hold to real time: frame i arrives at i / SAMPLE_RATE seconds
+        delay = start + i / SAMPLE_RATE - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        transcriber.feed(audio[i:i + FRAME])
+        if (worker is None or not worker.is_alive()) and transcriber.should_decode():
+            worker = threading.Thread(target=transcriber.decode_partial)
+            worker.start()
+
+    speech_end = time.perf_counter()
+    if worker is not None:
+        worker.join()
+    transcriber.finish()
+    return time.perf_counter() - speech_end
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare end-of-speech latency: batch vs streaming")
+    parser.add_argument("--model", default=os.getenv("WHISPER_MODEL", "base"))
+    parser.add_argument("--audio", help="Audio file (default: synthetic clip)")
+    parser.add_argument("--seconds", type=float, default=25.0, help="Length of the synthetic clip")
+    parser.add_argument("--window-s", type=float, default=10.0)
+    parser.add_argument("--overlap-s", type=float, default=1.0)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("⏱️  STREAMING vs BATCH TRANSCRIPTION LATENCY")
+    print("=" * 70)
+    if not is_available("whisper"):
+        print("❌ openai-whisper is not installed (pip install openai-whisper)")
+        return 1
+
+    if args.audio:
+        with open(args.audio, "rb") as f:
+            audio = decode_audio(f.read())
+    else:
+        audio = synthetic_audio(args.seconds)
+
+    # Two models so the partial decodes never wait on the final one
+    pool = WhisperPool(model_name=args.model, size=2, max_queue=4)
+    pool.warmup()
+
+    t0 = time.perf_counter()
+    pool.transcribe(audio, language="hi")
+    batch_s = time.perf_counter() - t0
+    stream_s = streaming_latency(pool, audio, args)
+
+    print(f"Model: {args.model} | audio: {len(audio) / SAMPLE_RATE:.1f} s | "
+          f"window {args.window_s:.0f} s, overlap {args.overlap_s:.1f} s\n")
+    print(f"   batch (upload, then decode):  {batch_s * 1000:8.0f} ms after end of speech")
+    print(f"   streaming (decode the tail):  {stream_s * 1000:8.0f} ms after end of speech")
+    print(f"\n{'✅' if stream_s <= batch_s / 2 else '⚠️ '} streaming is {batch_s / stream_s:.1f}x faster to final text")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Whisper Pool Benchmark
+Load time, per-request latency (p50/p95) and throughput of WhisperPool for
+each model size, with concurrent callers sharing the pool the same way
+/voice/process-audio does.
+
+Usage (from the repository root; needs openai-whisper installed):
+    python Backend/benchmarks/whisper_pool.py
+    python Backend/benchmarks/whisper_pool.py --models tiny,base --pool-size 2 --concurrency 4
+    python Backend/benchmarks/whisper_pool.py --audio sample.wav --requests 20
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from Backend.utils.lazy_import import is_available
+from Backend.Voice_agent.input_processing.speech_to_text import SAMPLE_RATE, WhisperPool, decode_audio
+
+
+def synthetic_audio(seconds: float) -> np.ndarray:
+    """Speech-band tones plus noise (exercises the decoder without a sample file)"""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    tone = 0.2 * np.sin(2 * np.pi * 220 * t) * (0.5 + 0.5 * np.sin(2 * np.pi * 3 * t))
+    noise = 0.02 * np.random.default_rng(0).standard_normal(t.shape)
+    return (tone + noise).astype(np.float32)
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def bench_model(model_name: str, audio: np.ndarray, args) -> dict:
+    started = time.perf_counter()
+    pool = WhisperPool(model_name=model_name, size=args.pool_size, max_queue=args.requests)
+    load_s = time.perf_counter() - started
+    pool.warmup()
+
+    def one(_):
+        t0 = time.perf_counter()
+        pool.transcribe(audio, language="hi")
+        return time.perf_counter() - t0
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as workers:
+        latencies = list(workers.map(one, range(args.requests)))
+    wall_s = time.perf_counter() - wall_start
+
+    audio_s = len(audio) / SAMPLE_RATE
+    return {
+        "model": model_name,
+        "load_s": load_s,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "throughput": args.requests / wall_s,
+        "rtf": (wall_s / args.requests) / audio_s,
+        "avg_wait_ms": pool.stats()["avg_wait_ms"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the shared Whisper model pool")
+    parser.add_argument("--models", default="tiny,base,small", help="Comma-separated Whisper model sizes")
+    parser.add_argument("--pool-size", type=int, default=int(os.getenv("WHISPER_POOL_SIZE", "1")))
+    parser.add_argument("--concurrency", type=int, default=2, help="Concurrent callers")
+    parser.add_argument("--requests", type=int, default=8)
+    parser.add_argument("--audio", help="Audio file to transcribe (default: 5 s synthetic clip)")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Length of the synthetic clip")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("🎙️  WHISPER POOL BENCHMARK")
+    print("=" * 70)
+    if not is_available("whisper"):
+        print("❌ openai-whisper is not installed (pip install openai-whisper)")
+        return 1
+
+    if args.audio:
+        with open(args.audio, "rb") as f:
+            audio = decode_audio(f.read())
+    else:
+        audio = synthetic_audio(args.seconds)
+    print(f"Audio: {len(audio) / SAMPLE_RATE:.1f} s | pool size: {args.pool_size} | "
+          f"concurrency: {args.concurrency} | requests: {args.requests}\n")
+
+    print(f"{'model':<8} {'load s':>8} {'p50 ms':>9} {'p95 ms':>9} {'req/s':>7} {'RTF':>6} {'wait ms':>8}")
+    for model_name in [m.strip() for m in args.models.split(",") if m.strip()]:
+        try:
+            r = bench_model(model_name, audio, args)
+        except Exception as e:
+            print(f"{model_name:<8} ❌ {e}")
+            continue
+        print(f"{r['model']:<8} {r['load_s']:8.1f} {r['p50_ms']:9.0f} {r['p95_ms']:9.0f} "
+              f"{r['throughput']:7.2f} {r['rtf']:6.2f} {r['avg_wait_ms']:8.0f}")
+
+    print("\nRTF = processing seconds per second of audio (lower is better)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
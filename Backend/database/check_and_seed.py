@@ -14,8 +14,8 @@ from Backend.Farm_management.Planning_stage.repositories.crop_repo import CropRe
 
 # Load Env
 load_dotenv()
-MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017")
-DB_NAME = os.getenv("DB_NAME", "KisaanMitra")
+# Same URI / database the API connects to
+from Backend.database.connection import MONGO_DETAILS as MONGO_URI, DB_NAME
 
 def check_and_seed():
     print(f"🔄 Connecting to MongoDB at {MONGO_URI}...")
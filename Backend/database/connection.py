@@ -9,36 +9,98 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-MONGO_DETAILS = os.getenv("MONGO_URI", "mongodb://localhost:27017")
-DB_NAME = os.getenv("DB_NAME", "KisaanMitra")
+MONGO_DETAILS = os.getenv("MONGODB_URI") or os.getenv("MONGO_URI", "mongodb://localhost:27017")
+DB_NAME = os.getenv("DATABASE_NAME") or os.getenv("DB_NAME", "kisanmitra")
+
+# Pool sizing and timeouts (env defaults; the API lifespan passes its settings explicitly)
+POOL_OPTIONS = {
+    "maxPoolSize": int(os.getenv("MONGODB_MAX_POOL_SIZE", "50")),
+    "minPoolSize": int(os.getenv("MONGODB_MIN_POOL_SIZE", "0")),
+    "maxIdleTimeMS": int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "60000")),
+    "waitQueueTimeoutMS": int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "2000")),
+    "serverSelectionTimeoutMS": int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "2000")),
+    "connectTimeoutMS": int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", "5000")),
+    "socketTimeoutMS": int(os.getenv("MONGODB_SOCKET_TIMEOUT_MS", "10000")),
+}
+
 
 class Database:
+    """
+    Process-wide MongoDB client.
+
+    A single motor client owns the connection pool. Its ``delegate`` is the
+    underlying pymongo client, so sync repositories and routers share the
+    same pool instead of opening their own.
+    """
     client: AsyncIOMotorClient = None
-    
-    async def connect_db(self):
-        """Create database connection."""
+    db_name: str = DB_NAME
+    available: bool = False
+
+    def _create_client(self, uri: str, db_name: str, **pool_options):
+        options = {**POOL_OPTIONS, **pool_options}
+        self.client = AsyncIOMotorClient(uri, appname="KisaanMitra", **options)
+        self.db_name = db_name
+        logger.info(
+            f"MongoDB pool configured (db={db_name}, maxPoolSize={options['maxPoolSize']}, "
+            f"minPoolSize={options['minPoolSize']})"
+        )
+
+    async def connect_db(self, uri: str = MONGO_DETAILS, db_name: str = DB_NAME, **pool_options):
+        """
+        Create the shared client and verify it once with a ping.
+
+        An unreachable server is logged rather than raised so the API can
+        still start and the repositories fall back to their in-memory data.
+        """
+        if self.client is None:
+            self._create_client(uri, db_name, **pool_options)
         try:
-            self.client = AsyncIOMotorClient(MONGO_DETAILS)
-            # Verify connection
             await self.client.admin.command('ping')
+            self.available = True
             logger.info("Connected to MongoDB.")
         except Exception as e:
-            logger.error(f"Failed to connect to MongoDB: {e}")
-            raise e
+            self.available = False
+            logger.error(f"Failed to connect to MongoDB: {e}. Using in-memory mode.")
+
+    def connect_sync(self, uri: str = MONGO_DETAILS, db_name: str = DB_NAME, **pool_options) -> bool:
+        """Connect from sync code (CLI demos, scripts) that runs without the API lifespan."""
+        if self.client is None:
+            self._create_client(uri, db_name, **pool_options)
+            try:
+                self.client.delegate.admin.command('ping')
+                self.available = True
+                logger.info("Connected to MongoDB.")
+            except Exception as e:
+                self.available = False
+                logger.error(f"Failed to connect to MongoDB: {e}. Using in-memory mode.")
+        return self.available
 
     def close_db(self):
         """Close database connection."""
         if self.client:
             self.client.close()
+            self.client = None
+            self.available = False
             logger.info("Closed MongoDB connection.")
 
     def get_database(self):
-        """Get database instance."""
+        """Get the async (motor) database handle."""
         if self.client is None:
              # In case it's called before explicit connect (though not recommended for async)
              logger.warning("Database client is not initialized. Attempting lazy connection...")
-             self.client = AsyncIOMotorClient(MONGO_DETAILS)
-        return self.client[DB_NAME]
+             self._create_client(MONGO_DETAILS, DB_NAME)
+        return self.client[self.db_name]
+
+    def get_sync_database(self):
+        """
+        Get the sync (pymongo) database handle backed by the shared pool.
+
+        Returns None when MongoDB is unreachable so callers use in-memory mode.
+        """
+        if self.client is None or not self.available:
+            return None
+        return self.client.delegate[self.db_name]
+
 
 db = Database()
 
@@ -1,11 +1,15 @@
 import os
+import sys
 import pymongo
 from dotenv import load_dotenv
 
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
 load_dotenv()
 
-MONGO_DETAILS = os.getenv("MONGO_URI", "mongodb://localhost:27017")
-DB_NAME = os.getenv("DB_NAME", "KisaanMitra")
+# Same URI / database the API connects to (indexes must land where it reads)
+from Backend.database.connection import MONGO_DETAILS, DB_NAME
 
 def init_db():
     print(f"Connecting to MongoDB at {MONGO_DETAILS}...")
@@ -68,6 +72,21 @@ def init_db():
     except Exception as e:
         print(f"⚠️ Error creating index for farmer_crops: {e}")
 
+    # List endpoints (keyset pagination on farmer + sort key + _id)
+    paged_indexes = [
+        ("alerts", [("farmer_id", 1), ("created_at", -1), ("_id", -1)]),
+        ("calendar_events", [("farmer_id", 1), ("date", 1), ("_id", 1)]),
+        ("active_crops", [("farmer_id", 1), ("_id", 1)]),
+        ("inventory", [("farmer_id", 1), ("_id", 1)]),
+        ("inventory", [("farmer_id", 1), ("category", 1), ("_id", 1)]),
+    ]
+    for name, keys in paged_indexes:
+        try:
+            db[name].create_index(keys)
+            print(f"✅ Index created: {name} (pagination)")
+        except Exception as e:
+            print(f"⚠️ Error creating index for {name}: {e}")
+
     # ==============================
     # 2. Time-Series Collections
     # ==============================
@@ -0,0 +1,192 @@
+"""
+Two-Tier Key/Value Cache
+In-process LRU in front of an on-disk SQLite table, for results that are
+expensive to compute and worth keeping across restarts (translations,
+classifications). Several caches can share one file; each uses its own
+namespace.
+
+The disk tier is optional: if the file can't be opened the cache keeps
+working from memory only.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Relative cache paths are resolved against Backend/
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def resolve_path(path: Optional[str]) -> Optional[str]:
+    if not path:
+        return None
+    return path if os.path.isabs(path) else os.path.join(BACKEND_DIR, path)
+
+
+class TwoTierCache:
+    """
+    Thread-safe string -> string cache
+
+    ``get`` checks memory, then disk (promoting disk hits into memory);
+    ``set`` writes both. Counters split hits by tier for ``stats()``.
+    With a TTL, entries older than ``ttl_s`` read as misses in both tiers.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        path: Optional[str] = None,
+        max_entries: int = 4096,
+        ttl_s: Optional[float] = None
+    ):
+        """
+        Args:
+            namespace: Key space inside the shared file (e.g. "translation")
+            path: SQLite file; relative to Backend/, None for memory only
+            max_entries: In-process LRU capacity (the disk tier is unbounded)
+            ttl_s: Entry lifetime in seconds (None = never expire)
+        """
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()  # key -> (value, created_at)
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.path = resolve_path(path)
+        self._db: Optional[sqlite3.Connection] = None
+        if self.path:
+            self._open_disk()
+
+    def _open_disk(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS kv_cache ("
+                " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+                " created_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+            self._db = db
+        except sqlite3.Error as e:
+            print(f"⚠️  {self.namespace} cache: disk tier unavailable ({e}), using memory only")
+            self._db = None
+
+    def _remember(self, key: str, value: str, created_at: float):
+        # Caller holds the lock
+        self._entries[key] = (value, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[str]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Values for the keys that are cached (one disk query for the rest)"""
+        found: Dict[str, str] = {}
+        oldest = time.time() - self.ttl_s if self.ttl_s else 0.0
+        with self._lock:
+            missing = []
+            for key in dict.fromkeys(keys):
+                entry = self._entries.get(key)
+                if entry is None or entry[1] < oldest:
+                    self._entries.pop(key, None)
+                    missing.append(key)
+                else:
+                    self._entries.move_to_end(key)
+                    found[key] = entry[0]
+            self.memory_hits += len(found)
+
+            if missing and self._db is not None:
+                for start in range(0, len(missing), 500):  # SQLite variable limit
+                    batch = missing[start:start + 500]
+                    try:
+                        rows = self._db.execute(
+                            f"SELECT key, value, created_at FROM kv_cache WHERE namespace = ? "
+                            f"AND created_at >= ? AND key IN ({','.join('?' * len(batch))})",
+                            (self.namespace, oldest, *batch),
+                        ).fetchall()
+                    except sqlite3.Error as e:
+                        print(f"⚠️  {self.namespace} cache read failed: {e}")
+                        break
+                    for key, value, created_at in rows:
+                        self._remember(key, value, created_at)
+                        found[key] = value
+                        self.disk_hits += 1
+            self.misses += sum(1 for key in missing if key not in found)
+        return found
+
+    def set(self, key: str, value: str):
+        self.set_many([(key, value)])
+
+    def set_many(self, items: List[Tuple[str, str]]):
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            for key, value in items:
+                self._remember(key, value, now)
+            if self._db is not None:
+                try:
+                    with self._db:
+                        self._db.execute("BEGIN")
+                        self._db.executemany(
+                            "INSERT OR REPLACE INTO kv_cache (namespace, key, value, created_at) VALUES (?, ?, ?, ?)",
+                            [(self.namespace, key, value, now) for key, value in items],
+                        )
+                except sqlite3.Error as e:
+                    print(f"⚠️  {self.namespace} cache write failed: {e}")
+
+    def clear(self):
+        """Drop every entry in this namespace (memory and disk)"""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM kv_cache WHERE namespace = ?", (self.namespace,))
+
+    def purge_expired(self) -> int:
+        """Delete expired rows from disk; returns how many were removed"""
+        if not self.ttl_s or self._db is None:
+            return 0
+        with self._lock:
+            return self._db.execute(
+                "DELETE FROM kv_cache WHERE namespace = ? AND created_at < ?",
+                (self.namespace, time.time() - self.ttl_s),
+            ).rowcount
+
+    def disk_entries(self) -> Optional[int]:
+        if self._db is None:
+            return None
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM kv_cache WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit counters per tier and sizes"""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "memory_entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_s": self.ttl_s,
+            "disk_entries": self.disk_entries(),
+            "path": self.path,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,93 @@
+"""
+Lazy Imports
+Defers heavy optional dependencies (Whisper, TensorFlow, ChromaDB, Argos)
+until first attribute access, so importing the API does not pay for them.
+"""
+
+import importlib
+import importlib.util
+import threading
+import time
+import types
+from typing import Dict, Optional
+
+_lock = threading.RLock()
+
+# Module name -> seconds spent importing it through a LazyModule
+load_times: Dict[str, float] = {}
+
+
+class LazyModule(types.ModuleType):
+    """
+    Placeholder that imports the real module on first attribute access.
+
+    A missing dependency surfaces as ImportError at the point of use, not
+    at import time of the module that declared it.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_module"]
+        if module is None:
+            with _lock:
+                module = self.__dict__["_module"]
+                if module is None:
+                    t0 = time.perf_counter()
+                    module = importlib.import_module(self.__name__)
+                    load_times[self.__name__] = time.perf_counter() - t0
+                    self.__dict__["_module"] = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__["_module"] is not None
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+_registry: Dict[str, LazyModule] = {}
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Return a shared lazy handle for ``name`` (e.g. "whisper", "chromadb.utils")"""
+    with _lock:
+        module = _registry.get(name)
+        if module is None:
+            module = _registry[name] = LazyModule(name)
+        return module
+
+
+def is_available(name: str) -> bool:
+    """True if ``name`` can be imported, checked without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def preload(*names: str) -> Dict[str, Optional[str]]:
+    """
+    Import the given lazy modules now (opt-in warm-up).
+
+    Returns:
+        Module name -> None on success, or the error message
+    """
+    results: Dict[str, Optional[str]] = {}
+    for name in names:
+        try:
+            lazy_import(name)._load()
+            results[name] = None
+        except Exception as e:
+            results[name] = str(e)
+    return results
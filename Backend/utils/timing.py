@@ -0,0 +1,176 @@
+"""
+Stage Timing
+Lightweight span API for timing the stages of a request. Spans feed
+process-wide histograms (rendered for Prometheus at /metrics) and the
+per-request list that becomes the ``Server-Timing`` response header.
+
+Disabled by default; when disabled ``span()`` returns a shared no-op
+context manager, so instrumented code costs well under a microsecond.
+"""
+
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+# Histogram buckets in seconds (Prometheus convention)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+_enabled = False
+
+# Spans recorded during the current request (None outside a request)
+_request_spans: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar("request_spans", default=None)
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += seconds
+            self.count += 1
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        """Cumulative bucket counts, sum and count"""
+        with self._lock:
+            counts, total, count = list(self.counts), self.total, self.count
+        cumulative, running = [], 0
+        for c in counts:
+            running += c
+            cumulative.append(running)
+        return cumulative, total, count
+
+
+class MetricsRegistry:
+    """Histograms keyed by (metric name, sorted label pairs)"""
+
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        key = (name, tuple(sorted(labels.items())))
+        hist = self._histograms.get(key)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(key, Histogram())
+        return hist
+
+    def observe(self, name: str, seconds: float, **labels: str):
+        self.histogram(name, **labels).observe(seconds)
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        by_name: Dict[str, list] = {}
+        for (name, labels), hist in sorted(self._histograms.items()):
+            by_name.setdefault(name, []).append((labels, hist))
+
+        lines = []
+        for name, series in by_name.items():
+            lines.append(f"# TYPE {name} histogram")
+            for labels, hist in series:
+                cumulative, total, count = hist.snapshot()
+                base = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+                sep = "," if base else ""
+                for bound, c in zip(hist.buckets + (float("inf"),), cumulative):
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{name}_bucket{{{base}{sep}le="{le}"}} {c}')
+                label_str = f"{{{base}}}" if base else ""
+                lines.append(f"{name}_sum{label_str} {total:.6f}")
+                lines.append(f"{name}_count{label_str} {count}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = MetricsRegistry()
+
+
+class _Span:
+    __slots__ = ("name", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self._start
+        metrics.observe("kisaan_stage_duration_seconds", elapsed, stage=self.name)
+        spans = _request_spans.get()
+        if spans is not None:
+            spans.append((self.name, elapsed))
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str):
+    """
+    Time a stage::
+
+        with span("voice.translate"):
+            english_text = self.translator.hindi_to_english(hindi_text)
+    """
+    if not _enabled:
+        return _NOOP_SPAN
+    return _Span(name)
+
+
+def set_enabled(enabled: bool):
+    """Turn span recording on or off for the whole process"""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def start_request() -> List[Tuple[str, float]]:
+    """Begin collecting spans for the current request (context-local)"""
+    spans: List[Tuple[str, float]] = []
+    _request_spans.set(spans)
+    return spans
+
+
+def server_timing_header(spans: List[Tuple[str, float]], total_s: Optional[float] = None) -> str:
+    """Format spans as a Server-Timing header value (repeated stages are summed)"""
+    totals: Dict[str, float] = {}
+    for name, seconds in spans:
+        totals[name] = totals.get(name, 0.0) + seconds
+    parts = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in totals.items()]
+    if total_s is not None:
+        parts.append(f"total;dur={total_s * 1000:.1f}")
+    return ", ".join(parts)
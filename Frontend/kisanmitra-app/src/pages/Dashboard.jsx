@@ -31,15 +31,15 @@ const Dashboard = () => {
     useEffect(() => {
         const fetchData = async () => {
             try {
-                // Fetch Dashboard Stats
-                const statsRes = await fetch('/api/v1/dashboard/stats');
-                const statsData = await statsRes.json();
-                setStats(statsData);
-
-                // Fetch Finance Summary
-                const financeRes = await fetch('/api/v1/dashboard/finance');
-                const financeData = await financeRes.json();
-                setFinance(financeData);
+                // Stats, finance summary and weather in one round-trip
+                const bundleRes = await fetch('/api/v1/dashboard/bundle');
+                const bundle = await bundleRes.json();
+                setStats({
+                    active_crops: bundle.active_crops,
+                    unread_alerts: bundle.unread_alerts,
+                    weather: bundle.weather
+                });
+                setFinance(bundle.finance);
 
                 setLoading(false);
             } catch (error) {